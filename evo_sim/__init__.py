@@ -1,7 +1 @@
-import random
-import numpy as np
-
-random.seed(42)
-np.random.seed(42)
-
 __version__ = '0.1.0'
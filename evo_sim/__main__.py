@@ -1,10 +1,8 @@
 import json
 import numpy as np
-import pathlib
 import pygame
 from pygame import locals as py_locals
 import sys
-import yaml
 
 if sys.version_info < (3, 10):
     raise RuntimeError(
@@ -12,7 +10,18 @@ if sys.version_info < (3, 10):
         "Please use Python 3.10 or newer."
     )
 
-from evo_sim import algs, exceptions, functions, ui_parts
+from evo_sim import algs, exceptions, render, ui_parts, worker
+from evo_sim.algs import stopping
+from evo_sim.algs.repr import PopulationBuffer
+from evo_sim.headless import (  # noqa: F401
+    DEFAULT_CONFIG,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+    algorithm_from_config,
+    create_landscape,
+    load_config,
+)
+from evo_sim.rng import spawn_rngs
 
 pygame.init()
 
@@ -22,13 +31,13 @@ LINE_C = (74, 87, 51)
 
 # Game Setup
 fpsClock = pygame.time.Clock()
-WINDOW_WIDTH = 1024
-WINDOW_HEIGHT = 600
 STARTED = 'False'
 PRINTED_BEST = False
+SEED_SEQUENCE = None
 
 WINDOW = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption('evo-sim')
+SPRITES = render.SpriteCache()
 
 
 def quit_game():
@@ -44,12 +53,19 @@ def refresh():
     raise exceptions.ResetException()
 
 
-def draw_triangle(x_pos, y_pos, color=(255, 0, 0), radius=20, offsets=(0, 0)):
+def draw_triangle(
+    x_pos,
+    y_pos,
+    color=(255, 0, 0),
+    radius=20,
+    offsets=(0, 0),
+    surface=None,
+):
     x_pos = x_pos + offsets[0]
     y_pos = y_pos + offsets[1]
 
     pygame.draw.polygon(
-        WINDOW,
+        WINDOW if surface is None else surface,
         color=color,
         points=[
             (x_pos, y_pos),
@@ -72,71 +88,31 @@ def create_startbutton(alg: str):
     return start_button_callback
 
 
-def draw_population(population: list[algs.Individual], scale: float):
-    for idv in population:
-        pygame.draw.circle(
-            WINDOW,
-            color=idv.colour,  # type: ignore
-            center=(idv.x_pos, idv.y_pos),
-            radius=int(idv.radius * scale),
-        )
-
-
-def algorithm_from_config(config: dict, fitness_function, hill_y):
-    if config['use-alg'] == 'evo':
-        return algs.GeneticAlgorithm(
-            config['evo']['population-size'],
-            fitness_function=fitness_function,
-            max_x=WINDOW_WIDTH,
-            init_x=int(np.argmax(hill_y)),
-            mutation_rate=config['evo']['mutation-rate']
-        )
-    elif config['use-alg'] == 'abc':
-        return algs.ABCAlgo(
-            config['abc']['number-of-solutions'],
-            fitness_function=fitness_function,
-            max_x=WINDOW_WIDTH,
-            init_x=int(np.argmax(hill_y)),
-            limit=config['abc']['limit'],
-            show_bees=config['abc']['show-bees'],
-        )
-    else:
-        raise RuntimeError(f"Algorithm '{config['use-algo']}' not defined!")
-
-
-def load_config(path: str | pathlib.Path) -> dict:
-    path = pathlib.Path(path)
-    assert path.exists(), f"Config path {path.absolute()} does not exist!"
-    assert path.suffix == '.yaml', 'Only .yaml files are supported for config!'
-
-    with open(path, 'r') as f:
-        return yaml.safe_load(f)
+def draw_snapshot(snapshot: PopulationBuffer, scale: float):
+    render.draw_snapshot(WINDOW, snapshot, scale, SPRITES)
 
 
 # The main function that controls the game
 def main():
-    global PRINTED_BEST
+    global PRINTED_BEST, SEED_SEQUENCE
 
-    config = load_config(pathlib.Path(__file__).parent.parent / 'settings.yaml')  # noqa: E501
+    config = load_config(DEFAULT_CONFIG)
+    if SEED_SEQUENCE is None:
+        SEED_SEQUENCE = np.random.SeedSequence(config.get('seed'))
+    # Children are spawned per refresh, so every refresh gets a new landscape
+    landscape_rng, algorithm_rng = spawn_rngs(SEED_SEQUENCE, 2)
     algorithm_used = config['use-alg']
     stop_after = config['stop-after']
     scale = config['scale']
     fps = config['fps']
+    generations_per_frame = config.get('generations-per-frame', 1)
 
     first_loop = True
     looping = True
-    hill_x = np.arange(WINDOW_WIDTH)
-    hill_y = functions.hill(
-        len(hill_x),
-        scale=WINDOW_HEIGHT / 2.0,
-        pos_y=WINDOW_HEIGHT / 4.0
+    hill_x, hill_y = create_landscape(
+        WINDOW_WIDTH, WINDOW_HEIGHT, rng=landscape_rng
     )
-
-    def fitness_function(x):
-        try:
-            return hill_y[x]
-        except IndexError:
-            return hill_y[-1]
+    fitness_function = algs.TableFitness(hill_y)
 
     points = list(zip(hill_x, hill_y))
     print(f"Max Point: {max(hill_y)}")
@@ -167,58 +143,77 @@ def main():
     # Rendered from top down, therefore visually max is our min
     min_index = np.argmin(hill_y)
 
-    algo = algorithm_from_config(config, fitness_function, hill_y)
-
-    # The main game loop
-    while looping:
-        WINDOW.fill(BACKGROUND_C)
-        pygame.draw.lines(WINDOW, LINE_C, False, points, int(3 * scale))
-        refresh_button.show()
-        quit_button.show()
-        start_button.show()
+    def draw_static(surface):
+        pygame.draw.lines(surface, LINE_C, False, points, int(3 * scale))
+        for button in (refresh_button, quit_button, start_button):
+            button.show(surface)
         draw_triangle(
             x_pos=hill_x[min_index],
             y_pos=hill_y[min_index],
             radius=8,
-            offsets=(0, -50)
+            offsets=(0, -50),
+            surface=surface,
         )
 
-        # Get inputs
-        for event in pygame.event.get():
-            if event.type == py_locals.QUIT:
-                quit_game()
-            refresh_button.click(event)
-            quit_button.click(event)
-            start_button.click(event)
-
-        if first_loop:
-            population = algo.original_population
-            draw_population(population, scale)
-            first_loop = False
-
-        if STARTED == algorithm_used:
-            if algo._generation < stop_after:
-                population = algo()
-            elif algo._generation >= stop_after and not PRINTED_BEST:
-                print(f"Best solution found: {repr(algo.best_solution)}")
-                print(f"Global best solution: {np.min(hill_y)}, {np.min(hill_x)}")  # noqa: E501
-                print("Logs: ")
-                print(json.dumps(algo.log, indent=2))
-                PRINTED_BEST = True
-            draw_population(population, scale)
-
-        best_x = int(algo.best_solution)
-        best_y = algo.best_solution.fitness_val
-        draw_triangle(
-            x_pos=best_x,
-            y_pos=best_y,
-            color=(0, 0, 255),
-            offsets=(0, -100)
-        )
+    # Landscape, buttons and target never change until the next refresh
+    background = render.render_background(
+        WINDOW.get_size(), BACKGROUND_C, draw_static
+    )
 
-        # Render elements of the game
-        pygame.display.update()
-        fpsClock.tick(fps)
+    algo = algorithm_from_config(
+        config, fitness_function, hill_y, rng=algorithm_rng
+    )
+    criteria = stopping.from_config(config.get('stopping'), stop_after)
+    # The worker owns the algorithm once started, only read its snapshots
+    sim_worker = worker.SimulationWorker(
+        algo, criteria, generations_per_frame=generations_per_frame
+    )
+
+    # The main game loop
+    try:
+        while looping:
+            WINDOW.blit(background, (0, 0))
+
+            # Get inputs
+            for event in pygame.event.get():
+                if event.type == py_locals.QUIT:
+                    quit_game()
+                refresh_button.click(event)
+                quit_button.click(event)
+                start_button.click(event)
+
+            if STARTED == algorithm_used:
+                if not sim_worker.started:
+                    sim_worker.start()
+                if not sim_worker.done.is_set():
+                    sim_worker.frame()
+                elif not PRINTED_BEST:
+                    print(f"Stopped by {sim_worker.stop_reason}")
+                    print(f"Best solution found: {repr(algo.best_solution)}")
+                    print(f"Global best solution: {np.min(hill_y)}, {np.min(hill_x)}")  # noqa: E501
+                    print("Logs: ")
+                    print(json.dumps(algo.log.summary(), indent=2))
+                    PRINTED_BEST = True
+
+            # Drawn from the snapshot, the worker may be mid generation
+            with sim_worker.latest() as snapshot:
+                if first_loop or STARTED == algorithm_used:
+                    draw_snapshot(snapshot, scale)
+                    first_loop = False
+                # Genomes can decode beyond the hill, like their fitness
+                best_x = min(int(snapshot.best_x), len(hill_y) - 1)
+            draw_triangle(
+                x_pos=best_x,
+                y_pos=hill_y[best_x],
+                color=(0, 0, 255),
+                offsets=(0, -100)
+            )
+
+            # Render elements of the game
+            pygame.display.update()
+            fpsClock.tick(fps)
+    finally:
+        sim_worker.stop()
 
 
 def start_sim():
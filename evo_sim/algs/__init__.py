@@ -1,3 +1,10 @@
-from .evo import GeneticAlgorithm  # noqa: F401
+from .evo import (  # noqa: F401
+    GeneticAlgorithm,
+    IslandGeneticAlgorithm,
+    LandscapeGeneticAlgorithm,
+    SteadyStateGeneticAlgorithm,
+    VectorizedGeneticAlgorithm,
+)
+from .fitness import BatchFitness, FitnessCache, TableFitness  # noqa: F401
 from .repr import Individual  # noqa: F401
-from .swarm import ABCAlgo  # noqa: F401
+from .swarm import ABCAlgo, LandscapeABCAlgo, VectorizedABCAlgo  # noqa: F401
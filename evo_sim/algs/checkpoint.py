@@ -0,0 +1,181 @@
+"""Checkpoints of the complete algorithm state as .npz archives.
+
+Algorithms describe their state with ``state_dict`` as a flat dict of
+arrays and scalars and restore it with ``load_state_dict``. Nested state,
+like the random generator, is stored as a JSON string so nothing has to be
+pickled. Resuming from a checkpoint continues exactly like the run that
+wrote it, including the contents of bounded fitness caches.
+
+The class of the algorithm only tells part of a run apart. Callers pass the
+rest, like the seed, landscape and settings, as a JSON-compatible
+``identity`` that is stored with the state and has to match on loading.
+"""
+
+import json
+import os
+import pathlib
+import typing
+
+import numpy as np
+
+from evo_sim.algs.fitness import FitnessCache
+from evo_sim.algs.telemetry import RunLog
+
+FORMAT_VERSION = 1
+
+
+class Checkpointable(typing.Protocol):
+    _generation: int
+
+    def state_dict(self) -> dict:
+        ...
+
+    def load_state_dict(self, state: dict) -> None:
+        ...
+
+
+def rng_state(rng: np.random.Generator) -> str:
+    return json.dumps(rng.bit_generator.state)
+
+
+def set_rng_state(rng: np.random.Generator, state) -> None:
+    rng.bit_generator.state = json.loads(str(state))
+
+
+def log_state(log: RunLog) -> str:
+    return json.dumps(log.summary())
+
+
+def set_log_state(log: RunLog, state) -> None:
+    summary = json.loads(str(state))
+    log.improvements = summary['improvements']
+    log.last_improvement = summary['last_improvement']
+    log.best_fitness = summary['best_fitness']
+
+
+def set_evaluations(fitness_function, evaluations) -> None:
+    # Fitness caches count the evaluations of the function they wrap
+    if isinstance(fitness_function, FitnessCache):
+        fitness_function = fitness_function.fitness_function
+    fitness_function.evaluations = int(evaluations)
+
+
+def common_state(algo) -> dict:
+    state = {
+        'generation': algo._generation,
+        'rng': rng_state(algo.rng),
+        'log': log_state(algo.log),
+        'evaluations': algo.fitness_function.evaluations,
+    }
+
+    fitness_cache = getattr(algo, 'fitness_cache', None)
+    if fitness_cache is not None:
+        for key, value in fitness_cache.state_dict().items():
+            state[f'fitness_cache_{key}'] = value
+    return state
+
+
+def load_common_state(algo, state: dict) -> None:
+    algo._generation = int(state['generation'])
+    set_rng_state(algo.rng, state['rng'])
+    set_log_state(algo.log, state['log'])
+    set_evaluations(algo.fitness_function, state['evaluations'])
+
+    fitness_cache = getattr(algo, 'fitness_cache', None)
+    if fitness_cache is not None and 'fitness_cache_values' in state:
+        fitness_cache.load_state_dict({
+            key: state[f'fitness_cache_{key}']
+            for key in ('positions', 'values', 'stats')
+        })
+
+
+def _identity_state(identity: dict | None) -> str:
+    return json.dumps(identity or {}, sort_keys=True)
+
+
+def save_checkpoint(
+    algo: Checkpointable,
+    path: str | pathlib.Path,
+    identity: dict | None = None,
+) -> None:
+    """Writes the state of ``algo`` to ``path``, replacing it atomically"""
+    path = pathlib.Path(path)
+    # Any values, the stubs would match them to savez's allow_pickle too
+    state: dict[str, typing.Any] = {
+        key: np.asarray(value) for key, value in algo.state_dict().items()
+    }
+    state['_algorithm'] = np.asarray(type(algo).__name__)
+    state['_version'] = np.asarray(FORMAT_VERSION)
+    state['_identity'] = np.asarray(_identity_state(identity))
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **state)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(
+    algo: Checkpointable,
+    path: str | pathlib.Path,
+    identity: dict | None = None,
+) -> None:
+    """Restores ``algo``, it has to be created with the same settings.
+
+    Checkpoints saved with a different ``identity`` are refused.
+    """
+    with np.load(path, allow_pickle=False) as archive:
+        state = {key: archive[key] for key in archive.files}
+
+    algorithm = str(state.pop('_algorithm'))
+    version = int(state.pop('_version'))
+    stored_identity = json.loads(str(state.pop('_identity', '{}')))
+    if algorithm != type(algo).__name__:
+        raise ValueError(
+            f"Checkpoint of {algorithm} can not be loaded into "
+            f"{type(algo).__name__}"
+        )
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Checkpoint format {version} not supported")
+    wanted_identity = json.loads(_identity_state(identity))
+    if stored_identity != wanted_identity:
+        differing = sorted(
+            key for key in stored_identity.keys() | wanted_identity.keys()
+            if stored_identity.get(key) != wanted_identity.get(key)
+        )
+        raise ValueError(
+            f"Checkpoint {path} belongs to another run, "
+            f"{', '.join(differing)} differ"
+        )
+
+    algo.load_state_dict(state)
+
+
+class Checkpointer:
+    """Saves an algorithm every ``interval`` generations"""
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        interval: int,
+        identity: dict | None = None,
+    ) -> None:
+        if interval < 1:
+            raise ValueError(f"Interval has to be positive, got {interval}")
+
+        self.path = pathlib.Path(path)
+        self.interval = interval
+        self.identity = identity
+
+    def __call__(self, algo: Checkpointable) -> bool:
+        if algo._generation % self.interval != 0:
+            return False
+
+        save_checkpoint(algo, self.path, self.identity)
+        return True
+
+    def resume(self, algo: Checkpointable) -> bool:
+        if not self.path.exists():
+            return False
+
+        load_checkpoint(algo, self.path, self.identity)
+        return True
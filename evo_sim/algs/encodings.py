@@ -0,0 +1,560 @@
+"""Genome encodings of the array based genetic algorithms.
+
+An encoding maps genomes to positions between per dimension bounds and
+brings the crossover and mutation operators that fit its genomes. Genomes of
+a population form an array of shape ``(..., individuals, dimensions)``,
+leading axes are independent populations, e.g. islands.
+
+``bits`` and ``gray`` pack every dimension into the bits of an integer on an
+evenly spaced grid, ``integer`` and ``real`` store the positions themselves,
+so neither decodes bit strings. Crossover interleaves the two offspring of
+every pair of parents, mutation changes one gene of a genome in place.
+"""
+
+import abc
+import typing
+
+import numpy as np
+
+
+def interleave(offspring_1: np.ndarray, offspring_2: np.ndarray) -> np.ndarray:
+    """Offspring of shape ``(..., 2 * individuals, dimensions)``"""
+    shape = offspring_1.shape[:-2] + (2 * offspring_1.shape[-2],) \
+        + offspring_1.shape[-1:]
+    offspring = np.empty(shape, dtype=offspring_1.dtype)
+    offspring[..., 0::2, :] = offspring_1
+    offspring[..., 1::2, :] = offspring_2
+    return offspring
+
+
+def uniform_mask(
+    shape: tuple[int, ...],
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Genes taken from the first parent, each with a probability of 0.5"""
+    return rng.random(shape) < 0.5
+
+
+def k_point_mask(
+    shape: tuple[int, ...],
+    points: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Genes before the first of ``points`` random cuts of every row of the
+    last axis come from the first parent, the parents alternate at every
+    further cut"""
+    length = shape[-1]
+    points = min(points, length - 1)
+    if points < 1:
+        return np.ones(shape, dtype=bool)
+
+    # Distinct cuts between genes 1 and length - 1 of every row
+    cuts = np.argsort(
+        rng.random(shape[:-1] + (length - 1,)), axis=-1
+    )[..., :points] + 1
+    crossed = (cuts[..., None, :] <= np.arange(length)[:, None]).sum(axis=-1)
+    return crossed % 2 == 0
+
+
+def mask_crossover(
+    parents_1: np.ndarray,
+    parents_2: np.ndarray,
+    mask: np.ndarray,
+) -> np.ndarray:
+    """Swaps the genes outside ``mask`` between both parents"""
+    return interleave(
+        np.where(mask, parents_1, parents_2),
+        np.where(mask, parents_2, parents_1),
+    )
+
+
+def sbx(
+    parents_1: np.ndarray,
+    parents_2: np.ndarray,
+    eta: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Simulated binary crossover, larger ``eta`` keep children closer to
+    their parents"""
+    u = rng.random(parents_1.shape)
+    beta = np.where(
+        u <= 0.5,
+        (2.0 * u) ** (1.0 / (eta + 1.0)),
+        (0.5 / (1.0 - u)) ** (1.0 / (eta + 1.0)),
+    )
+    return (
+        0.5 * ((1.0 + beta) * parents_1 + (1.0 - beta) * parents_2),
+        0.5 * ((1.0 - beta) * parents_1 + (1.0 + beta) * parents_2),
+    )
+
+
+def blx(
+    parents_1: np.ndarray,
+    parents_2: np.ndarray,
+    alpha: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Blend crossover, children are uniform in the range of their parents
+    widened by ``alpha`` times its width on both sides"""
+    low = np.minimum(parents_1, parents_2)
+    high = np.maximum(parents_1, parents_2)
+    margin = alpha * (high - low)
+    return (
+        rng.uniform(low - margin, high + margin),
+        rng.uniform(low - margin, high + margin),
+    )
+
+
+def _mutated_genes(
+    genomes: np.ndarray,
+    mutation_rate: float,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, ...]:
+    # Index of one random gene of every mutated genome
+    mutated = rng.random(genomes.shape[:-1]) <= mutation_rate
+    index = np.nonzero(mutated)
+    genes = rng.integers(0, genomes.shape[-1], size=len(index[0]))
+    return index + (genes,)
+
+
+def bit_flip_mutation(
+    genomes: np.ndarray,
+    mutation_rate: float,
+    bits: int,
+    rng: np.random.Generator,
+) -> None:
+    """Flips one random bit of one random gene of every mutated genome"""
+    index = _mutated_genes(genomes, mutation_rate, rng)
+    flips = rng.integers(0, bits, size=len(index[0]))
+    genomes[index] ^= np.left_shift(1, flips, dtype=np.int64)
+
+
+def gaussian_mutation(
+    genomes: np.ndarray,
+    mutation_rate: float,
+    scale: np.ndarray,
+    rng: np.random.Generator,
+) -> None:
+    """Adds normal noise of the gene's ``scale`` to one random gene of every
+    mutated genome, integer genomes are rounded"""
+    index = _mutated_genes(genomes, mutation_rate, rng)
+    steps = rng.normal(0.0, scale[index[-1]])
+    if np.issubdtype(genomes.dtype, np.integer):
+        # Never a step of 0, that would not mutate anything
+        steps = np.where(
+            np.abs(steps) < 1.0, np.copysign(1.0, steps), np.rint(steps)
+        )
+    genomes[index] += steps.astype(genomes.dtype)
+
+
+class Encoding(abc.ABC):
+    """Genomes between ``lower`` and ``upper`` with their operators.
+
+    Discrete bounds only hold integer positions. ``crossover`` is one of the
+    ``crossovers`` of the encoding, the first one is the default, and
+    ``points`` is the number of cuts of 'k-point' crossover. Crossovers in
+    ``gene_crossovers`` only exchange whole genes, they are not available
+    for genomes of a single gene, where they would just copy the parents.
+    """
+
+    name: typing.ClassVar[str]
+    crossovers: typing.ClassVar[tuple[str, ...]]
+    gene_crossovers: typing.ClassVar[tuple[str, ...]] = ('uniform', 'k-point')
+    dtype: typing.ClassVar[type] = np.int64
+
+    def __init__(
+        self,
+        lower: float | np.ndarray,
+        upper: float | np.ndarray,
+        discrete: bool = False,
+        crossover: str | None = None,
+        points: int = 2,
+    ) -> None:
+        if points < 1:
+            raise ValueError(f"At least one crossover point, got {points}")
+
+        self.lower = np.atleast_1d(np.asarray(lower, dtype=np.float64))
+        self.upper = np.atleast_1d(np.asarray(upper, dtype=np.float64))
+        self.discrete = discrete
+        if discrete:
+            self.lower = np.ceil(self.lower)
+            self.upper = np.floor(self.upper)
+        self.dimensions = len(self.lower)
+
+        crossovers = [
+            name for name in self.crossovers
+            if self.dimensions > 1 or name not in self.gene_crossovers
+        ]
+        if crossover is None:
+            crossover = crossovers[0]
+        if crossover not in crossovers:
+            raise ValueError(
+                f"Crossover '{crossover}' not defined for "
+                f"{self.dimensions}-dimensional {self.name} genomes! "
+                f"Choose one of {crossovers}"
+            )
+        self.crossover_name = crossover
+        self.points = points
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(dimensions={self.dimensions}, "
+            f"crossover={self.crossover_name!r})"
+        )
+
+    def random(
+        self,
+        shape: tuple[int, ...],
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """Uniform genomes of shape ``shape + (dimensions,)``"""
+        return self.encode(rng.uniform(
+            self.lower, self.upper, size=shape + (self.dimensions,)
+        ))
+
+    @abc.abstractmethod
+    def encode(self, positions: np.ndarray) -> np.ndarray:
+        """Genomes of ``positions``, the last axis are the dimensions"""
+
+    @abc.abstractmethod
+    def decode(self, genomes: np.ndarray) -> np.ndarray:
+        """Positions of ``genomes``, the inverse of ``encode``"""
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        if self.crossover_name == 'uniform':
+            mask = uniform_mask(parents_1.shape, rng)
+        else:
+            mask = k_point_mask(parents_1.shape, self.points, rng)
+        return mask_crossover(parents_1, parents_2, mask)
+
+    @abc.abstractmethod
+    def mutate(
+        self,
+        genomes: np.ndarray,
+        mutation_rate: float,
+        rng: np.random.Generator,
+    ) -> None:
+        """Mutates every genome with ``mutation_rate`` in place"""
+
+
+class BitEncoding(Encoding):
+    """Every dimension as the ``bits`` bits of an integer.
+
+    Discrete bounds use one grid point per integer and need at least the bit
+    length of their width, positions beyond the upper bound share its value.
+    'half' crossover cuts the concatenated bits of all dimensions in half,
+    like ``BinaryPhenotype.__add__``, 'uniform' and 'k-point' cross single
+    bits.
+    """
+
+    name = 'bits'
+    crossovers = ('half', 'uniform', 'k-point')
+    # Single bits are exchanged, even genomes of one gene recombine
+    gene_crossovers = ()
+
+    def __init__(
+        self,
+        lower: float | np.ndarray,
+        upper: float | np.ndarray,
+        discrete: bool = False,
+        crossover: str | None = None,
+        points: int = 2,
+        bits: int | None = None,
+    ) -> None:
+        super().__init__(lower, upper, discrete, crossover, points)
+
+        if bits is None:
+            if discrete:
+                span = np.max(self.upper - self.lower)
+                bits = max(int(span).bit_length(), 1)
+            else:
+                bits = 16
+        if not 0 < bits < 63:
+            raise ValueError(
+                f"Bits per dimension have to be in [1, 62], got {bits}"
+            )
+        self.bits = bits
+        self.max_genome = (1 << bits) - 1
+
+        # Dimensions before the cut come from the first parent, the cut
+        # dimension keeps its high bits from the first parent
+        cut_dim, cut_bit = divmod(self.dimensions * bits // 2, bits)
+        self._first_mask = np.zeros(self.dimensions, dtype=np.int64)
+        self._first_mask[:cut_dim] = self.max_genome
+        if cut_dim < self.dimensions:
+            self._first_mask[cut_dim] = \
+                self.max_genome ^ ((1 << (bits - cut_bit)) - 1)
+        # Value of every bit in the concatenated bits of a genome
+        self._bit_values = np.left_shift(
+            1, np.arange(bits - 1, -1, -1), dtype=np.int64
+        )
+
+    def random(
+        self,
+        shape: tuple[int, ...],
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        return rng.integers(
+            0,
+            self.max_genome,
+            size=shape + (self.dimensions,),
+            endpoint=True,
+            dtype=np.int64,
+        )
+
+    def encode(self, positions: np.ndarray) -> np.ndarray:
+        if self.discrete:
+            genomes = np.asarray(positions) - self.lower
+        else:
+            span = self.upper - self.lower
+            genomes = np.rint(
+                (np.asarray(positions) - self.lower)
+                * (self.max_genome / span)
+            )
+        return np.clip(genomes, 0, self.max_genome).astype(np.int64)
+
+    def decode(self, genomes: np.ndarray) -> np.ndarray:
+        if self.discrete:
+            return np.minimum(self.lower + genomes, self.upper)
+
+        span = self.upper - self.lower
+        return self.lower + genomes * (span / self.max_genome)
+
+    def _pack(self, mask: np.ndarray) -> np.ndarray:
+        # Boolean mask over all bits to one bit mask per dimension
+        return mask.reshape(mask.shape[:-1] + (self.dimensions, self.bits)) \
+            @ self._bit_values
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        if self.crossover_name == 'half':
+            first_mask = self._first_mask
+        else:
+            shape = parents_1.shape[:-1] + (self.dimensions * self.bits,)
+            if self.crossover_name == 'uniform':
+                first_mask = self._pack(uniform_mask(shape, rng))
+            else:
+                first_mask = self._pack(k_point_mask(shape, self.points, rng))
+
+        second_mask = self.max_genome ^ first_mask
+        return interleave(
+            (parents_1 & first_mask) | (parents_2 & second_mask),
+            (parents_2 & first_mask) | (parents_1 & second_mask),
+        )
+
+    def mutate(
+        self,
+        genomes: np.ndarray,
+        mutation_rate: float,
+        rng: np.random.Generator,
+    ) -> None:
+        bit_flip_mutation(genomes, mutation_rate, self.bits, rng)
+
+
+class GrayEncoding(BitEncoding):
+    """Bits in reflected Gray code, neighbouring grid points differ in one
+    bit, so a single bit flip can always reach them"""
+
+    name = 'gray'
+
+    def encode(self, positions: np.ndarray) -> np.ndarray:
+        binary = super().encode(positions)
+        return binary ^ (binary >> 1)
+
+    def decode(self, genomes: np.ndarray) -> np.ndarray:
+        binary = np.array(genomes, dtype=np.int64)
+        shift = 1
+        while shift < self.bits:
+            binary ^= binary >> shift
+            shift *= 2
+        return super().decode(binary)
+
+
+class IntegerEncoding(Encoding):
+    """Integer positions stored as they are, between the rounded bounds.
+
+    The bounds are always discrete. 'uniform' and 'k-point' crossover
+    exchange whole genes, 'blx' rounds blend crossover (``alpha``) to the
+    bounds and is the only crossover of one-dimensional genomes. Mutation
+    adds a rounded normal step of ``sigma`` times the width of the bounds,
+    at least 1, and clips to them.
+    """
+
+    name = 'integer'
+    crossovers = ('uniform', 'k-point', 'blx')
+
+    def __init__(
+        self,
+        lower: float | np.ndarray,
+        upper: float | np.ndarray,
+        discrete: bool = True,
+        crossover: str | None = None,
+        points: int = 2,
+        sigma: float = 0.1,
+        alpha: float = 0.5,
+    ) -> None:
+        super().__init__(lower, upper, True, crossover, points)
+        if sigma <= 0:
+            raise ValueError(f"Mutation scale has to be positive, got {sigma}")
+        self.sigma = sigma
+        self.alpha = alpha
+        self._scale = sigma * (self.upper - self.lower)
+
+    def random(
+        self,
+        shape: tuple[int, ...],
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        return rng.integers(
+            self.lower.astype(np.int64),
+            self.upper.astype(np.int64),
+            size=shape + (self.dimensions,),
+            endpoint=True,
+            dtype=np.int64,
+        )
+
+    def encode(self, positions: np.ndarray) -> np.ndarray:
+        return np.clip(
+            np.rint(positions), self.lower, self.upper
+        ).astype(np.int64)
+
+    def decode(self, genomes: np.ndarray) -> np.ndarray:
+        return np.asarray(genomes, dtype=np.float64)
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        if self.crossover_name != 'blx':
+            return super().crossover(parents_1, parents_2, rng)
+
+        offspring = interleave(*blx(parents_1, parents_2, self.alpha, rng))
+        return self.encode(offspring)
+
+    def mutate(
+        self,
+        genomes: np.ndarray,
+        mutation_rate: float,
+        rng: np.random.Generator,
+    ) -> None:
+        gaussian_mutation(genomes, mutation_rate, self._scale, rng)
+        np.clip(genomes, self.lower, self.upper, out=genomes, casting='unsafe')
+
+
+class RealEncoding(Encoding):
+    """Positions as float64 genomes, discrete bounds round when decoding.
+
+    'sbx' (simulated binary, distribution index ``eta``) and 'blx' (blend,
+    ``alpha``) crossover produce new values between and around the parents,
+    'uniform' and 'k-point' exchange whole genes. Mutation adds normal noise
+    of ``sigma`` times the width of the bounds. Children are clipped to the
+    bounds.
+    """
+
+    name = 'real'
+    crossovers = ('sbx', 'blx', 'uniform', 'k-point')
+    dtype = np.float64
+
+    def __init__(
+        self,
+        lower: float | np.ndarray,
+        upper: float | np.ndarray,
+        discrete: bool = False,
+        crossover: str | None = None,
+        points: int = 2,
+        sigma: float = 0.1,
+        eta: float = 15.0,
+        alpha: float = 0.5,
+    ) -> None:
+        super().__init__(lower, upper, discrete, crossover, points)
+        if sigma <= 0:
+            raise ValueError(f"Mutation scale has to be positive, got {sigma}")
+        self.sigma = sigma
+        self.eta = eta
+        self.alpha = alpha
+        self._scale = sigma * (self.upper - self.lower)
+
+    def random(
+        self,
+        shape: tuple[int, ...],
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        return rng.uniform(
+            self.lower, self.upper, size=shape + (self.dimensions,)
+        )
+
+    def encode(self, positions: np.ndarray) -> np.ndarray:
+        return np.clip(
+            np.asarray(positions, dtype=np.float64), self.lower, self.upper
+        )
+
+    def decode(self, genomes: np.ndarray) -> np.ndarray:
+        if self.discrete:
+            return np.rint(genomes)
+        return np.asarray(genomes, dtype=np.float64)
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        if self.crossover_name == 'sbx':
+            offspring = sbx(parents_1, parents_2, self.eta, rng)
+        elif self.crossover_name == 'blx':
+            offspring = blx(parents_1, parents_2, self.alpha, rng)
+        else:
+            return super().crossover(parents_1, parents_2, rng)
+
+        return np.clip(interleave(*offspring), self.lower, self.upper)
+
+    def mutate(
+        self,
+        genomes: np.ndarray,
+        mutation_rate: float,
+        rng: np.random.Generator,
+    ) -> None:
+        gaussian_mutation(genomes, mutation_rate, self._scale, rng)
+        np.clip(genomes, self.lower, self.upper, out=genomes)
+
+
+ENCODINGS: dict[str, type[Encoding]] = {
+    encoding.name: encoding
+    for encoding in (BitEncoding, GrayEncoding, IntegerEncoding, RealEncoding)
+}
+
+
+def get_encoding(
+    encoding: str | Encoding,
+    lower: float | np.ndarray,
+    upper: float | np.ndarray,
+    discrete: bool = False,
+    bits: int | None = None,
+    **options,
+) -> Encoding:
+    """Encoding by name, ``bits`` only applies to the bit encodings"""
+    if isinstance(encoding, Encoding):
+        return encoding
+
+    try:
+        encoding_type = ENCODINGS[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Encoding '{encoding}' not defined! "
+            f"Choose one of {list(ENCODINGS)}"
+        )
+
+    if issubclass(encoding_type, BitEncoding):
+        options['bits'] = bits
+    return encoding_type(lower, upper, discrete, **options)
@@ -1,16 +1,22 @@
+import concurrent.futures
 import dataclasses
 import functools
 import numpy as np
-import random
 import typing
 
-from evo_sim.algs.repr import Individual
+from evo_sim.algs import checkpoint, encodings, selection as selection_ops
+from evo_sim.algs.executors import Executor, Future
+from evo_sim.algs.fitness import FitnessCache, as_batch
+from evo_sim.algs.profiling import Profiler
+from evo_sim.algs.repr import Individual, PopulationBuffer, Solution
+from evo_sim.algs.telemetry import RunLog
+from evo_sim.landscapes import Landscape
+from evo_sim.rng import make_rng
 
 
 @functools.total_ordering
 @dataclasses.dataclass(eq=False)
 class BinaryPhenotype:
-    fitness_function: typing.ClassVar[typing.Callable[[int], float]]
     genotype: str
     length: int = dataclasses.field(init=False)
 
@@ -31,7 +37,10 @@ class BinaryPhenotype:
         return str(int(self))
 
     def __repr__(self) -> str:
-        return f"BinaryPhenotype(genotype={self.genotype}, fitness_value={self.fitness_val}, phenotype={int(self)})"  # noqa: E501
+        return (
+            f"BinaryPhenotype(genotype={self.genotype}, "
+            f"phenotype={int(self)})"
+        )
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, type(self)):
@@ -44,15 +53,17 @@ class BinaryPhenotype:
             raise ValueError(f"__lt__ not supported for type {type(other)}")
         return int(self) == int(other)
 
-    def to_individual(self) -> Individual:
-        return Individual(
-            x_pos=float(str(self)),
-            y_pos=type(self).fitness_function(int(self))
-        )
+    def to_individual(self, fitness_val: float) -> Individual:
+        # Fitness belongs to the algorithm evaluating the phenotype
+        return Individual(x_pos=float(str(self)), y_pos=fitness_val)
 
-    def flip_bit(self, index: int | None = None) -> None:
+    def flip_bit(
+        self,
+        index: int | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
         if index is None:
-            index = random.randint(0, self.length - 1)
+            index = int(make_rng(rng).integers(0, self.length))
 
         bit = self.genotype[index]
         flipped = bin(int(bit, 2) ^ 1).replace('0b', '')
@@ -90,10 +101,6 @@ class BinaryPhenotype:
 
         return cls("{0:0{length}b}".format(value, length=length))
 
-    @property
-    def fitness_val(self) -> float:
-        return type(self).fitness_function(int(self))
-
 
 class GeneticAlgorithm:
 
@@ -103,80 +110,800 @@ class GeneticAlgorithm:
         fitness_function: typing.Callable[[int], float],
         max_x: int = 100,
         init_x: int = 0,
-        mutation_rate: float = 0.2
+        mutation_rate: float = 0.2,
+        selection: str | selection_ops.Selection = 'roulette',
+        elites: int = 2,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        rng: np.random.Generator | None = None,
     ) -> None:
+        # Cached evaluations are never handed to the executor
+        fitness_function = as_batch(fitness_function, executor)
+        self.fitness_cache = (
+            FitnessCache(fitness_function, cache_size) if cache_size else None
+        )
+        if self.fitness_cache is not None:
+            fitness_function = self.fitness_cache
+
         self.population_size = population_size
-        self.fitness_function = fitness_function
+        self.fitness_function = as_batch(fitness_function)
+        self.rng = make_rng(rng)
         self._generation = 0
         self.genotype_length = max_x.bit_length()
         self.max_x = max_x
-        self.best_solution = BinaryPhenotype.from_int(init_x, self.max_x)
+        # Kept per run, algorithms can run side by side in threads
+        self.best_x = init_x
+        self.best_fitness = float(
+            self.fitness_function.batch(np.array([init_x]))[0]
+        )
         self.mutation_rate = mutation_rate
-        self.log = {  # type: ignore
-            'solutions_found_in_gen': {}
-        }
+        self.selection = selection_ops.get_selection(selection)
+        self.elites = elites
+        self.log = RunLog()
+        self.profiler = Profiler()
+        self.snapshot = PopulationBuffer(population_size)
 
-        BinaryPhenotype.fitness_function = fitness_function
         self.population: list[BinaryPhenotype] = []
         self._original_population: list[BinaryPhenotype] = []
         for _ in range(population_size):
-            x_pos = np.random.randint(0, high=max_x)
+            x_pos = int(self.rng.integers(0, max_x))
             idv = BinaryPhenotype.from_int(x_pos, length=self.genotype_length)
             self.population.append(idv)
             self._original_population.append(idv)
+        # Fitness of the current population, kept for selection and drawing
+        self.fitness_values = self._evaluate(self.population)
+
+    def _positions(self, population: list[BinaryPhenotype]) -> np.ndarray:
+        return np.array([int(p) for p in population], dtype=np.int64)
+
+    def _evaluate(self, population: list[BinaryPhenotype]) -> np.ndarray:
+        return self.fitness_function.batch(self._positions(population))
+
+    def _to_individuals(
+        self,
+        population: list[BinaryPhenotype],
+    ) -> list[Individual]:
+        fitness_val = self._evaluate(population)
+        return [
+            Individual(x_pos=float(int(gen)), y_pos=float(y))
+            for gen, y in zip(population, fitness_val)
+        ]
 
     @property
     def original_population(self) -> list[Individual]:
-        return [gen.to_individual() for gen in self.population]
+        return self._to_individuals(self.population)
+
+    @property
+    def best_solution(self) -> Solution:
+        return Solution(np.array([self.best_x]), self.best_fitness)
+
+    def fill_snapshot(
+        self,
+        out: PopulationBuffer | None = None,
+    ) -> PopulationBuffer:
+        """Writes the current population into ``out`` or ``snapshot``"""
+        out = self.snapshot if out is None else out
+        out.clear()
+        out.extend(self._positions(self.population), self.fitness_values)
+        out.generation = self._generation
+        out.best_x = float(self.best_x)
+        return out
+
+    def state_dict(self) -> dict:
+        return {
+            **checkpoint.common_state(self),
+            'population': self._positions(self.population),
+            'fitness_values': self.fitness_values,
+            'original_population': self._positions(
+                self._original_population
+            ),
+            'best_x': self.best_x,
+            'best_fitness': self.best_fitness,
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        checkpoint.load_common_state(self, state)
+        self.population, self._original_population = [
+            [
+                BinaryPhenotype.from_int(x, self.genotype_length)
+                for x in state[key].tolist()
+            ]
+            for key in ('population', 'original_population')
+        ]
+        self.fitness_values = state['fitness_values'].copy()
+        self.best_x = int(state['best_x'])
+        self.best_fitness = float(state['best_fitness'])
+
+    def step(self) -> None:
+        positions = self._positions(self.population)
+        fitness_val = self.fitness_values
+
+        with self.profiler.phase('selection'):
+            # Consecutive parents are paired, so n_choices parents give
+            # 2 * (n_choices - 1) offspring
+            n_choices = (len(self.population) - self.elites) // 2 + 1
+            choices = [
+                self.population[i]
+                for i in self.selection(fitness_val, n_choices, rng=self.rng)
+            ]
+
+            elites = [
+                self.population[i]
+                for i in selection_ops.top_k(fitness_val, self.elites)
+            ]
+        best_index = int(np.argmin(fitness_val))
+
+        with self.profiler.phase('crossover'):
+            intermediate_pop = []
+            for parent_1, parent_2 in zip(choices, choices[1:]):
+                intermediate_pop.extend(parent_1 + parent_2)
+
+        with self.profiler.phase('mutation'):
+            for offspring in intermediate_pop:
+                if self.rng.random() <= self.mutation_rate:
+                    offspring.flip_bit(rng=self.rng)
+
+        self.population = elites + intermediate_pop
+
+        if fitness_val[best_index] < self.best_fitness:
+            self.best_fitness = float(fitness_val[best_index])
+            self.best_x = int(positions[best_index])
+            self.log.improvement(self._generation, self.best_fitness)
+
+        self.log.generation(
+            self._generation,
+            fitness_val,
+            positions,
+            self.fitness_function.evaluations,
+        )
+        with self.profiler.phase('fitness'):
+            self.fitness_values = self._evaluate(self.population)
+        self._generation += 1
 
     def __call__(self, *args, **kwds) -> list[Individual]:
+        self.step()
+        with self.profiler.phase('to_individuals'):
+            return self.fill_snapshot().to_individuals()
+
+
+class VectorizedGeneticAlgorithm:
+    """Genetic algorithm keeping the whole generation in one array.
+
+    With the default 'bits' encoding every genome is stored as the integer
+    value of its genotype, so crossover and bit flips become bit mask
+    operations on the whole population. Other encodings of ``encodings``,
+    configured by ``encoding_options``, replace the genomes and their
+    operators. Fitness is evaluated once per generation in a single batch.
+    """
+
+    def __init__(
+        self,
+        population_size: int,
+        fitness_function: typing.Callable,
+        max_x: int = 100,
+        init_x: int = 0,
+        mutation_rate: float = 0.2,
+        selection: str | selection_ops.Selection = 'roulette',
+        elites: int = 2,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        encoding: str | encodings.Encoding = 'bits',
+        encoding_options: dict | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        # Cached evaluations are never handed to the executor
+        fitness_function = as_batch(fitness_function, executor)
+        self.fitness_cache = (
+            FitnessCache(fitness_function, cache_size) if cache_size else None
+        )
+        if self.fitness_cache is not None:
+            fitness_function = self.fitness_cache
 
-        # Roulette wheel selection
-        fitness_val = np.array([p.fitness_val for p in self.population])
-        fitness_val = 1.0 / (1.0 + fitness_val)
-        probs = fitness_val / fitness_val.sum()
-        roulette_choice_indices = np.random.choice(
-            self.population_size,
-            size=self.population_size // 2,
-            replace=False,
-            p=probs,
+        self.population_size = population_size
+        self.fitness_function = as_batch(fitness_function)
+        self.rng = make_rng(rng)
+        self._generation = 0
+        self.genotype_length = max_x.bit_length()
+        self.max_x = max_x
+        self.encoding = encodings.get_encoding(
+            encoding,
+            0,
+            max_x - 1,
+            discrete=True,
+            bits=self.genotype_length,
+            **(encoding_options or {}),
+        )
+        self.mutation_rate = mutation_rate
+        self.selection = selection_ops.get_selection(selection)
+        self.elites = elites
+        self.log = RunLog()
+        self.profiler = Profiler()
+        self.snapshot = PopulationBuffer(population_size)
+
+        # Kept per run, algorithms can run side by side in threads
+        self.best_x = init_x
+        self.best_fitness = float(
+            self.fitness_function.batch(np.array([init_x]))[0]
         )
 
-        choices = [
-            p for i, p in enumerate(self.population)
-            if i in roulette_choice_indices
+        self.population = self.encoding.encode(self.rng.integers(
+            0, max_x, size=self._population_shape(), dtype=np.int64
+        ))
+        self._original_population = self.population.copy()
+        # Fitness of the current population, kept for selection and drawing
+        self.fitness_values = self._evaluate(self.population)
+
+    def _population_shape(self) -> tuple[int, ...]:
+        return (self.population_size,)
+
+    def _positions(self, genomes: np.ndarray) -> np.ndarray:
+        # Genomes can decode beyond max_x, those share the last value
+        positions = self.encoding.decode(genomes).astype(np.int64)
+        return positions.reshape(np.shape(genomes))
+
+    def _evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        return self.fitness_function.batch(self._positions(genomes))
+
+    def _to_individuals(self, genomes: np.ndarray) -> list[Individual]:
+        positions = self._positions(genomes)
+        fitness_val = self.fitness_function.batch(positions)
+        return [
+            Individual(x_pos=float(x), y_pos=float(y))
+            for x, y in zip(positions, fitness_val)
         ]
 
-        # Elitism, keep two best
-        best_two = [
-            self.population[i] for i in np.argsort(fitness_val)[-2:]
-        ]
+    @property
+    def original_population(self) -> list[Individual]:
+        return self._to_individuals(self.population)
 
-        intermediate_pop = []
-        for i, parent_1 in enumerate(choices):
-            if (i + 1) == len(choices):
-                break
+    @property
+    def best_solution(self) -> Solution:
+        return Solution(np.array([self.best_x]), self.best_fitness)
 
-            parent_2 = choices[i + 1]
-            off_1, off_2 = parent_1 + parent_2
+    def fill_snapshot(
+        self,
+        out: PopulationBuffer | None = None,
+    ) -> PopulationBuffer:
+        """Writes the current population into ``out`` or ``snapshot``"""
+        out = self.snapshot if out is None else out
+        # Islands are drawn one after another
+        out.clear()
+        out.extend(
+            self._positions(self.population.ravel()),
+            self.fitness_values.ravel(),
+        )
+        out.generation = self._generation
+        out.best_x = float(self.best_x)
+        return out
+
+    def state_dict(self) -> dict:
+        return {
+            **checkpoint.common_state(self),
+            'population': self.population,
+            'fitness_values': self.fitness_values,
+            'original_population': self._original_population,
+            'best_x': self.best_x,
+            'best_fitness': self.best_fitness,
+        }
 
-            if random.random() <= self.mutation_rate:
-                off_1.flip_bit()
+    def load_state_dict(self, state: dict) -> None:
+        checkpoint.load_common_state(self, state)
+        self.population = state['population'].copy()
+        self.fitness_values = state['fitness_values'].copy()
+        self._original_population = state['original_population'].copy()
+        self.best_x = int(state['best_x'])
+        self.best_fitness = float(state['best_fitness'])
 
-            if random.random() <= self.mutation_rate:
-                off_2.flip_bit()
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+    ) -> np.ndarray:
+        # Genomes have a single dimension, individuals are the last axis
+        return self.encoding.crossover(
+            parents_1[..., None], parents_2[..., None], self.rng
+        )[..., 0]
+
+    def mutate(self, genomes: np.ndarray) -> None:
+        self.encoding.mutate(genomes[..., None], self.mutation_rate, self.rng)
+
+    def step(self) -> None:
+        fitness_val = self.fitness_values
+
+        with self.profiler.phase('selection'):
+            n_choices = (len(self.population) - self.elites) // 2 + 1
+            choices = self.population[
+                self.selection(fitness_val, n_choices, rng=self.rng)
+            ]
+            elites = self.population[
+                selection_ops.top_k(fitness_val, self.elites)
+            ]
+
+        with self.profiler.phase('crossover'):
+            offspring = self.crossover(choices[:-1], choices[1:])
+        with self.profiler.phase('mutation'):
+            self.mutate(offspring)
+
+        best_index = int(np.argmin(fitness_val))
+        if fitness_val[best_index] < self.best_fitness:
+            self.best_fitness = float(fitness_val[best_index])
+            self.best_x = int(self._positions(self.population[best_index]))
+            self.log.improvement(self._generation, self.best_fitness)
+
+        self.log.generation(
+            self._generation,
+            fitness_val,
+            self._positions(self.population),
+            self.fitness_function.evaluations,
+        )
+        self.population = np.concatenate([elites, offspring])
+        with self.profiler.phase('fitness'):
+            self.fitness_values = self._evaluate(self.population)
+        self._generation += 1
+
+    def __call__(self, *args, **kwds) -> list[Individual]:
+        self.step()
+        with self.profiler.phase('to_individuals'):
+            return self.fill_snapshot().to_individuals()
+
+
+class IslandGeneticAlgorithm(VectorizedGeneticAlgorithm):
+    """Many independent populations evolved side by side in one 2-D array.
+
+    Row ``r`` of ``population`` is island ``r``, selection, crossover and
+    mutation act on all islands at once. Every ``migration_interval``
+    generations the best ``migrants`` of each island replace the worst of the
+    next island in a ring, an interval of 0 keeps the islands isolated.
+    """
+
+    def __init__(
+        self,
+        n_islands: int,
+        population_size: int,
+        fitness_function: typing.Callable,
+        max_x: int = 100,
+        init_x: int = 0,
+        mutation_rate: float = 0.2,
+        selection: str | selection_ops.Selection = 'roulette',
+        elites: int = 2,
+        migration_interval: int = 0,
+        migrants: int = 1,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        encoding: str | encodings.Encoding = 'bits',
+        encoding_options: dict | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        # The base initializer draws the islands in a single array
+        self.n_islands = n_islands
+        super().__init__(
+            population_size,
+            fitness_function=fitness_function,
+            max_x=max_x,
+            init_x=init_x,
+            mutation_rate=mutation_rate,
+            selection=selection,
+            elites=elites,
+            cache_size=cache_size,
+            executor=executor,
+            encoding=encoding,
+            encoding_options=encoding_options,
+            rng=rng,
+        )
+        self.migration_interval = migration_interval
+        self.migrants = min(migrants, population_size)
+
+        self.island_best_x = np.full(n_islands, init_x, dtype=np.int64)
+        self.island_best_fitness = np.full(
+            n_islands, self.best_fitness, dtype=np.float64
+        )
 
-            intermediate_pop.append(off_1)
-            intermediate_pop.append(off_2)
+    def _population_shape(self) -> tuple[int, ...]:
+        return (self.n_islands, self.population_size)
 
-        self.population = best_two + intermediate_pop
+    def _to_individuals(self, genomes: np.ndarray) -> list[Individual]:
+        return super()._to_individuals(genomes.ravel())
 
-        best_solution = self.population[np.argmin(fitness_val)]
-        if best_solution.fitness_val < self.best_solution.fitness_val:
-            self.log['solutions_found_in_gen'].update(
-                {self._generation: repr(best_solution)}
+    def state_dict(self) -> dict:
+        return {
+            **super().state_dict(),
+            'island_best_x': self.island_best_x,
+            'island_best_fitness': self.island_best_fitness,
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        super().load_state_dict(state)
+        self.island_best_x = state['island_best_x'].copy()
+        self.island_best_fitness = state['island_best_fitness'].copy()
+
+    def migrate(self, fitness_val: np.ndarray) -> None:
+        """Moves migrants in a ring, ``fitness_val`` moves along with them"""
+        if self.n_islands < 2 or self.migrants <= 0:
+            return
+
+        best = selection_ops.top_k(fitness_val, self.migrants)
+        worst = selection_ops.top_k(-fitness_val, self.migrants)
+        for values in (self.population, fitness_val):
+            emigrants = np.take_along_axis(values, best, axis=-1)
+            np.put_along_axis(
+                values, worst, np.roll(emigrants, 1, axis=0), axis=-1
+            )
+
+    def step(self) -> None:
+        fitness_val = self.fitness_values
+
+        with self.profiler.phase('selection'):
+            n_choices = (self.population.shape[-1] - self.elites) // 2 + 1
+            choices = np.take_along_axis(
+                self.population,
+                self.selection(fitness_val, n_choices, rng=self.rng),
+                axis=-1,
             )
-            self.best_solution = best_solution
+            elites = np.take_along_axis(
+                self.population,
+                selection_ops.top_k(fitness_val, self.elites),
+                axis=-1,
+            )
+
+        with self.profiler.phase('crossover'):
+            offspring = self.crossover(choices[:, :-1], choices[:, 1:])
+        with self.profiler.phase('mutation'):
+            self.mutate(offspring)
+
+        best_index = np.argmin(fitness_val, axis=-1)
+        best_fitness = fitness_val[np.arange(self.n_islands), best_index]
+        improved = best_fitness < self.island_best_fitness
+        self.island_best_fitness[improved] = best_fitness[improved]
+        self.island_best_x[improved] = self._positions(
+            self.population[improved, best_index[improved]]
+        )
+
+        best_island = int(np.argmin(self.island_best_fitness))
+        if self.island_best_fitness[best_island] < self.best_fitness:
+            self.best_fitness = float(self.island_best_fitness[best_island])
+            self.best_x = int(self.island_best_x[best_island])
+            self.log.improvement(self._generation, self.best_fitness)
+
+        # Diversity is the mean spread within the islands
+        self.log.generation(
+            self._generation,
+            fitness_val,
+            self._positions(self.population).T,
+            self.fitness_function.evaluations,
+        )
+        self.population = np.concatenate([elites, offspring], axis=-1)
+        with self.profiler.phase('fitness'):
+            self.fitness_values = self._evaluate(self.population)
+        self._generation += 1
+
+        if self.migration_interval and \
+                self._generation % self.migration_interval == 0:
+            with self.profiler.phase('migration'):
+                self.migrate(self.fitness_values)
+
+    def success_rate(self, target_fitness: float) -> float:
+        """Share of islands whose best solution reached ``target_fitness``"""
+        return float(np.mean(self.island_best_fitness <= target_fitness))
+
+
+REPLACEMENTS = ('worst', 'random', 'oldest')
+
+
+class SteadyStateGeneticAlgorithm(VectorizedGeneticAlgorithm):
+    """Genetic algorithm inserting every offspring as soon as it is scored.
 
+    Up to ``slots`` offspring are evaluated at once. Whenever an evaluation
+    finishes its offspring is inserted and the next one is bred from the
+    population as it is at that moment, so a slow evaluation never holds up
+    the others. An offspring replaces the worst individual unless it is
+    worse ('worst'), a random individual ('random') or the individual that
+    was inserted first ('oldest'), the best ``elites`` individuals are never
+    replaced. A generation is ``population_size`` evaluated offspring.
+
+    With a concurrent executor offspring are inserted in the order their
+    evaluations finish, runs are only reproducible without one.
+    """
+
+    def __init__(
+        self,
+        population_size: int,
+        fitness_function: typing.Callable,
+        max_x: int = 100,
+        init_x: int = 0,
+        mutation_rate: float = 0.2,
+        selection: str | selection_ops.Selection = 'tournament',
+        elites: int = 0,
+        replacement: str = 'worst',
+        slots: int = 1,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        encoding: str | encodings.Encoding = 'bits',
+        encoding_options: dict | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        if replacement not in REPLACEMENTS:
+            raise ValueError(
+                f"Replacement '{replacement}' not defined! "
+                f"Choose one of {list(REPLACEMENTS)}"
+            )
+        if slots < 1:
+            raise ValueError(f"At least one slot is needed, got {slots}")
+
+        super().__init__(
+            population_size,
+            fitness_function=fitness_function,
+            max_x=max_x,
+            init_x=init_x,
+            mutation_rate=mutation_rate,
+            selection=selection,
+            # At least one individual has to be replaceable
+            elites=min(elites, population_size - 1),
+            cache_size=cache_size,
+            executor=executor,
+            encoding=encoding,
+            encoding_options=encoding_options,
+            rng=rng,
+        )
+        self.replacement = replacement
+        self.slots = slots
+        # Insertion number of every individual, the initial ones come first
+        self.births = np.arange(population_size, dtype=np.int64)
+        self._pending: dict[Future, typing.Any] = {}
+
+        best_index = int(np.argmin(self.fitness_values))
+        self._update_best(
+            self.population[best_index],
+            float(self.fitness_values[best_index]),
+        )
+
+    def state_dict(self) -> dict:
+        # Evaluations in flight are finished and stored with their values
+        concurrent.futures.wait(self._pending)
+        return {
+            **super().state_dict(),
+            'births': self.births,
+            'pending': np.array(
+                list(self._pending.values()), dtype=self.population.dtype
+            ),
+            'pending_fitness': np.array(
+                [future.result() for future in self._pending],
+                dtype=np.float64,
+            ),
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        super().load_state_dict(state)
+        self.births = state['births'].copy()
+        self._pending = {}
+        for genome, fitness in zip(
+            state['pending'].tolist(), state['pending_fitness'].tolist()
+        ):
+            future: Future = Future()
+            future.set_result(fitness)
+            self._pending[future] = genome
+
+    def _update_best(self, genome, fitness: float) -> None:
+        if fitness < self.best_fitness:
+            self.best_fitness = fitness
+            self.best_x = int(self._positions(genome))
+            self.log.improvement(self._generation, fitness)
+
+    def _breed(self):
+        with self.profiler.phase('selection'):
+            parents = self.population[
+                self.selection(self.fitness_values, 2, rng=self.rng)
+            ]
+        with self.profiler.phase('crossover'):
+            # Only the first of both children is used
+            offspring = self.crossover(parents[:1], parents[1:])[:1]
+        with self.profiler.phase('mutation'):
+            self.mutate(offspring)
+        return offspring[0]
+
+    def _submit(self, genome) -> None:
+        future = self.fitness_function.submit(int(self._positions(genome)))
+        self._pending[future] = genome
+
+    def _insert(self, genome, fitness: float) -> None:
+        if self.replacement == 'worst':
+            index = int(np.argmax(self.fitness_values))
+            if fitness > self.fitness_values[index]:
+                return
+        else:
+            protected = selection_ops.top_k(self.fitness_values, self.elites)
+            if self.replacement == 'random':
+                candidates = np.setdiff1d(
+                    np.arange(len(self.population)), protected
+                )
+                index = int(self.rng.choice(candidates))
+            else:
+                births = self.births.copy()
+                births[protected] = np.iinfo(np.int64).max
+                index = int(np.argmin(births))
+
+        self.population[index] = genome
+        self.fitness_values[index] = fitness
+        self.births[index] = self.births.max() + 1
+        self._update_best(genome, fitness)
+
+    def step(self) -> None:
+        inserted = 0
+        while inserted < len(self.population):
+            while len(self._pending) < self.slots:
+                self._submit(self._breed())
+
+            with self.profiler.phase('fitness'):
+                done, _ = concurrent.futures.wait(
+                    self._pending,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+            with self.profiler.phase('replacement'):
+                # Evaluations finishing together are inserted in order
+                for future in [f for f in self._pending if f in done]:
+                    genome = self._pending.pop(future)
+                    self._insert(genome, float(future.result()))
+                    inserted += 1
+
+        self.log.generation(
+            self._generation,
+            self.fitness_values,
+            self._positions(self.population),
+            self.fitness_function.evaluations,
+        )
         self._generation += 1
-        return [gen.to_individual() for gen in self.population]
+
+
+class LandscapeGeneticAlgorithm:
+    """Genetic algorithm searching an N-dimensional landscape.
+
+    With the default 'bits' encoding every dimension is encoded with ``bits``
+    bits on an evenly spaced grid between the landscape bounds, discrete
+    landscapes use one grid point per integer instead, and crossover cuts
+    the concatenated bit string of all dimensions in half, like
+    ``BinaryPhenotype.__add__``. The 'real' encoding searches continuous
+    landscapes without a grid. The genomes of a generation form an array of
+    shape ``(population_size, dimensions)``.
+    """
+
+    def __init__(
+        self,
+        population_size: int,
+        landscape: Landscape,
+        bits: int = 16,
+        mutation_rate: float = 0.2,
+        selection: str | selection_ops.Selection = 'roulette',
+        elites: int = 2,
+        encoding: str | encodings.Encoding = 'bits',
+        encoding_options: dict | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        self.population_size = population_size
+        self.landscape = landscape
+        self.fitness_function = as_batch(landscape)
+        self.rng = make_rng(rng)
+        self._generation = 0
+        self.mutation_rate = mutation_rate
+        self.selection = selection_ops.get_selection(selection)
+        self.elites = elites
+        self.log = RunLog()
+        self.profiler = Profiler()
+        self.snapshot = PopulationBuffer(population_size)
+
+        # Discrete landscapes derive their bits from the bounds
+        self.encoding = encodings.get_encoding(
+            encoding,
+            landscape.lower,
+            landscape.upper,
+            discrete=landscape.discrete,
+            bits=None if landscape.discrete else bits,
+            **(encoding_options or {}),
+        )
+        self.dimensions = landscape.dimensions
+
+        self.population = self.encoding.random((population_size,), self.rng)
+        self._original_population = self.population.copy()
+        # Fitness of the current population, kept for selection and drawing
+        self.fitness_values = self._evaluate(self.population)
+        self.best_position = self.decode(self.population[0])
+        self.best_fitness = np.inf
+
+    @property
+    def best_solution(self) -> Solution:
+        return Solution(self.best_position, self.best_fitness)
+
+    def decode(self, genomes: np.ndarray) -> np.ndarray:
+        return self.encoding.decode(genomes)
+
+    def _evaluate(self, genomes: np.ndarray) -> np.ndarray:
+        return self.fitness_function.batch(self.decode(genomes))
+
+    def _to_individuals(self, genomes: np.ndarray) -> list[Individual]:
+        # Only the first dimension can be drawn
+        fitness_val = self._evaluate(genomes)
+        return [
+            Individual(x_pos=float(x), y_pos=float(y))
+            for x, y in zip(self.decode(genomes)[:, 0], fitness_val)
+        ]
+
+    @property
+    def original_population(self) -> list[Individual]:
+        return self._to_individuals(self._original_population)
+
+    def fill_snapshot(
+        self,
+        out: PopulationBuffer | None = None,
+    ) -> PopulationBuffer:
+        """Writes the first dimension of the population into ``out``"""
+        out = self.snapshot if out is None else out
+        out.clear()
+        out.extend(self.decode(self.population)[:, 0], self.fitness_values)
+        out.generation = self._generation
+        out.best_x = float(self.best_position[0])
+        return out
+
+    def state_dict(self) -> dict:
+        return {
+            **checkpoint.common_state(self),
+            'population': self.population,
+            'fitness_values': self.fitness_values,
+            'original_population': self._original_population,
+            'best_position': self.best_position,
+            'best_fitness': self.best_fitness,
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        checkpoint.load_common_state(self, state)
+        self.population = state['population'].copy()
+        self.fitness_values = state['fitness_values'].copy()
+        self._original_population = state['original_population'].copy()
+        self.best_position = state['best_position'].copy()
+        self.best_fitness = float(state['best_fitness'])
+
+    def crossover(
+        self,
+        parents_1: np.ndarray,
+        parents_2: np.ndarray,
+    ) -> np.ndarray:
+        return self.encoding.crossover(parents_1, parents_2, self.rng)
+
+    def mutate(self, genomes: np.ndarray) -> None:
+        self.encoding.mutate(genomes, self.mutation_rate, self.rng)
+
+    def step(self) -> None:
+        fitness_val = self.fitness_values
+
+        with self.profiler.phase('selection'):
+            n_choices = (len(self.population) - self.elites) // 2 + 1
+            choices = self.population[
+                self.selection(fitness_val, n_choices, rng=self.rng)
+            ]
+            elites = self.population[
+                selection_ops.top_k(fitness_val, self.elites)
+            ]
+
+        with self.profiler.phase('crossover'):
+            offspring = self.crossover(choices[:-1], choices[1:])
+        with self.profiler.phase('mutation'):
+            self.mutate(offspring)
+
+        best_index = int(np.argmin(fitness_val))
+        if fitness_val[best_index] < self.best_fitness:
+            self.best_fitness = float(fitness_val[best_index])
+            self.best_position = self.decode(self.population[best_index])
+            self.log.improvement(self._generation, self.best_fitness)
+
+        self.log.generation(
+            self._generation,
+            fitness_val,
+            self.decode(self.population),
+            self.fitness_function.evaluations,
+        )
+        self.population = np.concatenate([elites, offspring])
+        with self.profiler.phase('fitness'):
+            self.fitness_values = self._evaluate(self.population)
+        self._generation += 1
+
+    def __call__(self, *args, **kwds) -> list[Individual]:
+        self.step()
+        with self.profiler.phase('to_individuals'):
+            return self.fill_snapshot().to_individuals()
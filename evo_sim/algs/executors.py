@@ -0,0 +1,177 @@
+"""Executors evaluating many positions of an expensive fitness function.
+
+An executor maps a scalar fitness function over a list of positions and
+returns the values in the order of the positions, however the evaluations
+were scheduled. ``BatchFitness`` hands every batch of distinct positions to
+its executor, so a whole generation is evaluated concurrently. Single
+evaluations can be submitted as futures, e.g. to insert offspring as soon as
+their own evaluation finishes.
+"""
+
+import asyncio
+import concurrent.futures
+import inspect
+import math
+import os
+import threading
+import typing
+
+
+Future = concurrent.futures.Future
+
+
+class Executor(typing.Protocol):
+
+    def map(self, function: typing.Callable, positions: list) -> list:
+        ...
+
+    def submit(self, function: typing.Callable, x) -> Future:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class _ClosingExecutor:
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def completed(function: typing.Callable, x) -> Future:
+    """Future of ``function(x)`` evaluated right away"""
+    future: Future = Future()
+    try:
+        future.set_result(function(x))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+class SerialExecutor(_ClosingExecutor):
+    """Evaluates one position after the other in the calling thread"""
+
+    def map(self, function: typing.Callable, positions: list) -> list:
+        return [function(x) for x in positions]
+
+    def submit(self, function: typing.Callable, x) -> Future:
+        return completed(function, x)
+
+
+class ThreadExecutor(_ClosingExecutor):
+    """Thread pool, for fitness functions that release the GIL or wait"""
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix='evo-sim-fitness'
+        )
+
+    def map(self, function: typing.Callable, positions: list) -> list:
+        return list(self._pool.map(function, positions))
+
+    def submit(self, function: typing.Callable, x) -> Future:
+        return self._pool.submit(function, x)
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+
+class ProcessExecutor(_ClosingExecutor):
+    """Process pool for CPU bound fitness functions, they have to pickle"""
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = concurrent.futures.ProcessPoolExecutor(self.max_workers)
+
+    def map(self, function: typing.Callable, positions: list) -> list:
+        # Few chunks per worker keep the pickling overhead low
+        chunksize = max(1, math.ceil(len(positions) / (4 * self.max_workers)))
+        return list(self._pool.map(function, positions, chunksize=chunksize))
+
+    def submit(self, function: typing.Callable, x) -> Future:
+        return self._pool.submit(function, x)
+
+    def close(self) -> None:
+        self._pool.shutdown()
+
+
+class AsyncioExecutor(_ClosingExecutor):
+    """Runs coroutine fitness functions, e.g. remote scorers, concurrently.
+
+    The event loop runs in its own thread and at most ``concurrency``
+    evaluations are in flight at once. Plain functions are called directly
+    on the loop, their results are used as they are.
+    """
+
+    def __init__(self, concurrency: int = 64) -> None:
+        if concurrency < 1:
+            raise ValueError(
+                f"Concurrency has to be positive, got {concurrency}"
+            )
+
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name='evo-sim-asyncio',
+            daemon=True,
+        )
+        self._thread.start()
+
+    async def _evaluate(self, function: typing.Callable, x):
+        async with self._semaphore:
+            value = function(x)
+            if inspect.isawaitable(value):
+                value = await value
+            return value
+
+    async def _gather(self, function: typing.Callable, positions: list):
+        return await asyncio.gather(
+            *(self._evaluate(function, x) for x in positions)
+        )
+
+    def map(self, function: typing.Callable, positions: list) -> list:
+        return asyncio.run_coroutine_threadsafe(
+            self._gather(function, positions), self._loop
+        ).result()
+
+    def submit(self, function: typing.Callable, x) -> Future:
+        return asyncio.run_coroutine_threadsafe(
+            self._evaluate(function, x), self._loop
+        )
+
+    def close(self) -> None:
+        if self._loop.is_closed():
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+EXECUTORS: dict[str, typing.Callable[..., Executor]] = {
+    'serial': SerialExecutor,
+    'threads': ThreadExecutor,
+    'processes': ProcessExecutor,
+    'asyncio': AsyncioExecutor,
+}
+
+
+def make_executor(name: str, workers: int | None = None) -> Executor:
+    """Executor by name, ``workers`` is the pool size or the concurrency"""
+    try:
+        executor = EXECUTORS[name]
+    except KeyError:
+        raise ValueError(
+            f"Executor '{name}' not defined! Choose one of {list(EXECUTORS)}"
+        )
+
+    if name == 'serial' or workers is None:
+        return executor()
+    return executor(workers)
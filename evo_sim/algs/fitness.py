@@ -0,0 +1,257 @@
+"""Fitness evaluation helpers shared by the algorithms.
+
+Algorithms evaluate whole cohorts through the ``batch`` method, an array of
+positions in and an array of fitness values out. Plain scalar callables are
+adapted with ``as_batch``, callables with a truthy ``batched`` attribute are
+handed the whole array at once. Scalar callables can be given an executor
+from ``executors`` to evaluate the distinct positions of a batch
+concurrently.
+"""
+
+import collections
+import dataclasses
+import itertools
+import threading
+import typing
+
+import numpy as np
+
+from evo_sim.algs.executors import Executor, Future, completed
+
+
+class TableFitness:
+    """Precomputed fitness values, positions outside the table are clamped"""
+
+    batched = True
+
+    def __init__(self, table: np.ndarray) -> None:
+        self.table = np.asarray(table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __call__(self, x):
+        return self.table[np.clip(x, 0, len(self.table) - 1)]
+
+
+class BatchFitness:
+
+    def __init__(
+        self,
+        fitness_function: typing.Callable,
+        batched: bool | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        if batched is None:
+            batched = bool(getattr(fitness_function, 'batched', False))
+
+        self.fitness_function = fitness_function
+        self.batched = batched
+        self.executor = executor
+        self.evaluations = 0
+
+    def __call__(self, x) -> float:
+        self.evaluations += 1
+        if self.executor is not None:
+            return self.executor.map(self.fitness_function, [x])[0]
+        return self.fitness_function(x)
+
+    def submit(self, x) -> Future:
+        """Starts evaluating ``x``, without an executor it is done at once"""
+        if self.executor is None or self.batched:
+            return completed(self, x)
+
+        self.evaluations += 1
+        return self.executor.submit(self.fitness_function, x)
+
+    def batch(self, xs: np.ndarray) -> np.ndarray:
+        xs = np.asarray(xs)
+        if self.batched:
+            # Positions can span several array entries, count the values
+            values = np.asarray(self.fitness_function(xs), dtype=np.float64)
+            self.evaluations += values.size
+            return values
+
+        if self.executor is not None:
+            # Distinct positions only, in sorted order for deterministic runs
+            unique, inverse = np.unique(xs, return_inverse=True)
+            self.evaluations += unique.size
+            values = np.asarray(
+                self.executor.map(self.fitness_function, unique.tolist()),
+                dtype=np.float64,
+            )
+            return values[inverse].reshape(xs.shape)
+
+        self.evaluations += xs.size
+        return np.fromiter(
+            (self.fitness_function(x) for x in xs.ravel().tolist()),
+            dtype=np.float64,
+            count=xs.size,
+        ).reshape(xs.shape)
+
+
+def as_batch(
+    fitness_function: typing.Callable,
+    executor: Executor | None = None,
+) -> 'BatchFitness | FitnessCache':
+    if isinstance(fitness_function, (BatchFitness, FitnessCache)):
+        return fitness_function
+
+    return BatchFitness(fitness_function, executor=executor)
+
+
+@dataclasses.dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class FitnessCache:
+    """Memoizes a fitness function with least recently used eviction.
+
+    Positions have to be hashable, misses are forwarded to the wrapped
+    function, batches only forward their distinct missing positions.
+    Submitted misses are evaluated like the wrapped function submits them
+    and stored once they finish, possibly from an executor thread.
+    """
+
+    def __init__(
+        self,
+        fitness_function: typing.Callable,
+        maxsize: int = 2 ** 16,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"Cache size has to be positive, got {maxsize}")
+
+        self.fitness_function = as_batch(fitness_function)
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._values: collections.OrderedDict = collections.OrderedDict()
+        # Submitted evaluations are stored from the thread finishing them
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def evaluations(self) -> int:
+        return self.fitness_function.evaluations
+
+    def _store(self, x, value) -> None:
+        with self._lock:
+            self._values[x] = value
+            if len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _lookup(self, x):
+        """Cached value of ``x`` counted as hit, ``KeyError`` on a miss"""
+        with self._lock:
+            try:
+                value = self._values[x]
+            except KeyError:
+                self.stats.misses += 1
+                raise
+
+            self._values.move_to_end(x)
+            self.stats.hits += 1
+            return value
+
+    def __call__(self, x) -> float:
+        try:
+            return self._lookup(x)
+        except KeyError:
+            value = self.fitness_function(x)
+            self._store(x, value)
+            return value
+
+    def submit(self, x) -> Future:
+        """Answers hits at once and submits misses to the wrapped function"""
+        try:
+            value = self._lookup(x)
+        except KeyError:
+            pass
+        else:
+            hit: Future = Future()
+            hit.set_result(value)
+            return hit
+
+        # Resolved only after storing, so a finished miss is a hit next time
+        future: Future = Future()
+
+        def store(done: Future) -> None:
+            try:
+                value = done.result()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                self._store(x, value)
+                future.set_result(value)
+
+        self.fitness_function.submit(x).add_done_callback(store)
+        return future
+
+    def batch(self, xs: np.ndarray) -> np.ndarray:
+        xs = np.asarray(xs)
+        unique, inverse = np.unique(xs, return_inverse=True)
+        keys = unique.tolist()
+
+        with self._lock:
+            # map and deque keep the lookups out of the interpreter loop,
+            # NaN marks the misses, a cached NaN is just evaluated again
+            values = np.fromiter(
+                map(self._values.get, keys, itertools.repeat(np.nan)),
+                dtype=np.float64,
+                count=len(keys),
+            )
+            missing = np.flatnonzero(np.isnan(values))
+            hits = np.delete(unique, missing).tolist()
+            collections.deque(map(self._values.move_to_end, hits), maxlen=0)
+            self.stats.hits += len(hits)
+            self.stats.misses += len(missing)
+        if len(missing):
+            values[missing] = self.fitness_function.batch(unique[missing])
+            # Only the most recent misses would survive storing them all
+            kept = missing[-self.maxsize:]
+            with self._lock:
+                self._values.update(
+                    zip(unique[kept].tolist(), values[kept].tolist())
+                )
+                evictions = max(len(self._values) - self.maxsize, 0)
+                for _ in range(evictions):
+                    self._values.popitem(last=False)
+                self.stats.evictions += evictions + len(missing) - len(kept)
+
+        return values[inverse].reshape(xs.shape)
+
+    def state_dict(self) -> dict:
+        # Entries from least to most recently used
+        with self._lock:
+            return {
+                'positions': np.array(list(self._values.keys())),
+                'values': np.array(
+                    list(self._values.values()), dtype=np.float64
+                ),
+                'stats': np.array(
+                    dataclasses.astuple(self.stats), dtype=np.int64
+                ),
+            }
+
+    def load_state_dict(self, state: dict) -> None:
+        self._values = collections.OrderedDict(zip(
+            state['positions'].tolist(), state['values'].tolist()
+        ))
+        self.stats = CacheStats(*state['stats'].tolist())
+
+    def clear(self) -> None:
+        self._values.clear()
+        self.stats = CacheStats()
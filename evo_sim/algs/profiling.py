@@ -0,0 +1,168 @@
+"""Opt-in timers and allocation counters for the phases of the algorithms.
+
+Every algorithm owns a disabled ``Profiler`` and wraps its phases in
+``profiler.phase(name)``. A disabled profiler hands out one shared no-op
+context, enable it to collect ``RunStats``. Allocations are only tracked on
+request since ``tracemalloc`` slows everything down.
+"""
+
+import contextlib
+import dataclasses
+import sys
+import time
+import tracemalloc
+import typing
+
+_DISABLED = contextlib.nullcontext()
+
+
+@dataclasses.dataclass
+class PhaseStats:
+    calls: int = 0
+    total_time: float = 0.0
+    peak_bytes: int = 0
+    allocated_blocks: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def merge(self, other: 'PhaseStats') -> None:
+        self.calls += other.calls
+        self.total_time += other.total_time
+        self.peak_bytes = max(self.peak_bytes, other.peak_bytes)
+        self.allocated_blocks += other.allocated_blocks
+
+
+@dataclasses.dataclass
+class RunStats:
+    phases: dict[str, PhaseStats] = dataclasses.field(default_factory=dict)
+    evaluations: int = 0
+    runs: int = 1
+
+    @property
+    def total_time(self) -> float:
+        return sum(phase.total_time for phase in self.phases.values())
+
+    def merge(self, other: 'RunStats') -> None:
+        for name, phase in other.phases.items():
+            self.phases.setdefault(name, PhaseStats()).merge(phase)
+        self.evaluations += other.evaluations
+        self.runs += other.runs
+
+    @classmethod
+    def aggregate(cls, stats: typing.Iterable['RunStats']) -> 'RunStats':
+        total = cls(runs=0)
+        for run_stats in stats:
+            total.merge(run_stats)
+        return total
+
+    def as_dict(self) -> dict:
+        return {
+            'runs': self.runs,
+            'evaluations': self.evaluations,
+            'phases': {
+                name: {
+                    **dataclasses.asdict(phase),
+                    'mean_time': phase.mean_time,
+                }
+                for name, phase in self.phases.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, stats: dict) -> 'RunStats':
+        fields = {field.name for field in dataclasses.fields(PhaseStats)}
+        return cls(
+            phases={
+                name: PhaseStats(**{
+                    key: value for key, value in phase.items()
+                    if key in fields
+                })
+                for name, phase in stats['phases'].items()
+            },
+            evaluations=stats['evaluations'],
+            runs=stats['runs'],
+        )
+
+    def report(self) -> str:
+        total_time = self.total_time or 1.0
+        lines = [f"{'phase':<16}{'calls':>8}{'total s':>12}{'share':>8}"]
+        for name, phase in sorted(
+            self.phases.items(), key=lambda item: -item[1].total_time
+        ):
+            lines.append(
+                f"{name:<16}{phase.calls:>8}{phase.total_time:>12.4f}"
+                f"{phase.total_time / total_time:>8.1%}"
+            )
+        lines.append(f"evaluations: {self.evaluations}")
+        return '\n'.join(lines)
+
+
+class Profiler:
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        track_allocations: bool = False,
+    ) -> None:
+        self.enabled = False
+        self.track_allocations = False
+        # Only stop tracing that was started by this profiler
+        self._started_tracing = False
+        self.stats = RunStats()
+        if enabled:
+            self.enable(track_allocations)
+
+    def enable(self, track_allocations: bool = False) -> None:
+        self.enabled = True
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        self.stats = RunStats()
+
+    def phase(self, name: str) -> typing.ContextManager:
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+    @contextlib.contextmanager
+    def _timed(self, name: str) -> typing.Iterator[None]:
+        track = self.track_allocations and tracemalloc.is_tracing()
+        if track:
+            tracemalloc.reset_peak()
+            start_bytes = tracemalloc.get_traced_memory()[0]
+            start_blocks = sys.getallocatedblocks()
+
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            phase = self.stats.phases.setdefault(name, PhaseStats())
+            phase.calls += 1
+            phase.total_time += elapsed
+            if track:
+                peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+                phase.peak_bytes = max(phase.peak_bytes, peak_bytes)
+                phase.allocated_blocks += \
+                    sys.getallocatedblocks() - start_blocks
+
+    def snapshot(self, evaluations: int = 0) -> RunStats:
+        """Copy of the stats so far with the given evaluation count"""
+        return RunStats(
+            phases={
+                name: dataclasses.replace(phase)
+                for name, phase in self.stats.phases.items()
+            },
+            evaluations=evaluations,
+        )
@@ -2,11 +2,104 @@
 
 import dataclasses
 
+import numpy as np
 
-@dataclasses.dataclass
+DEFAULT_RADIUS = 5
+DEFAULT_COLOUR = (0, 0, 255)
+
+
+@dataclasses.dataclass(slots=True)
 class Individual:
     x_pos: float
     y_pos: float
-    radius: int = 5
-    colour: tuple = (0, 0, 255)
+    radius: int = DEFAULT_RADIUS
+    colour: tuple = DEFAULT_COLOUR
     text: str = ''
+
+
+@dataclasses.dataclass
+class Solution:
+    """Best position of an N-dimensional search and its fitness"""
+
+    position: np.ndarray
+    fitness_val: float
+
+    @property
+    def x_loc(self) -> float:
+        # Only the first dimension can be drawn
+        return float(self.position[0])
+
+
+class PopulationBuffer:
+    """Columns of the individuals of one generation, reused between them.
+
+    Algorithms fill ``x``, ``y``, ``radius`` and ``colour`` in place and the
+    buffer only grows when a generation does not fit, so drawing or logging a
+    generation does not create objects. Colours are indices into ``palette``.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 0,
+        palette: list[tuple] | None = None,
+    ) -> None:
+        self.palette = [DEFAULT_COLOUR] if palette is None else palette
+        self.size = 0
+        self.generation = 0
+        self.best_x = 0.0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.radius = np.full(capacity, DEFAULT_RADIUS, dtype=np.int64)
+        self.colour = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Individual:
+        if not -self.size <= index < self.size:
+            raise IndexError(f"Index {index} out of range for {self.size}")
+        index %= self.size
+        return Individual(
+            float(self.x[index]),
+            float(self.y[index]),
+            radius=int(self.radius[index]),
+            colour=self.palette[self.colour[index]],
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(self.size))
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= len(self.x):
+            return
+
+        capacity = max(capacity, 2 * len(self.x))
+        for name in ('x', 'y', 'radius', 'colour'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+
+    def clear(self) -> None:
+        self.size = 0
+
+    def extend(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        colour: int = 0,
+        radius: int = DEFAULT_RADIUS,
+    ) -> slice:
+        """Appends individuals, returns the slice of the columns they got"""
+        start = self.size
+        end = start + len(x)
+        self.reserve(end)
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.radius[start:end] = radius
+        self.colour[start:end] = colour
+        self.size = end
+        return slice(start, end)
+
+    def to_individuals(self) -> list[Individual]:
+        return list(self)
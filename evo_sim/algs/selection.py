@@ -0,0 +1,163 @@
+"""Selection operators for the genetic algorithms.
+
+All operators minimize, take the fitness values of a population along the
+last axis and return the indices of ``k`` selected individuals. Leading axes
+are treated as independent populations.
+"""
+
+import typing
+
+import numpy as np
+
+from evo_sim.rng import make_rng
+
+Selection = typing.Callable[..., np.ndarray]
+
+
+def _weights(fitness: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.asarray(fitness, dtype=np.float64))
+
+
+def _cumulative_probs(weights: np.ndarray) -> np.ndarray:
+    cumulative = np.cumsum(weights, axis=-1)
+    cumulative /= cumulative[..., -1:]
+    cumulative[..., -1] = 1.0
+    return cumulative
+
+
+def _searchsorted_rows(
+    cumulative: np.ndarray,
+    values: np.ndarray,
+) -> np.ndarray:
+    # Shift every row by its row number so one flat searchsorted covers all
+    n_points = cumulative.shape[-1]
+    rows = cumulative.reshape(-1, n_points)
+    row_values = values.reshape(rows.shape[0], -1)
+    offsets = np.arange(rows.shape[0])[:, None]
+
+    indices = np.searchsorted(
+        (rows + offsets).ravel(), (row_values + offsets).ravel(), side='right'
+    ).reshape(row_values.shape) - offsets * n_points
+    return np.minimum(indices, n_points - 1).reshape(values.shape)
+
+
+def proportional(
+    weights: np.ndarray,
+    k: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Draws ``k`` indices with replacement, proportional to ``weights``.
+
+    Unlike the other operators the weights are used as given, larger weights
+    are drawn more often.
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum(axis=-1, keepdims=True)
+    weights = np.where(
+        np.isfinite(total) & (total > 0), weights, np.ones_like(weights)
+    )
+    return _searchsorted_rows(
+        _cumulative_probs(weights),
+        make_rng(rng).random(weights.shape[:-1] + (k,)),
+    )
+
+
+def top_k(fitness: np.ndarray, k: int) -> np.ndarray:
+    fitness = np.asarray(fitness)
+    if k <= 0:
+        return np.empty(fitness.shape[:-1] + (0,), dtype=np.int64)
+    if k >= fitness.shape[-1]:
+        return np.broadcast_to(
+            np.arange(fitness.shape[-1]), fitness.shape
+        ).copy()
+
+    return np.argpartition(fitness, k - 1, axis=-1)[..., :k]
+
+
+def roulette(
+    fitness: np.ndarray,
+    k: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Fitness proportionate selection without replacement.
+
+    Uses the exponential keys of Efraimidis and Spirakis, which draw from the
+    same distribution as repeatedly spinning the wheel and removing the hit.
+    Selected indices are returned in population order.
+    """
+    weights = _weights(fitness)
+    keys = np.log(make_rng(rng).random(weights.shape)) / weights
+    return np.sort(top_k(-keys, k), axis=-1)
+
+
+def stochastic_universal(
+    fitness: np.ndarray,
+    k: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    weights = _weights(fitness)
+    cumulative = _cumulative_probs(weights)
+    start = make_rng(rng).random(weights.shape[:-1] + (1,)) / k
+    pointers = start + np.arange(k) / k
+    return _searchsorted_rows(cumulative, pointers)
+
+
+def tournament(
+    fitness: np.ndarray,
+    k: int,
+    rng: np.random.Generator | None = None,
+    size: int = 2,
+) -> np.ndarray:
+    fitness = np.asarray(fitness)
+    contestants = make_rng(rng).integers(
+        0, fitness.shape[-1], size=fitness.shape[:-1] + (k, size)
+    )
+    contestant_fitness = np.take_along_axis(
+        fitness[..., None, :],
+        contestants.reshape(fitness.shape[:-1] + (1, k * size)),
+        axis=-1,
+    ).reshape(contestants.shape)
+    winners = np.argmin(contestant_fitness, axis=-1)
+    return np.take_along_axis(contestants, winners[..., None], axis=-1)[..., 0]
+
+
+def rank(
+    fitness: np.ndarray,
+    k: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Linear ranking, the best individual gets weight n and the worst 1."""
+    fitness = np.asarray(fitness)
+    n_points = fitness.shape[-1]
+    ranks = np.empty(fitness.shape, dtype=np.int64)
+    np.put_along_axis(
+        ranks,
+        np.argsort(fitness, axis=-1),
+        np.broadcast_to(np.arange(n_points), fitness.shape),
+        axis=-1,
+    )
+    cumulative = _cumulative_probs((n_points - ranks).astype(np.float64))
+    return _searchsorted_rows(
+        cumulative, make_rng(rng).random(fitness.shape[:-1] + (k,))
+    )
+
+
+SELECTIONS: dict[str, Selection] = {
+    'roulette': roulette,
+    'sus': stochastic_universal,
+    'tournament': tournament,
+    'rank': rank,
+}
+
+
+def get_selection(selection: str | Selection) -> Selection:
+    if callable(selection):
+        return selection
+
+    try:
+        return SELECTIONS[selection]
+    except KeyError:
+        raise ValueError(
+            f"Selection '{selection}' not defined! "
+            f"Choose one of {list(SELECTIONS)}"
+        )
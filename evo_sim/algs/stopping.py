@@ -0,0 +1,163 @@
+"""Criteria that end a run early instead of after a fixed generation count.
+
+A criterion looks at an algorithm after every generation and fires once its
+condition holds. ``StoppingCriteria`` combines several of them, the run stops
+as soon as any one fires and the name of that criterion is kept as the reason.
+All criteria only read what every engine already tracks: the generation, the
+``RunLog`` and the evaluation count of the fitness function.
+"""
+
+import abc
+import dataclasses
+import time
+import typing
+
+
+class Criterion(abc.ABC):
+    name: typing.ClassVar[str]
+
+    def start(self, algo) -> None:
+        """Called once before the first check of a run"""
+
+    @abc.abstractmethod
+    def __call__(self, algo) -> bool:
+        """Whether the run should stop after the last generation"""
+
+
+@dataclasses.dataclass
+class MaxGenerations(Criterion):
+    name: typing.ClassVar[str] = 'max-generations'
+    generations: int
+
+    def __call__(self, algo) -> bool:
+        return algo._generation >= self.generations
+
+
+@dataclasses.dataclass
+class NoImprovement(Criterion):
+    """No better solution within the last ``window`` generations"""
+    name: typing.ClassVar[str] = 'no-improvement'
+    window: int
+    _start_generation: int = dataclasses.field(
+        default=0, init=False, repr=False
+    )
+
+    def start(self, algo) -> None:
+        self._start_generation = algo._generation
+
+    def __call__(self, algo) -> bool:
+        last_improvement = algo.log.last_improvement
+        if last_improvement is None:
+            last_improvement = self._start_generation
+        return algo._generation - last_improvement >= self.window
+
+
+@dataclasses.dataclass
+class FitnessTarget(Criterion):
+    """Best fitness found is at most ``target``"""
+    name: typing.ClassVar[str] = 'fitness-target'
+    target: float
+
+    def __call__(self, algo) -> bool:
+        best_fitness = algo.log.best_fitness
+        return best_fitness is not None and best_fitness <= self.target
+
+
+@dataclasses.dataclass
+class DiversityCollapse(Criterion):
+    """Mean spread of the positions fell to ``threshold``"""
+    name: typing.ClassVar[str] = 'diversity'
+    threshold: float
+
+    def start(self, algo) -> None:
+        # Diversity is only computed for logs that keep their records
+        algo.log.keep_last = True
+
+    def __call__(self, algo) -> bool:
+        record = algo.log.last_record
+        return record is not None and record.diversity <= self.threshold
+
+
+@dataclasses.dataclass
+class WallClock(Criterion):
+    """``seconds`` passed since the run started"""
+    name: typing.ClassVar[str] = 'wall-clock'
+    seconds: float
+    _start_time: float | None = dataclasses.field(
+        default=None, init=False, repr=False
+    )
+
+    def start(self, algo) -> None:
+        self._start_time = time.perf_counter()
+
+    def __call__(self, algo) -> bool:
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        return time.perf_counter() - self._start_time >= self.seconds
+
+
+@dataclasses.dataclass
+class EvaluationBudget(Criterion):
+    """Fitness function evaluated at least ``evaluations`` times"""
+    name: typing.ClassVar[str] = 'evaluations'
+    evaluations: int
+
+    def __call__(self, algo) -> bool:
+        return algo.fitness_function.evaluations >= self.evaluations
+
+
+# Every criterion is built from the one value of its config key
+CRITERIA: dict[str, typing.Callable[[typing.Any], Criterion]] = {
+    criterion.name: criterion
+    for criterion in (
+        MaxGenerations,
+        NoImprovement,
+        FitnessTarget,
+        DiversityCollapse,
+        WallClock,
+        EvaluationBudget,
+    )
+}
+
+
+class StoppingCriteria:
+    """Fires as soon as any of its criteria fires"""
+
+    def __init__(self, criteria: typing.Iterable[Criterion] = ()) -> None:
+        self.criteria = list(criteria)
+        self.stop_reason: str | None = None
+
+    def start(self, algo) -> None:
+        self.stop_reason = None
+        for criterion in self.criteria:
+            criterion.start(algo)
+
+    def __call__(self, algo) -> str | None:
+        """Name of the first criterion that fires, ``None`` to go on"""
+        for criterion in self.criteria:
+            if criterion(algo):
+                self.stop_reason = criterion.name
+                return self.stop_reason
+        return None
+
+
+def from_config(
+    stopping: dict | None,
+    stop_after: int | None = None,
+) -> StoppingCriteria:
+    """Criteria of a ``stopping`` config section, ``None`` values are off"""
+    criteria: list[Criterion] = []
+    if stop_after is not None:
+        criteria.append(MaxGenerations(stop_after))
+
+    for key, value in (stopping or {}).items():
+        if value is None:
+            continue
+        try:
+            criteria.append(CRITERIA[key](value))
+        except KeyError:
+            raise ValueError(
+                f"Stopping criterion '{key}' not defined! "
+                f"Choose one of {list(CRITERIA)}"
+            )
+    return StoppingCriteria(criteria)
@@ -1,17 +1,38 @@
-import collections
+import abc
 import dataclasses
 import functools
 import numpy as np
-import random
 import typing
 
-from evo_sim.algs.repr import Individual
+from evo_sim.algs import checkpoint, selection
+from evo_sim.algs.executors import Executor
+from evo_sim.algs.fitness import FitnessCache, as_batch
+from evo_sim.algs.profiling import Profiler
+from evo_sim.algs.repr import (
+    DEFAULT_COLOUR,
+    Individual,
+    PopulationBuffer,
+    Solution,
+)
+from evo_sim.algs.taboo import TabooIndex
+from evo_sim.algs.telemetry import RunLog
+from evo_sim.landscapes import Landscape
+from evo_sim.rng import make_rng
+
+
+BEE_COLOURS = {
+    'onlooker': (230, 180, 20),
+    'scout': (255, 0, 0),
+    'employed': (0, 255, 0),
+}
+# Colour indices of snapshots, food sources keep the default colour
+BEE_PALETTE = [DEFAULT_COLOUR, *BEE_COLOURS.values()]
+BEE_COLOUR_INDEX = {name: i + 1 for i, name in enumerate(BEE_COLOURS)}
 
 
 @functools.total_ordering
 @dataclasses.dataclass(eq=False)
 class Foodsource:
-    fitness_function: typing.ClassVar[typing.Callable[[int], float]]
     x_loc: float
 
     def __int__(self) -> int:
@@ -20,10 +41,6 @@ class Foodsource:
     def __str__(self) -> str:
         return str(int(self))
 
-    @property
-    def fitness_val(self) -> float:
-        return type(self).fitness_function(int(self))
-
     def __eq__(self, o: 'Foodsource') -> bool:  # type: ignore
         return self.x_loc == o.x_loc
 
@@ -32,28 +49,40 @@ class Foodsource:
 
 
 class Bee:
+    """View of a single bee, the algorithms keep bees in arrays"""
+
+    __slots__ = ('_type', '_assigned_source', '_fitness_val')
+    color_map = BEE_COLOURS
 
     def __init__(
         self,
         _type: typing.Literal['onlooker', 'scout', 'employed'],
         assigned_source: Foodsource,
+        fitness_val: float,
     ) -> None:
         self._type = _type
         self._assigned_source = assigned_source
-        self.color_map = {
-            'onlooker': (230, 180, 20),
-            'scout': (255, 0, 0),
-            'employed': (0, 255, 0),
-        }
+        self._fitness_val = fitness_val
 
     def to_individual(self) -> Individual:
         return Individual(
             self._assigned_source.x_loc,
-            self._assigned_source.fitness_val,
+            self._fitness_val,
             colour=self.color_map[self._type],
         )
 
 
+def _extend_bees(
+    out: PopulationBuffer,
+    employed: tuple[np.ndarray, np.ndarray],
+    scouts: np.ndarray,
+    onlookers: tuple[np.ndarray, np.ndarray],
+) -> None:
+    employed_rows = out.extend(*employed, colour=BEE_COLOUR_INDEX['employed'])
+    out.colour[employed_rows][scouts] = BEE_COLOUR_INDEX['scout']
+    out.extend(*onlookers, colour=BEE_COLOUR_INDEX['onlooker'])
+
+
 class ABCAlgo:
 
     def __init__(
@@ -64,121 +93,692 @@ class ABCAlgo:
         init_x: int = 0,
         limit: int = 20,
         show_bees: bool = False,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        taboo_capacity: int = 1024,
+        rng: np.random.Generator | None = None,
     ) -> None:
+        # Cached evaluations are never handed to the executor
+        fitness_function = as_batch(fitness_function, executor)
+        self.fitness_cache = (
+            FitnessCache(fitness_function, cache_size) if cache_size else None
+        )
+        if self.fitness_cache is not None:
+            fitness_function = self.fitness_cache
+
         self.nos = number_of_solutions
-        self.fitness_function = fitness_function
-        Foodsource.fitness_function = fitness_function
+        self.fitness_function = as_batch(fitness_function)
+        self.rng = make_rng(rng)
         self.limit = limit
         self.show_bees = show_bees
         self._generation = 0
         self.max_x = max_x
-        self.best_solution = Foodsource(init_x)
-        self.taboo_table: set[int] = set()
-        self.log = {  # type: ignore
-            'solutions_found_in_gen': {}
-        }
+        # Kept per run, algorithms can run side by side in threads
+        self.best_x = init_x
+        self.best_fitness = float(
+            self.fitness_function.batch(np.array([init_x]))[0]
+        )
+        self.taboo_table = TabooIndex(
+            max_x, capacity=taboo_capacity, rng=self.rng
+        )
+        self.log = RunLog()
+        self.profiler = Profiler()
         self.food_sources: list[Foodsource] = []
         self.fitness_values: list[float] = []
         self.counters: list[int] = []
         self.probs: list[float] = []
         self.original_population: list[Individual] = []
-        self.bees: dict[str, list[Bee]] = collections.defaultdict(list)
+        self.snapshot = PopulationBuffer(3 * number_of_solutions, BEE_PALETTE)
+
+        # Last visited positions, only used to visualize the bees
+        self.employed_positions = np.zeros(self.nos, dtype=np.int64)
+        self.onlooker_positions = np.zeros(self.nos, dtype=np.int64)
+        self.employed_fitness = np.zeros(self.nos)
+        self.onlooker_fitness = np.zeros(self.nos)
+        self.scouts = np.zeros(self.nos, dtype=bool)
         self._init_algorithm()
 
     def _init_algorithm(self) -> None:
-        for _ in range(self.nos):
-            x_val = random.randint(0, self.max_x)
+        x_vals = self.rng.integers(
+            0, self.max_x, size=self.nos, endpoint=True
+        ).tolist()
+        fitness_values = self.fitness_function.batch(np.array(x_vals))
+        for x_val, fitness_val in zip(x_vals, fitness_values.tolist()):
             f_source = Foodsource(x_val)
             self.food_sources.append(f_source)
             self.counters.append(0)
-            self.fitness_values.append(self.fitness_function(x_val))
+            self.fitness_values.append(fitness_val)
             self.original_population.append(
-                Individual(f_source.x_loc, f_source.fitness_val)
+                Individual(f_source.x_loc, fitness_val)
             )
-            self.bees['employed'].append(Bee('employed', f_source))
-            self.bees['onlooker'].append(Bee('onlooker', Foodsource(0)))
+        # Bees start at their food sources
+        for positions in (self.employed_positions, self.onlooker_positions):
+            positions[:] = x_vals
+        for fitness in (self.employed_fitness, self.onlooker_fitness):
+            fitness[:] = fitness_values
 
-    def __call__(self, *args, **kwds) -> list[Individual]:
-        self._generation += 1
-        self._employed_phase()
-        self._generate_probabilities()
-        self._onlooker_phase()
+    @property
+    def best_solution(self) -> Solution:
+        return Solution(np.array([self.best_x]), self.best_fitness)
 
-        best_index = np.argmax(self.fitness_values)
-        new_best = self.food_sources[best_index]
-        if new_best.fitness_val < self.best_solution.fitness_val and new_best.x_loc >= 0 and new_best.x_loc < self.max_x:  # solutions can jump out of screen
-            self.log['solutions_found_in_gen'][self._generation] = self.food_sources[best_index].fitness_val  # noqa: E501
-            self.best_solution = self.food_sources[best_index]
+    @property
+    def bees(self) -> dict[str, list[Bee]]:
+        """Bees of the last phases as objects, built on every access"""
+        return {
+            'employed': [
+                Bee('scout' if scout else 'employed', Foodsource(x), y)
+                for x, y, scout in zip(
+                    self.employed_positions.tolist(),
+                    self.employed_fitness.tolist(),
+                    self.scouts.tolist(),
+                )
+            ],
+            'onlooker': [
+                Bee('onlooker', Foodsource(x), y)
+                for x, y in zip(
+                    self.onlooker_positions.tolist(),
+                    self.onlooker_fitness.tolist(),
+                )
+            ],
+        }
 
-        self._scout_phase()
+    def fill_snapshot(
+        self,
+        out: PopulationBuffer | None = None,
+    ) -> PopulationBuffer:
+        """Writes food sources and bees into ``out`` or ``snapshot``"""
+        out = self.snapshot if out is None else out
+        out.clear()
+        out.extend(
+            np.array([source.x_loc for source in self.food_sources]),
+            np.asarray(self.fitness_values),
+        )
+        if self.show_bees:
+            _extend_bees(
+                out,
+                (self.employed_positions, self.employed_fitness),
+                self.scouts,
+                (self.onlooker_positions, self.onlooker_fitness),
+            )
+        out.generation = self._generation
+        out.best_x = float(self.best_x)
+        return out
+
+    def state_dict(self) -> dict:
+        return {
+            **checkpoint.common_state(self),
+            'positions': np.array(
+                [source.x_loc for source in self.food_sources]
+            ),
+            'fitness_values': np.array(self.fitness_values, dtype=float),
+            'counters': np.array(self.counters, dtype=np.int64),
+            'probs': np.array(self.probs, dtype=float),
+            'original_x': np.array(
+                [idv.x_pos for idv in self.original_population]
+            ),
+            'original_y': np.array(
+                [idv.y_pos for idv in self.original_population]
+            ),
+            'employed_types': np.where(self.scouts, 'scout', 'employed'),
+            'employed_x': self.employed_positions,
+            'onlooker_x': self.onlooker_positions,
+            'employed_fitness': self.employed_fitness,
+            'onlooker_fitness': self.onlooker_fitness,
+            'best_x': self.best_x,
+            'best_fitness': self.best_fitness,
+            **{
+                f'taboo_{key}': value
+                for key, value in self.taboo_table.state_dict().items()
+            },
+        }
 
-        foodsources = [
-            Individual(foodsource.x_loc, foodsource.fitness_val)
-            for foodsource in self.food_sources
+    def load_state_dict(self, state: dict) -> None:
+        checkpoint.load_common_state(self, state)
+        self.food_sources = [
+            Foodsource(x) for x in state['positions'].tolist()
+        ]
+        self.fitness_values = state['fitness_values'].tolist()
+        self.counters = state['counters'].tolist()
+        self.probs = state['probs']
+        self.original_population = [
+            Individual(x, y) for x, y in zip(
+                state['original_x'].tolist(), state['original_y'].tolist()
+            )
         ]
-        bees = [
-            b.to_individual()
-            for b in self.bees['employed'] + self.bees['onlooker']
+        self.employed_positions = state['employed_x'].astype(np.int64)
+        self.onlooker_positions = state['onlooker_x'].astype(np.int64)
+        self.employed_fitness = state['employed_fitness'].copy()
+        self.onlooker_fitness = state['onlooker_fitness'].copy()
+        self.scouts = state['employed_types'] == 'scout'
+        self.best_x = state['best_x'].item()
+        self.best_fitness = float(state['best_fitness'])
+        self.taboo_table.load_state_dict({
+            key[len('taboo_'):]: value
+            for key, value in state.items() if key.startswith('taboo_')
+        })
+
+    def step(self) -> None:
+        with self.profiler.phase('employed'):
+            self._employed_phase()
+        with self.profiler.phase('onlooker'):
+            self._generate_probabilities()
+            self._onlooker_phase()
+
+        # Solutions can jump out of screen
+        in_bounds = [
+            0 <= source.x_loc < self.max_x for source in self.food_sources
         ]
-        return (foodsources + bees) if self.show_bees else foodsources
-
-    def _scout_phase(self, *args, **kwds):
-        for i in range(self.nos):
-            if self.counters[i] > self.limit:
-                self.taboo_table.add(self.food_sources[i].x_loc)
-
-                while True:
-
-                    if (new_x := random.randint(0, self.max_x)) in self.taboo_table:
-                        continue
-                    else:
-                        self.bees['employed'][i] = Bee('scout', Foodsource(new_x))
-                        self.food_sources[i] = Foodsource(new_x)
-                        self.counters[i] = 0
-                        self.fitness_values[i] = self.fitness_function(self.food_sources[i].fitness_val)  # noqa: E501
-                        break
+        best_index = int(np.argmin(
+            np.where(in_bounds, self.fitness_values, np.inf)
+        ))
+        best_fitness = self.fitness_values[best_index]
+        if in_bounds[best_index] and best_fitness < self.best_fitness:
+            self.best_fitness = float(best_fitness)
+            self.best_x = int(self.food_sources[best_index])
+            self.log.improvement(self._generation, self.best_fitness)
+
+        with self.profiler.phase('scout'):
+            self._scout_phase()
+        self.log.generation(
+            self._generation,
+            np.asarray(self.fitness_values),
+            np.array([source.x_loc for source in self.food_sources]),
+            self.fitness_function.evaluations,
+        )
+        self._generation += 1
 
-    def _employed_phase(self, *args, **kwds):
-        for i in range(self.nos):
-            neighbor = self.neighborhood(i)
-            self.bees['employed'][i] = Bee('employed', Foodsource(neighbor))
+    def __call__(self, *args, **kwds) -> list[Individual]:
+        self.step()
+        with self.profiler.phase('to_individuals'):
+            return self.fill_snapshot().to_individuals()
 
-            if (n_fit_val := self.fitness_function(neighbor)) < self.fitness_values[i]:  # noqa: E501
+    def _greedy_update(
+        self,
+        indices: list[int],
+        neighbors: list[int],
+    ) -> np.ndarray:
+        """Moves to better neighbors, returns the fitness of all neighbors"""
+        n_fit_vals = self.fitness_function.batch(
+            np.array(neighbors, dtype=np.int64)
+        )
+        for i, neighbor, n_fit_val in zip(
+            indices, neighbors, n_fit_vals.tolist()
+        ):
+            if n_fit_val < self.fitness_values[i]:
                 self.food_sources[i] = Foodsource(neighbor)
                 self.fitness_values[i] = n_fit_val
                 self.counters[i] = 0
             else:
                 self.counters[i] += 1
+        return n_fit_vals
+
+    def _scout_phase(self, *args, **kwds):
+        abandoned = [
+            i for i in range(self.nos) if self.counters[i] > self.limit
+        ]
+        if not abandoned:
+            return
+
+        for i in abandoned:
+            self.taboo_table.add(self.food_sources[i].x_loc)
+
+        new_xs = self.taboo_table.sample(len(abandoned))
+        new_fitness_values = self.fitness_function.batch(new_xs)
+        self.employed_positions[abandoned] = new_xs
+        self.employed_fitness[abandoned] = new_fitness_values
+        self.scouts[abandoned] = True
+        for i, new_x, fitness_val in zip(
+            abandoned, new_xs.tolist(), new_fitness_values.tolist()
+        ):
+            self.food_sources[i] = Foodsource(new_x)
+            self.counters[i] = 0
+            self.fitness_values[i] = fitness_val
 
-            # Generate bees to visualize
+    def _employed_phase(self, *args, **kwds):
+        neighbors = [self.neighborhood(i) for i in range(self.nos)]
+        self.employed_positions[:] = neighbors
+        self.scouts[:] = False
+
+        self.employed_fitness[:] = self._greedy_update(
+            list(range(self.nos)), neighbors
+        )
 
     def _generate_probabilities(self):
-        self.probs = np.array(self.fitness_values) / sum(self.fitness_values)
+        total = sum(self.fitness_values)
+        if total > 0:
+            self.probs = np.array(self.fitness_values) / total
+        else:
+            self.probs = np.full(self.nos, 1.0 / self.nos)
 
     def _onlooker_phase(self, *args, **kwds):
-        t = 0
-        i = 0
-        while t < self.nos:
-            if random.random() < self.probs[i]:
-                t += 1
-                neighbor = self.neighborhood(i)
-                self.bees['onlooker'][i] = Bee('onlooker', Foodsource(neighbor))
-
-                if (n_fit_val := self.fitness_function(neighbor)) < self.fitness_values[i]:  # noqa: E501
-                    self.food_sources[i] = Foodsource(neighbor)
-                    self.fitness_values[i] = n_fit_val
-                    self.counters[i] = 0
-                else:
-                    self.counters[i] += 1
-            i = (i + 1) % (self.nos - 1)
+        indices = selection.proportional(
+            self.probs, self.nos, rng=self.rng
+        ).tolist()
+        neighbors = [self.neighborhood(i) for i in indices]
+        self.onlooker_positions[indices] = neighbors
+
+        self.onlooker_fitness[indices] = self._greedy_update(
+            indices, neighbors
+        )
 
     def neighborhood(self, solution_index: int) -> int:
         solution = self.food_sources[solution_index].x_loc
         rand_solution_index = solution_index
 
         while rand_solution_index == solution_index:
-            rand_solution_index = random.randint(0, self.nos - 1)
+            rand_solution_index = int(self.rng.integers(0, self.nos))
 
         rand_solution = self.food_sources[rand_solution_index].x_loc
-        phi = random.uniform(-1, 1)
+        phi = self.rng.uniform(-1, 1)
         return int(solution + phi * (solution - rand_solution))
+
+
+class _ArrayColony(abc.ABC):
+    """Food sources, bees and phases of the colonies working on arrays.
+
+    Subclasses decide where sources start and scouts restart, how bees move
+    and which sources count as the best solution.
+    """
+
+    def __init__(
+        self,
+        number_of_solutions: int,
+        fitness_function: typing.Callable,
+        limit: int = 20,
+        show_bees: bool = False,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        if number_of_solutions < 2:
+            raise ValueError("At least two food sources are needed")
+
+        # Cached evaluations are never handed to the executor
+        fitness_function = as_batch(fitness_function, executor)
+        self.fitness_cache = (
+            FitnessCache(fitness_function, cache_size) if cache_size else None
+        )
+        if self.fitness_cache is not None:
+            fitness_function = self.fitness_cache
+
+        self.nos = number_of_solutions
+        self.fitness_function = as_batch(fitness_function)
+        self.rng = make_rng(rng)
+        self.limit = limit
+        self.show_bees = show_bees
+        self._generation = 0
+        self.log = RunLog()
+        self.profiler = Profiler()
+        self.snapshot = PopulationBuffer(3 * number_of_solutions, BEE_PALETTE)
+
+        self.positions = self._initial_positions()
+        self.fitness_values = self.fitness_function.batch(self.positions)
+        self.counters = np.zeros(self.nos, dtype=np.int64)
+        self.probs = np.full(self.nos, 1.0 / self.nos)
+        self._original_positions = self.positions.copy()
+        self._original_fitness = self.fitness_values.copy()
+
+        # Last visited positions, only used to visualize the bees
+        self.employed_positions = self.positions.copy()
+        self.onlooker_positions = self.positions.copy()
+        self.employed_fitness = self.fitness_values.copy()
+        self.onlooker_fitness = self.fitness_values.copy()
+        self.scouts = np.zeros(self.nos, dtype=bool)
+
+    @abc.abstractmethod
+    def _initial_positions(self) -> np.ndarray:
+        """Positions of the first food sources"""
+
+    @abc.abstractmethod
+    def _scout_positions(self, abandoned: np.ndarray) -> np.ndarray:
+        """New positions of the ``abandoned`` food sources"""
+
+    @abc.abstractmethod
+    def neighborhood(self, solution_indices: np.ndarray) -> np.ndarray:
+        """Positions the bees of ``solution_indices`` visit"""
+
+    @abc.abstractmethod
+    def _update_best(self) -> None:
+        """Keeps the best food source, logging an improvement"""
+
+    @abc.abstractmethod
+    def _best_x(self) -> float:
+        """Drawn coordinate of the best solution"""
+
+    @property
+    def original_population(self) -> list[Individual]:
+        return [
+            Individual(float(x), float(y))
+            for x, y in zip(
+                self._drawn(self._original_positions), self._original_fitness
+            )
+        ]
+
+    def _colony_state(self) -> dict:
+        return {
+            **checkpoint.common_state(self),
+            'positions': self.positions,
+            'fitness_values': self.fitness_values,
+            'counters': self.counters,
+            'probs': self.probs,
+            'original_positions': self._original_positions,
+            'original_fitness': self._original_fitness,
+            'employed_positions': self.employed_positions,
+            'onlooker_positions': self.onlooker_positions,
+            'employed_fitness': self.employed_fitness,
+            'onlooker_fitness': self.onlooker_fitness,
+            'scouts': self.scouts,
+        }
+
+    def _load_colony_state(self, state: dict) -> None:
+        checkpoint.load_common_state(self, state)
+        self.positions = state['positions'].copy()
+        self.fitness_values = state['fitness_values'].copy()
+        self.counters = state['counters'].copy()
+        self.probs = state['probs'].copy()
+        self._original_positions = state['original_positions'].copy()
+        self._original_fitness = state['original_fitness'].copy()
+        self.employed_positions = state['employed_positions'].copy()
+        self.onlooker_positions = state['onlooker_positions'].copy()
+        self.employed_fitness = state['employed_fitness'].copy()
+        self.onlooker_fitness = state['onlooker_fitness'].copy()
+        self.scouts = state['scouts'].copy()
+
+    def _greedy_update(
+        self,
+        indices: np.ndarray,
+        neighbors: np.ndarray,
+    ) -> np.ndarray:
+        """Moves to better neighbors, returns the fitness of all neighbors"""
+        n_fit_vals = self.fitness_function.batch(neighbors)
+        improved = n_fit_vals < self.fitness_values[indices]
+
+        np.add.at(self.counters, indices[~improved], 1)
+
+        # A source can be visited by several onlookers, keep the best visit
+        order = np.lexsort((n_fit_vals[improved], indices[improved]))
+        improved_indices = indices[improved][order]
+        first = np.ones(len(improved_indices), dtype=bool)
+        first[1:] = improved_indices[1:] != improved_indices[:-1]
+
+        winners = improved_indices[first]
+        self.positions[winners] = neighbors[improved][order][first]
+        self.fitness_values[winners] = n_fit_vals[improved][order][first]
+        self.counters[winners] = 0
+        return n_fit_vals
+
+    def _employed_phase(self) -> None:
+        indices = np.arange(self.nos)
+        neighbors = self.neighborhood(indices)
+        self.employed_positions = neighbors
+        self.scouts[:] = False
+        self.employed_fitness = self._greedy_update(indices, neighbors)
+
+    def _generate_probabilities(self) -> None:
+        total = self.fitness_values.sum()
+        if total > 0:
+            self.probs = self.fitness_values / total
+        else:
+            self.probs = np.full(self.nos, 1.0 / self.nos)
+
+    def _onlooker_phase(self) -> None:
+        indices = selection.proportional(self.probs, self.nos, rng=self.rng)
+        neighbors = self.neighborhood(indices)
+        self.onlooker_positions[indices] = neighbors
+        self.onlooker_fitness[indices] = self._greedy_update(
+            indices, neighbors
+        )
+
+    def _scout_phase(self) -> None:
+        abandoned = np.flatnonzero(self.counters > self.limit)
+        if len(abandoned) == 0:
+            return
+
+        new_positions = self._scout_positions(abandoned)
+        self.positions[abandoned] = new_positions
+        self.fitness_values[abandoned] = \
+            self.fitness_function.batch(new_positions)
+        self.counters[abandoned] = 0
+        self.employed_positions[abandoned] = new_positions
+        self.employed_fitness[abandoned] = self.fitness_values[abandoned]
+        self.scouts[abandoned] = True
+
+    def step(self) -> None:
+        with self.profiler.phase('employed'):
+            self._employed_phase()
+        with self.profiler.phase('onlooker'):
+            self._generate_probabilities()
+            self._onlooker_phase()
+
+        self._update_best()
+
+        with self.profiler.phase('scout'):
+            self._scout_phase()
+        self.log.generation(
+            self._generation,
+            self.fitness_values,
+            self.positions,
+            self.fitness_function.evaluations,
+        )
+        self._generation += 1
+
+    def _drawn(self, positions: np.ndarray) -> np.ndarray:
+        return positions
+
+    def fill_snapshot(
+        self,
+        out: PopulationBuffer | None = None,
+    ) -> PopulationBuffer:
+        """Writes food sources and bees into ``out`` or ``snapshot``"""
+        out = self.snapshot if out is None else out
+        out.clear()
+        out.extend(self._drawn(self.positions), self.fitness_values)
+        if self.show_bees:
+            _extend_bees(
+                out,
+                (
+                    self._drawn(self.employed_positions),
+                    self.employed_fitness,
+                ),
+                self.scouts,
+                (
+                    self._drawn(self.onlooker_positions),
+                    self.onlooker_fitness,
+                ),
+            )
+        out.generation = self._generation
+        out.best_x = float(self._best_x())
+        return out
+
+    def __call__(self, *args, **kwds) -> list[Individual]:
+        self.step()
+        with self.profiler.phase('to_individuals'):
+            return self.fill_snapshot().to_individuals()
+
+
+class VectorizedABCAlgo(_ArrayColony):
+    """Artificial bee colony operating on arrays instead of Foodsource lists.
+
+    Positions, fitness values, trial counters and probabilities of all food
+    sources are NumPy arrays and every phase updates all of them at once.
+    Unlike ``ABCAlgo`` the bees of one phase all start from the food sources
+    as they were at the beginning of that phase.
+    """
+
+    def __init__(
+        self,
+        number_of_solutions: int,
+        fitness_function: typing.Callable,
+        max_x: int = 100,
+        init_x: int = 0,
+        limit: int = 20,
+        show_bees: bool = False,
+        cache_size: int = 0,
+        executor: Executor | None = None,
+        taboo_capacity: int = 1024,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        self.max_x = max_x
+        self.rng = make_rng(rng)
+        self.taboo_table = TabooIndex(
+            max_x, capacity=taboo_capacity, rng=self.rng
+        )
+        super().__init__(
+            number_of_solutions,
+            fitness_function,
+            limit=limit,
+            show_bees=show_bees,
+            cache_size=cache_size,
+            executor=executor,
+            rng=self.rng,
+        )
+        # Kept per run, algorithms can run side by side in threads
+        self.best_x = init_x
+        self.best_fitness = float(
+            self.fitness_function.batch(np.array([init_x]))[0]
+        )
+
+    def _initial_positions(self) -> np.ndarray:
+        return self.rng.integers(0, self.max_x, size=self.nos, dtype=np.int64)
+
+    @property
+    def best_solution(self) -> Solution:
+        return Solution(np.array([self.best_x]), self.best_fitness)
+
+    def state_dict(self) -> dict:
+        return {
+            **self._colony_state(),
+            'best_x': self.best_x,
+            'best_fitness': self.best_fitness,
+            **{
+                f'taboo_{key}': value
+                for key, value in self.taboo_table.state_dict().items()
+            },
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        self._load_colony_state(state)
+        self.best_x = state['best_x'].item()
+        self.best_fitness = float(state['best_fitness'])
+        self.taboo_table.load_state_dict({
+            key[len('taboo_'):]: value
+            for key, value in state.items() if key.startswith('taboo_')
+        })
+
+    def neighborhood(self, solution_indices: np.ndarray) -> np.ndarray:
+        # Draw from all other sources without rejection sampling
+        partners = self.rng.integers(
+            0, self.nos - 1, size=len(solution_indices)
+        )
+        partners += partners >= solution_indices
+
+        solutions = self.positions[solution_indices]
+        phi = self.rng.uniform(-1, 1, size=len(solution_indices))
+        return (
+            solutions + phi * (solutions - self.positions[partners])
+        ).astype(np.int64)
+
+    def _scout_positions(self, abandoned: np.ndarray) -> np.ndarray:
+        for x in self.positions[abandoned].tolist():
+            self.taboo_table.add(x)
+        return self.taboo_table.sample(len(abandoned))
+
+    def _update_best(self) -> None:
+        # Solutions can jump out of screen
+        in_bounds = (self.positions >= 0) & (self.positions < self.max_x)
+        best_index = int(np.argmin(
+            np.where(in_bounds, self.fitness_values, np.inf)
+        ))
+        best_fitness = float(self.fitness_values[best_index])
+        if in_bounds[best_index] and best_fitness < self.best_fitness:
+            self.best_fitness = best_fitness
+            self.best_x = int(self.positions[best_index])
+            self.log.improvement(self._generation, best_fitness)
+
+    def _best_x(self) -> float:
+        return self.best_x
+
+
+class LandscapeABCAlgo(_ArrayColony):
+    """Artificial bee colony searching an N-dimensional landscape.
+
+    Food sources are rows of a ``(number_of_solutions, dimensions)`` array.
+    As in the original ABC every bee changes a single random dimension of
+    its source, moves are clipped to the landscape bounds and scouts restart
+    uniformly within them.
+    """
+
+    def __init__(
+        self,
+        number_of_solutions: int,
+        landscape: Landscape,
+        limit: int = 20,
+        show_bees: bool = False,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        self.landscape = landscape
+        super().__init__(
+            number_of_solutions,
+            fitness_function=landscape,
+            limit=limit,
+            show_bees=show_bees,
+            rng=rng,
+        )
+        best_index = int(np.argmin(self.fitness_values))
+        self.best_position = self.positions[best_index].copy()
+        self.best_fitness = float(self.fitness_values[best_index])
+
+    def _initial_positions(self) -> np.ndarray:
+        return self.landscape.sample(self.nos, rng=self.rng)
+
+    @property
+    def best_solution(self) -> Solution:
+        return Solution(self.best_position, self.best_fitness)
+
+    def state_dict(self) -> dict:
+        return {
+            **self._colony_state(),
+            'best_position': self.best_position,
+            'best_fitness': self.best_fitness,
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        self._load_colony_state(state)
+        self.best_position = state['best_position'].copy()
+        self.best_fitness = float(state['best_fitness'])
+
+    def neighborhood(self, solution_indices: np.ndarray) -> np.ndarray:
+        n_bees = len(solution_indices)
+        partners = self.rng.integers(0, self.nos - 1, size=n_bees)
+        partners += partners >= solution_indices
+        dims = self.rng.integers(0, self.landscape.dimensions, size=n_bees)
+
+        neighbors = self.positions[solution_indices].copy()
+        solutions = neighbors[np.arange(n_bees), dims]
+        phi = self.rng.uniform(-1, 1, size=n_bees)
+        neighbors[np.arange(n_bees), dims] = \
+            solutions + phi * (solutions - self.positions[partners, dims])
+        return self.landscape.clip(neighbors)
+
+    def _generate_probabilities(self) -> None:
+        # Fitness can be negative on user landscapes, weigh relative to best
+        weights = 1.0 / (1.0 + self.fitness_values - self.fitness_values.min())
+        self.probs = weights / weights.sum()
+
+    def _scout_positions(self, abandoned: np.ndarray) -> np.ndarray:
+        # Scouts restart uniformly within the bounds, nothing is taboo
+        return self.landscape.sample(len(abandoned), rng=self.rng)
+
+    def _update_best(self) -> None:
+        best_index = int(np.argmin(self.fitness_values))
+        if self.fitness_values[best_index] < self.best_fitness:
+            self.best_fitness = float(self.fitness_values[best_index])
+            self.best_position = self.positions[best_index].copy()
+            self.log.improvement(self._generation, self.best_fitness)
+
+    def _drawn(self, positions: np.ndarray) -> np.ndarray:
+        # Only the first dimension can be drawn
+        return positions[:, 0]
+
+    def _best_x(self) -> float:
+        return self.best_position[0]
@@ -0,0 +1,101 @@
+"""Taboo positions for relocating scout bees"""
+
+import bisect
+import collections
+import dataclasses
+import json
+
+import numpy as np
+
+from evo_sim.rng import make_rng
+
+
+@dataclasses.dataclass
+class TabooStats:
+    size: int = 0
+    peak_size: int = 0
+    insertions: int = 0
+    expirations: int = 0
+    samples: int = 0
+
+
+class TabooIndex:
+    """Taboo positions in ``[0, max_x)`` with sampling of the free positions.
+
+    A free position is drawn by drawing its rank among all free positions and
+    mapping the rank back with a binary search over the sorted taboo entries,
+    so sampling never retries. Once ``capacity`` entries are stored the oldest
+    one expires, memory does not depend on the size of the domain.
+    """
+
+    def __init__(
+        self,
+        max_x: int,
+        capacity: int = 1024,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        if max_x < 1:
+            raise ValueError(f"Domain has to contain a position, got {max_x}")
+
+        self.max_x = max_x
+        self.rng = make_rng(rng)
+        # At least one position always has to stay free
+        self.capacity = max(0, min(capacity, max_x - 1))
+        self.stats = TabooStats()
+        self._sorted: list[int] = []
+        self._insertion_order: collections.deque[int] = collections.deque()
+        self._offsets: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __contains__(self, x) -> bool:
+        i = bisect.bisect_left(self._sorted, x)
+        return i < len(self._sorted) and self._sorted[i] == x
+
+    def __iter__(self):
+        return iter(self._sorted)
+
+    def add(self, x: int) -> None:
+        x = int(x)
+        # Positions outside of the domain are never sampled anyway
+        if not 0 <= x < self.max_x or self.capacity == 0 or x in self:
+            return
+
+        bisect.insort(self._sorted, x)
+        self._insertion_order.append(x)
+        self.stats.insertions += 1
+
+        if len(self._sorted) > self.capacity:
+            oldest = self._insertion_order.popleft()
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+            self.stats.expirations += 1
+
+        self.stats.size = len(self._sorted)
+        self.stats.peak_size = max(self.stats.peak_size, self.stats.size)
+        self._offsets = None
+
+    def sample(self, size: int) -> np.ndarray:
+        if self._offsets is None:
+            # Number of free positions before every taboo entry
+            self._offsets = np.array(self._sorted, dtype=np.int64) \
+                - np.arange(len(self._sorted))
+
+        ranks = self.rng.integers(
+            0, self.max_x - len(self._sorted), size=size, dtype=np.int64
+        )
+        self.stats.samples += size
+        return ranks + np.searchsorted(self._offsets, ranks, side='right')
+
+    def state_dict(self) -> dict:
+        return {
+            'insertion_order': np.array(self._insertion_order, dtype=np.int64),
+            'stats': json.dumps(dataclasses.asdict(self.stats)),
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        insertion_order = state['insertion_order'].tolist()
+        self._insertion_order = collections.deque(insertion_order)
+        self._sorted = sorted(insertion_order)
+        self.stats = TabooStats(**json.loads(str(state['stats'])))
+        self._offsets = None
@@ -0,0 +1,183 @@
+"""Per-generation run telemetry streamed to append-only files.
+
+Algorithms report every generation to their ``RunLog``. Without a sink the
+log only keeps a summary of the improvements, with a sink every generation
+becomes a ``GenerationRecord`` written as JSON Lines or as fixed-width
+binary records, buffered in blocks so memory stays bounded.
+"""
+
+import dataclasses
+import json
+import pathlib
+import time
+import typing
+
+import numpy as np
+
+
+@dataclasses.dataclass
+class GenerationRecord:
+    generation: int
+    best_fitness: float
+    mean_fitness: float
+    worst_fitness: float
+    diversity: float
+    evaluations: int
+    step_time: float
+
+
+RECORD_DTYPE = np.dtype([
+    ('generation', np.int64),
+    ('best_fitness', np.float64),
+    ('mean_fitness', np.float64),
+    ('worst_fitness', np.float64),
+    ('diversity', np.float64),
+    ('evaluations', np.int64),
+    ('step_time', np.float64),
+])
+
+
+class Sink(typing.Protocol):
+
+    def write(self, record: GenerationRecord) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class JsonLinesSink:
+
+    def __init__(self, path: str | pathlib.Path) -> None:
+        self.path = pathlib.Path(path)
+        self._file = open(self.path, 'a')
+
+    def write(self, record: GenerationRecord) -> None:
+        self._file.write(json.dumps(dataclasses.asdict(record)) + '\n')
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BinarySink:
+    """Raw ``RECORD_DTYPE`` records, read back with ``read_binary_log``"""
+
+    def __init__(
+        self,
+        path: str | pathlib.Path,
+        buffer_size: int = 1024,
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self._file = open(self.path, 'ab')
+        self._buffer = np.empty(buffer_size, dtype=RECORD_DTYPE)
+        self._size = 0
+
+    def write(self, record: GenerationRecord) -> None:
+        self._buffer[self._size] = dataclasses.astuple(record)
+        self._size += 1
+        if self._size == len(self._buffer):
+            self.flush()
+
+    def flush(self) -> None:
+        self._buffer[:self._size].tofile(self._file)
+        self._file.flush()
+        self._size = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+
+SINKS: dict[str, typing.Callable[[str | pathlib.Path], Sink]] = {
+    'jsonl': JsonLinesSink,
+    'binary': BinarySink,
+}
+
+
+def open_sink(
+    path: str | pathlib.Path,
+    log_format: str | None = None,
+) -> Sink:
+    """Opens a sink, the format defaults to JSON Lines unless ``.bin``"""
+    if log_format is None:
+        log_format = (
+            'binary' if pathlib.Path(path).suffix == '.bin' else 'jsonl'
+        )
+
+    try:
+        return SINKS[log_format](path)
+    except KeyError:
+        raise ValueError(
+            f"Log format '{log_format}' not defined! "
+            f"Choose one of {list(SINKS)}"
+        )
+
+
+def read_binary_log(path: str | pathlib.Path) -> np.ndarray:
+    return np.fromfile(path, dtype=RECORD_DTYPE)
+
+
+def read_json_log(path: str | pathlib.Path) -> list[GenerationRecord]:
+    with open(path, 'r') as f:
+        return [GenerationRecord(**json.loads(line)) for line in f]
+
+
+class RunLog:
+    """Improvement summary and optional telemetry stream of one run"""
+
+    def __init__(self, sink: Sink | None = None) -> None:
+        self.sink = sink
+        # Keep the latest record even without a sink, e.g. for stopping
+        self.keep_last = False
+        self.last_record: GenerationRecord | None = None
+        self.improvements = 0
+        self.last_improvement: int | None = None
+        self.best_fitness: float | None = None
+        self._last_time = time.perf_counter()
+
+    def improvement(self, generation: int, fitness: float) -> None:
+        self.improvements += 1
+        self.last_improvement = generation
+        self.best_fitness = float(fitness)
+
+    def generation(
+        self,
+        generation: int,
+        fitness: np.ndarray,
+        positions: np.ndarray,
+        evaluations: int,
+    ) -> None:
+        """Records a generation, ``positions`` has individuals on axis 0.
+
+        The step time is the time since the previous record.
+        """
+        now = time.perf_counter()
+        step_time, self._last_time = now - self._last_time, now
+        if self.sink is None and not self.keep_last:
+            return
+
+        fitness = np.asarray(fitness, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+        self.last_record = GenerationRecord(
+            generation=generation,
+            best_fitness=float(fitness.min()),
+            mean_fitness=float(fitness.mean()),
+            worst_fitness=float(fitness.max()),
+            diversity=float(np.mean(np.std(positions, axis=0))),
+            evaluations=evaluations,
+            step_time=step_time,
+        )
+        if self.sink is not None:
+            self.sink.write(self.last_record)
+
+    def summary(self) -> dict:
+        return {
+            'improvements': self.improvements,
+            'last_improvement': self.last_improvement,
+            'best_fitness': self.best_fitness,
+        }
+
+    def close(self) -> None:
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
@@ -0,0 +1,347 @@
+"""Benchmarks of the algorithms with JSON baselines to catch regressions.
+
+Every case is timed ``repeats`` times and the fastest repeat is kept. Peak
+memory is measured in one extra repeat under ``tracemalloc``, so tracing
+does not distort the timings.
+"""
+
+import argparse
+import dataclasses
+import itertools
+import json
+import pathlib
+import platform
+import sys
+import time
+import tracemalloc
+import typing
+
+import numpy as np
+
+from evo_sim import algs, headless, sweep
+from evo_sim.algs.evo import BinaryPhenotype
+
+ENGINES = {
+    'evo': ['object', 'vectorized'],
+    'abc': ['object', 'vectorized'],
+}
+PHENOTYPE_OPERATIONS = ['from_int', 'int', 'crossover', 'flip_bit']
+POPULATION_SIZE_KEYS = {
+    'evo': 'evo.population-size',
+    'abc': 'abc.number-of-solutions',
+}
+
+# Fixed options of the algorithm cases, independent of settings.yaml so
+# baselines stay comparable. Cases only override engine and sizes.
+BENCHMARK_CONFIG = {
+    'evo': {
+        'mutation-rate': 0.2,
+        'population-size': 20,
+        'selection': 'roulette',
+        'elites': 2,
+        'engine': 'object',
+        'encoding': 'bits',
+    },
+    'abc': {
+        'number-of-solutions': 10,
+        'show-bees': False,
+        'limit': 100,
+        'taboo-capacity': 1024,
+        'engine': 'object',
+    },
+    'use-alg': 'evo',
+    'fitness-cache-size': 0,
+    'landscape-size': 1024,
+}
+
+# Rates where higher is better, everything else is lower is better
+RATES = {'generations_per_sec', 'evaluations_per_sec', 'operations_per_sec'}
+
+
+@dataclasses.dataclass
+class BenchmarkCase:
+    name: str
+    kind: typing.Literal['phenotype', 'algorithm']
+    params: dict
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    params: dict
+    seconds: float
+    metrics: dict[str, float]
+
+
+@dataclasses.dataclass
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else np.inf
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name} {self.metric}: {self.baseline:.4g} -> "
+            f"{self.current:.4g} ({self.ratio:.2f}x)"
+        )
+
+
+def phenotype_cases(
+    operations: list[str] = PHENOTYPE_OPERATIONS,
+    n_operations: int = 10_000,
+) -> list[BenchmarkCase]:
+    return [
+        BenchmarkCase(
+            name=f"phenotype/{operation}",
+            kind='phenotype',
+            params={'operation': operation, 'n': n_operations},
+        )
+        for operation in operations
+    ]
+
+
+def algorithm_cases(
+    population_sizes: list[int],
+    landscape_sizes: list[int],
+    generations: int = 50,
+    engines: dict[str, list[str]] = ENGINES,
+) -> list[BenchmarkCase]:
+    return [
+        BenchmarkCase(
+            name=(
+                f"{alg}/{engine}/population={population_size}"
+                f"/landscape={landscape_size}"
+            ),
+            kind='algorithm',
+            params={
+                'use-alg': alg,
+                f'{alg}.engine': engine,
+                POPULATION_SIZE_KEYS[alg]: population_size,
+                'landscape-size': landscape_size,
+                'generations': generations,
+            },
+        )
+        for (alg, alg_engines), population_size, landscape_size
+        in itertools.product(
+            engines.items(), population_sizes, landscape_sizes
+        )
+        for engine in alg_engines
+    ]
+
+
+def _phenotype_job(params: dict) -> typing.Callable[[], dict]:
+    n, operation = params['n'], params['operation']
+    rng = np.random.default_rng(0)
+    length = 20
+    values = rng.integers(0, 2 ** length, size=n).tolist()
+    phenotypes = [BinaryPhenotype.from_int(x, length) for x in values]
+    partners = phenotypes[1:] + phenotypes[:1]
+
+    operations = {
+        'from_int': lambda: [
+            BinaryPhenotype.from_int(x, length) for x in values
+        ],
+        'int': lambda: [int(p) for p in phenotypes],
+        'crossover': lambda: [p + q for p, q in zip(phenotypes, partners)],
+        'flip_bit': lambda: [p.flip_bit(rng=rng) for p in phenotypes],
+    }
+    operation_job = operations[operation]
+
+    def job() -> dict:
+        operation_job()
+        return {'operations': n}
+
+    return job
+
+
+def _algorithm_job(params: dict) -> typing.Callable[[], dict]:
+    params = dict(params)
+    generations = params.pop('generations')
+    config = sweep.apply_overrides(BENCHMARK_CONFIG, params)
+    _, hill_y = headless.create_landscape(
+        config['landscape-size'], rng=np.random.default_rng(0)
+    )
+
+    def job() -> dict:
+        # Every repeat runs the same generations
+        algo = headless.algorithm_from_config(
+            config,
+            algs.TableFitness(hill_y),
+            hill_y,
+            rng=np.random.default_rng(1),
+        )
+        evaluations = algo.fitness_function.evaluations
+        step = getattr(algo, 'step', algo)
+        for _ in range(generations):
+            step()
+        return {
+            'generations': generations,
+            'evaluations': algo.fitness_function.evaluations - evaluations,
+        }
+
+    return job
+
+
+def run_case(case: BenchmarkCase, repeats: int = 3) -> BenchmarkResult:
+    if case.kind == 'phenotype':
+        job = _phenotype_job(case.params)
+    else:
+        job = _algorithm_job(case.params)
+
+    best_time = np.inf
+    counts: dict = {}
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        counts = job()
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_bytes = tracemalloc.get_traced_memory()[0]
+    job()
+    peak_bytes = tracemalloc.get_traced_memory()[1] - start_bytes
+    if not was_tracing:
+        tracemalloc.stop()
+
+    best_time = max(best_time, 1e-9)
+    metrics = {
+        f"{name}_per_sec": count / best_time for name, count in counts.items()
+    }
+    metrics['peak_bytes'] = peak_bytes
+    return BenchmarkResult(case.name, case.params, best_time, metrics)
+
+
+def run_benchmarks(
+    cases: list[BenchmarkCase],
+    repeats: int = 3,
+) -> typing.Iterator[BenchmarkResult]:
+    for case in cases:
+        yield run_case(case, repeats=repeats)
+
+
+def save_baseline(
+    results: list[BenchmarkResult],
+    path: str | pathlib.Path,
+) -> None:
+    baseline = {
+        'machine': platform.platform(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'results': [dataclasses.asdict(result) for result in results],
+    }
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+
+
+def load_baseline(path: str | pathlib.Path) -> list[BenchmarkResult]:
+    with open(path, 'r') as f:
+        baseline = json.load(f)
+    return [BenchmarkResult(**result) for result in baseline['results']]
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    tolerance: float = 0.2,
+) -> list[Regression]:
+    """Metrics more than ``tolerance`` worse than in the baseline"""
+    baseline_by_name = {result.name: result for result in baseline}
+    regressions = []
+    for result in results:
+        if result.name not in baseline_by_name:
+            continue
+
+        baseline_metrics = baseline_by_name[result.name].metrics
+        for metric, current in result.metrics.items():
+            if metric not in baseline_metrics:
+                continue
+
+            before = baseline_metrics[metric]
+            if metric in RATES:
+                regressed = current < before * (1 - tolerance)
+            else:
+                regressed = current > before * (1 + tolerance)
+            if regressed:
+                regressions.append(
+                    Regression(result.name, metric, before, current)
+                )
+    return regressions
+
+
+def format_result(result: BenchmarkResult) -> str:
+    rates = ', '.join(
+        f"{metric.replace('_per_sec', '')}/s {value:,.0f}"
+        for metric, value in result.metrics.items()
+        if metric in RATES
+    )
+    peak_mib = result.metrics['peak_bytes'] / 2 ** 20
+    return f"{result.name}: {rates}, peak {peak_mib:.2f} MiB"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='sim-bench',
+        description='Benchmark the algorithms and compare to a baseline.',
+    )
+    parser.add_argument(
+        '--population-sizes', type=int, nargs='+', default=[10, 100, 1000]
+    )
+    parser.add_argument(
+        '--landscape-sizes', type=int, nargs='+', default=[1024]
+    )
+    parser.add_argument('--generations', type=int, default=50)
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument(
+        '--engines',
+        nargs='+',
+        default=None,
+        help="Engines to run as alg/engine, e.g. 'evo/vectorized'",
+    )
+    parser.add_argument('--skip-phenotype', action='store_true')
+    parser.add_argument('--save', type=pathlib.Path, default=None)
+    parser.add_argument('--baseline', type=pathlib.Path, default=None)
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    engines = ENGINES
+    if args.engines is not None:
+        engines = {}
+        for selected in args.engines:
+            alg, engine = selected.split('/')
+            engines.setdefault(alg, []).append(engine)
+
+    cases = [] if args.skip_phenotype else phenotype_cases()
+    cases += algorithm_cases(
+        args.population_sizes,
+        args.landscape_sizes,
+        generations=args.generations,
+        engines=engines,
+    )
+
+    results = []
+    for result in run_benchmarks(cases, repeats=args.repeats):
+        print(format_result(result), file=sys.stderr)
+        results.append(result)
+
+    if args.save is not None:
+        save_baseline(results, args.save)
+
+    if args.baseline is not None:
+        regressions = compare(
+            results, load_baseline(args.baseline), tolerance=args.tolerance
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
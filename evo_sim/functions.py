@@ -1,6 +1,16 @@
 import functools
 import numpy as np
-import random
+
+from evo_sim.rng import make_rng
+
+# Frequencies and amplitudes of the cosines summed up by hill
+HILL_COMPONENTS = ((2, 1.0), (7, 0.25), (20, 0.1), (0.5, 1.65))
+HILL_OFFSET = 2.0
+
+# Trig bases hold eight values per point, larger landscapes are evaluated in
+# chunks of this many points instead of being cached
+MAX_CACHED_POINTS = 2 ** 16
+DEFAULT_CHUNK_SIZE = 2 ** 18
 
 
 def cosine_part(*, amp: float, phi: float, f: float, n_points: int):
@@ -8,38 +18,130 @@ def cosine_part(*, amp: float, phi: float, f: float, n_points: int):
     return amp * np.cos(2 * np.pi * f * time + 2 * np.pi * phi)
 
 
-def hill(n_points: int, scale: float = 1.0, pos_y: float = 0.0):
-    f1 = 2
-    f2 = 7
-    f3 = 20
-    f4 = 0.5
-
-    _cosine_part = functools.partial(cosine_part, n_points=n_points)
-
-    part_1 = _cosine_part(
-        amp=1.0,
-        phi=random.random(),
-        f=f1,
-    )
-    part_2 = _cosine_part(
-        amp=0.25,
-        phi=random.random(),
-        f=f2,
-    )
-    part_3 = _cosine_part(
-        amp=0.1,
-        phi=random.random(),
-        f=f3,
-    )
-    part_4 = _cosine_part(
-        amp=1.65,
-        phi=random.random(),
-        f=f4,
-    )
-
-    cos_sum = part_1 + part_2 + part_3 + part_4 + 2
+def hill_phases(rng: np.random.Generator | None = None) -> list[float]:
+    rng = make_rng(rng)
+    return [rng.random() for _ in HILL_COMPONENTS]
+
+
+def hill_coefficients(phases: list[float]) -> np.ndarray:
+    # amp * cos(a + phi) = amp * cos(phi) * cos(a) - amp * sin(phi) * sin(a)
+    coefficients = np.empty(2 * len(HILL_COMPONENTS))
+    for i, ((_, amp), phi) in enumerate(zip(HILL_COMPONENTS, phases)):
+        coefficients[2 * i] = amp * np.cos(2 * np.pi * phi)
+        coefficients[2 * i + 1] = -amp * np.sin(2 * np.pi * phi)
+    return coefficients
+
+
+def trig_basis(positions: np.ndarray, n_points: int) -> np.ndarray:
+    """Cosine and sine of every hill frequency at ``positions``"""
+    time = np.asarray(positions, dtype=np.float64) / float(n_points)
+    basis = np.empty((2 * len(HILL_COMPONENTS), time.size))
+    for i, (f, _) in enumerate(HILL_COMPONENTS):
+        np.multiply(time.ravel(), 2 * np.pi * f, out=basis[2 * i])
+        np.sin(basis[2 * i], out=basis[2 * i + 1])
+        np.cos(basis[2 * i], out=basis[2 * i])
+    return basis.reshape((len(basis),) + time.shape)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_trig_basis(n_points: int) -> np.ndarray:
+    basis = trig_basis(np.arange(n_points), n_points)
+    basis.flags.writeable = False
+    return basis
+
+
+def hill_profile(
+    n_points: int,
+    phases: list[float],
+    start: int = 0,
+    stop: int | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Unnormalized hill between ``start`` and ``stop`` of ``n_points``"""
+    if stop is None:
+        stop = n_points
+
+    coefficients = hill_coefficients(phases)
+    if out is None:
+        out = np.empty(stop - start)
+
+    if start == 0 and stop == n_points and n_points <= MAX_CACHED_POINTS:
+        np.matmul(coefficients, _cached_trig_basis(n_points), out=out)
+    else:
+        for chunk_start in range(start, stop, MAX_CACHED_POINTS):
+            chunk_stop = min(chunk_start + MAX_CACHED_POINTS, stop)
+            basis = trig_basis(np.arange(chunk_start, chunk_stop), n_points)
+            np.matmul(
+                coefficients,
+                basis,
+                out=out[chunk_start - start:chunk_stop - start],
+            )
+
+    out += HILL_OFFSET
+    return np.abs(out, out=out)
+
+
+def hill(
+    n_points: int,
+    scale: float = 1.0,
+    pos_y: float = 0.0,
+    rng: np.random.Generator | None = None,
+):
+    cos_sum = hill_profile(n_points, hill_phases(rng))
 
     # Normalize
-    cos_sum = np.abs(cos_sum)
-    max_height = np.max(cos_sum)
-    return scale * (cos_sum / max_height) + pos_y
+    cos_sum *= scale / np.max(cos_sum)
+    cos_sum += pos_y
+    return cos_sum
+
+
+class LazyHill:
+    """The landscape of ``hill`` evaluated only at the requested positions.
+
+    Works as a fitness function like ``algs.TableFitness``, positions are
+    clamped to the domain. Only the normalization needs a pass over the
+    domain, it is done once in chunks.
+    """
+
+    batched = True
+
+    def __init__(
+        self,
+        n_points: int,
+        scale: float = 1.0,
+        pos_y: float = 0.0,
+        rng: np.random.Generator | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.n_points = n_points
+        self.scale = scale
+        self.pos_y = pos_y
+        self.phases = hill_phases(rng)
+        self.chunk_size = chunk_size
+        self._coefficients = hill_coefficients(self.phases)
+
+    def __len__(self) -> int:
+        return self.n_points
+
+    @functools.cached_property
+    def max_height(self) -> float:
+        out = np.empty(min(self.chunk_size, self.n_points))
+        max_height = 0.0
+        for start in range(0, self.n_points, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_points)
+            chunk = hill_profile(
+                self.n_points, self.phases, start, stop, out=out[:stop - start]
+            )
+            max_height = max(max_height, float(np.max(chunk)))
+        return max_height
+
+    def __call__(self, x):
+        x = np.clip(x, 0, self.n_points - 1)
+        values = np.asarray(np.tensordot(
+            self._coefficients, trig_basis(x, self.n_points), axes=1
+        ))
+        values += HILL_OFFSET
+        np.abs(values, out=values)
+        values *= self.scale / self.max_height
+        values += self.pos_y
+        return values[()] if values.ndim == 0 else values
@@ -0,0 +1,409 @@
+"""Render-less simulation runner, usable without pygame"""
+
+import argparse
+import dataclasses
+import functools
+import json
+import pathlib
+import sys
+import time
+import typing
+
+import numpy as np
+import yaml
+
+from evo_sim import algs, functions, landscapes, tables
+from evo_sim.algs import checkpoint, profiling, stopping, telemetry
+from evo_sim.rng import Seed, spawn_rngs
+
+WINDOW_WIDTH = 1024
+WINDOW_HEIGHT = 600
+DEFAULT_CONFIG = pathlib.Path(__file__).parent.parent / 'settings.yaml'
+
+
+@dataclasses.dataclass
+class RunResult:
+    algorithm: str
+    generations: int
+    # Landscapes have coordinates and no known global best position
+    best_x: int | list[float]
+    best_fitness: float
+    global_best_x: int | None
+    global_best_fitness: float | None
+    wall_time: float
+    evaluations: int = 0
+    generation_found: int = 0
+    stop_reason: str | None = None
+    log: dict = dataclasses.field(default_factory=dict)
+    fitness_cache: dict | None = None
+    profile: dict | None = None
+
+
+def load_config(path: str | pathlib.Path) -> dict:
+    path = pathlib.Path(path)
+    assert path.exists(), f"Config path {path.absolute()} does not exist!"
+    assert path.suffix == '.yaml', 'Only .yaml files are supported for config!'
+
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
+
+def create_landscape(
+    width: int = WINDOW_WIDTH,
+    height: int = WINDOW_HEIGHT,
+    rng: np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    hill_x = np.arange(width)
+    hill_y = functions.hill(
+        len(hill_x),
+        scale=height / 2.0,
+        pos_y=height / 4.0,
+        rng=rng,
+    )
+    return hill_x, hill_y
+
+
+def _encoding_options(evo_config: dict) -> dict:
+    options = {'points': evo_config.get('crossover-points', 2)}
+    if evo_config.get('crossover') is not None:
+        options['crossover'] = evo_config['crossover']
+    if evo_config.get('encoding', 'bits') in ('integer', 'real'):
+        options['sigma'] = evo_config.get('mutation-scale', 0.1)
+    return options
+
+
+def algorithm_from_config(
+    config: dict,
+    fitness_function,
+    hill_y,
+    rng: np.random.Generator | None = None,
+    init_x: int | None = None,
+):
+    # Scanning huge tables for their maximum is slow, pass it if known
+    if init_x is None:
+        init_x = int(np.argmax(hill_y))
+
+    if config['use-alg'] == 'evo':
+        engine = config['evo'].get('engine', 'object')
+        array_algorithm: typing.Callable[
+            ..., algs.VectorizedGeneticAlgorithm
+        ] | None
+        if engine == 'islands':
+            array_algorithm = functools.partial(
+                algs.IslandGeneticAlgorithm,
+                config['evo'].get('islands', 8),
+                migration_interval=config['evo'].get('migration-interval', 0),
+                migrants=config['evo'].get('migrants', 1),
+            )
+        elif engine == 'steady-state':
+            # Tables are scored in batches, more slots would not run
+            # concurrently without an executor
+            array_algorithm = functools.partial(
+                algs.SteadyStateGeneticAlgorithm,
+                replacement=config['evo'].get('replacement', 'worst'),
+            )
+        elif engine == 'vectorized':
+            array_algorithm = algs.VectorizedGeneticAlgorithm
+        else:
+            array_algorithm = None
+
+        encoding = config['evo'].get('encoding', 'bits')
+        genetic_algorithm: typing.Callable[
+            ..., algs.GeneticAlgorithm | algs.VectorizedGeneticAlgorithm
+        ]
+        if array_algorithm is not None:
+            genetic_algorithm = functools.partial(
+                array_algorithm,
+                encoding=encoding,
+                encoding_options=_encoding_options(config['evo']),
+            )
+        elif encoding != 'bits':
+            raise RuntimeError(
+                f"Encoding '{encoding}' needs an array engine, "
+                "the 'object' engine only uses bit strings"
+            )
+        else:
+            genetic_algorithm = algs.GeneticAlgorithm
+
+        return genetic_algorithm(
+            config['evo']['population-size'],
+            fitness_function=fitness_function,
+            max_x=len(hill_y),
+            init_x=init_x,
+            mutation_rate=config['evo']['mutation-rate'],
+            selection=config['evo'].get('selection', 'roulette'),
+            elites=config['evo'].get('elites', 2),
+            cache_size=config.get('fitness-cache-size', 0),
+            rng=rng,
+        )
+    elif config['use-alg'] == 'abc':
+        abc_algorithm: type[algs.ABCAlgo] | type[algs.VectorizedABCAlgo]
+        if config['abc'].get('engine', 'object') == 'vectorized':
+            abc_algorithm = algs.VectorizedABCAlgo
+        else:
+            abc_algorithm = algs.ABCAlgo
+
+        return abc_algorithm(
+            config['abc']['number-of-solutions'],
+            fitness_function=fitness_function,
+            max_x=len(hill_y),
+            init_x=init_x,
+            limit=config['abc']['limit'],
+            show_bees=config['abc']['show-bees'],
+            cache_size=config.get('fitness-cache-size', 0),
+            taboo_capacity=config['abc'].get('taboo-capacity', 1024),
+            rng=rng,
+        )
+    else:
+        raise RuntimeError(f"Algorithm '{config['use-alg']}' not defined!")
+
+
+def landscape_algorithm_from_config(
+    config: dict,
+    landscape: landscapes.Landscape,
+    rng: np.random.Generator | None = None,
+):
+    if config['use-alg'] == 'evo':
+        return algs.LandscapeGeneticAlgorithm(
+            config['evo']['population-size'],
+            landscape,
+            bits=config.get('landscape-bits', 16),
+            mutation_rate=config['evo']['mutation-rate'],
+            selection=config['evo'].get('selection', 'roulette'),
+            elites=config['evo'].get('elites', 2),
+            encoding=config['evo'].get('encoding', 'bits'),
+            encoding_options=_encoding_options(config['evo']),
+            rng=rng,
+        )
+    elif config['use-alg'] == 'abc':
+        return algs.LandscapeABCAlgo(
+            config['abc']['number-of-solutions'],
+            landscape,
+            limit=config['abc']['limit'],
+            show_bees=config['abc']['show-bees'],
+            rng=rng,
+        )
+    else:
+        raise RuntimeError(f"Algorithm '{config['use-alg']}' not defined!")
+
+
+def run_identity(
+    config: dict,
+    seed: Seed,
+    table_info: tables.TableInfo | None = None,
+) -> dict:
+    """What a checkpoint of this run has to have been saved with"""
+    alg = config['use-alg']
+    identity = {
+        'seed': seed.entropy
+        if isinstance(seed, np.random.SeedSequence) else seed,
+        'use-alg': alg,
+        alg: config.get(alg),
+        'fitness-cache-size': config.get('fitness-cache-size', 0),
+    }
+    if config.get('landscape'):
+        for key in ('landscape', 'landscape-dimensions', 'landscape-bits'):
+            identity[key] = config.get(key)
+    else:
+        identity['landscape-size'] = config.get('landscape-size', WINDOW_WIDTH)
+    if table_info is not None:
+        identity['landscape-table'] = dataclasses.asdict(table_info)
+    # Compared after a JSON round trip, like the stored identity
+    return json.loads(json.dumps(identity, default=str))
+
+
+def run(
+    config: dict,
+    stop_after: int | None = None,
+    seed: Seed = None,
+    log_path: str | pathlib.Path | None = None,
+    log_format: str | None = None,
+    profile: bool = False,
+    track_allocations: bool = False,
+    checkpoint_path: str | pathlib.Path | None = None,
+) -> RunResult:
+    if stop_after is None:
+        stop_after = config['stop-after']
+    if seed is None:
+        seed = config.get('seed')
+
+    landscape_rng, algorithm_rng = spawn_rngs(seed, 2)
+    n_points = config.get('landscape-size', WINDOW_WIDTH)
+    landscape = table_info = None
+    global_best_x: int | None
+    global_best_fitness: float | None
+    if config.get('landscape'):
+        landscape = landscapes.get_landscape(
+            config['landscape'], config.get('landscape-dimensions', 2)
+        )
+        algo = landscape_algorithm_from_config(
+            config, landscape, rng=algorithm_rng
+        )
+    elif config.get('landscape-table'):
+        # Only integer seeds name a stored table, others generate a new one
+        hill_y, table_info = tables.open_hill_table(
+            config['landscape-table'],
+            n_points,
+            scale=WINDOW_HEIGHT / 2.0,
+            pos_y=WINDOW_HEIGHT / 4.0,
+            seed=seed if isinstance(seed, int) else None,
+            rng=landscape_rng,
+        )
+        init_x, global_best_x = table_info.argmax, table_info.argmin
+    else:
+        _, hill_y = create_landscape(n_points, rng=landscape_rng)
+        init_x = int(np.argmax(hill_y))
+        # Rendered from top down, therefore visually max is our min
+        global_best_x = int(np.argmin(hill_y))
+
+    if landscape is None:
+        fitness_function = algs.TableFitness(hill_y)
+        algo = algorithm_from_config(
+            config, fitness_function, hill_y, rng=algorithm_rng, init_x=init_x
+        )
+
+    # Skip building the per-generation individuals if the engine allows it
+    step = getattr(algo, 'step', algo)
+
+    if checkpoint_path is None:
+        checkpoint_path = config.get('checkpoint')
+    checkpointer = None
+    if checkpoint_path is not None:
+        checkpointer = checkpoint.Checkpointer(
+            checkpoint_path,
+            config.get('checkpoint-interval', 100),
+            identity=run_identity(config, seed, table_info),
+        )
+        # Continue an interrupted run of the same settings
+        checkpointer.resume(algo)
+
+    if log_path is not None:
+        algo.log.sink = telemetry.open_sink(log_path, log_format)
+    if profile or track_allocations:
+        algo.profiler.enable(track_allocations=track_allocations)
+
+    criteria = stopping.from_config(config.get('stopping'), stop_after)
+    criteria.start(algo)
+
+    start_time = time.perf_counter()
+    try:
+        while criteria(algo) is None:
+            step()
+            if checkpointer is not None:
+                checkpointer(algo)
+    finally:
+        algo.log.close()
+        algo.profiler.disable()
+    wall_time = time.perf_counter() - start_time
+
+    evaluations = algo.fitness_function.evaluations
+    fitness_cache = getattr(algo, 'fitness_cache', None)
+
+    if landscape is None:
+        best_x = int(algo.best_x)
+        global_best_fitness = float(hill_y[global_best_x])
+    else:
+        best_x = algo.best_solution.position.tolist()
+        global_best_x, global_best_fitness = None, landscape.optimum
+
+    return RunResult(
+        algorithm=config['use-alg'],
+        generations=algo._generation,
+        best_x=best_x,
+        best_fitness=float(algo.best_solution.fitness_val),
+        global_best_x=global_best_x,
+        global_best_fitness=global_best_fitness,
+        wall_time=wall_time,
+        evaluations=evaluations,
+        generation_found=algo.log.last_improvement or 0,
+        stop_reason=criteria.stop_reason,
+        log=algo.log.summary(),
+        fitness_cache=(
+            dataclasses.asdict(fitness_cache.stats)
+            if fitness_cache is not None else None
+        ),
+        profile=(
+            algo.profiler.snapshot(evaluations).as_dict()
+            if profile or track_allocations else None
+        ),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='sim-headless',
+        description='Run evo-sim without rendering.',
+    )
+    parser.add_argument('--config', default=DEFAULT_CONFIG, type=pathlib.Path)
+    parser.add_argument('--alg', choices=['evo', 'abc'], default=None)
+    parser.add_argument('--stop-after', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--json', action='store_true', help='Print the result as JSON'
+    )
+    parser.add_argument(
+        '--log',
+        type=pathlib.Path,
+        default=None,
+        help='Append per-generation telemetry to this file',
+    )
+    parser.add_argument(
+        '--log-format',
+        choices=list(telemetry.SINKS),
+        default=None,
+        help="Telemetry format, 'binary' for .bin files and 'jsonl' otherwise",
+    )
+    parser.add_argument(
+        '--checkpoint',
+        type=pathlib.Path,
+        default=None,
+        help='Save the run here regularly and resume from it if it exists',
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Time the phases of the algorithm',
+    )
+    parser.add_argument(
+        '--profile-allocations',
+        action='store_true',
+        help='Also track allocations per phase, much slower',
+    )
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    if args.alg is not None:
+        config['use-alg'] = args.alg
+
+    result = run(
+        config,
+        stop_after=args.stop_after,
+        seed=args.seed,
+        log_path=args.log,
+        log_format=args.log_format,
+        profile=args.profile,
+        track_allocations=args.profile_allocations,
+        checkpoint_path=args.checkpoint,
+    )
+    if args.json:
+        print(json.dumps(dataclasses.asdict(result), indent=2))
+    else:
+        print(
+            f"{result.algorithm}: best solution {result.best_x} "
+            f"(fitness {result.best_fitness:.3f}) after "
+            f"{result.generations} generations in {result.wall_time:.3f}s "
+            f"({result.stop_reason})"
+        )
+        if result.global_best_x is not None:
+            print(
+                f"Global best solution: {result.global_best_x} "
+                f"(fitness {result.global_best_fitness:.3f})"
+            )
+        elif result.global_best_fitness is not None:
+            print(f"Global best fitness: {result.global_best_fitness:.3f}")
+        if result.profile is not None:
+            print(profiling.RunStats.from_dict(result.profile).report())
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,171 @@
+"""N-dimensional fitness landscapes.
+
+A landscape evaluates positions of shape ``(..., dimensions)`` and returns
+one fitness value per position, all landscapes are minimized. Discrete
+landscapes round positions to the nearest integer before evaluating them.
+"""
+
+import abc
+import typing
+
+import numpy as np
+
+from evo_sim.rng import make_rng
+
+
+class Landscape(abc.ABC):
+    batched = True
+    default_bounds: tuple[float, float] = (-5.12, 5.12)
+    optimum: float | None = 0.0
+
+    def __init__(
+        self,
+        dimensions: int,
+        bounds: tuple[float, float] | np.ndarray | None = None,
+        discrete: bool = False,
+    ) -> None:
+        if dimensions < 1:
+            raise ValueError(
+                f"Landscapes need at least one dimension, got {dimensions}"
+            )
+        if bounds is None:
+            bounds = self.default_bounds
+
+        # One (lower, upper) pair for all dimensions or one per dimension
+        bounds = np.broadcast_to(
+            np.asarray(bounds, dtype=np.float64), (dimensions, 2)
+        )
+        self.dimensions = dimensions
+        self.lower = bounds[:, 0].copy()
+        self.upper = bounds[:, 1].copy()
+        self.discrete = discrete
+        if discrete:
+            self.lower = np.ceil(self.lower)
+            self.upper = np.floor(self.upper)
+
+        if np.any(self.lower > self.upper):
+            raise ValueError("Lower bounds have to be below upper bounds")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(dimensions={self.dimensions})"
+
+    def __call__(self, x) -> np.ndarray:
+        x = np.asarray(x, dtype=np.float64)
+        if self.discrete:
+            x = np.round(x)
+        return self.evaluate(x)
+
+    @abc.abstractmethod
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        ...
+
+    def clip(self, x: np.ndarray) -> np.ndarray:
+        x = np.clip(x, self.lower, self.upper)
+        return np.round(x) if self.discrete else x
+
+    def sample(
+        self,
+        n_points: int,
+        rng: np.random.Generator | None = None,
+    ) -> np.ndarray:
+        """Draws positions uniformly from within the bounds"""
+        x = make_rng(rng).uniform(
+            self.lower, self.upper, size=(n_points, self.dimensions)
+        )
+        return self.clip(x)
+
+
+class Sphere(Landscape):
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        return np.sum(x ** 2, axis=-1)
+
+
+class Rastrigin(Landscape):
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        return 10.0 * x.shape[-1] + np.sum(
+            x ** 2 - 10.0 * np.cos(2 * np.pi * x), axis=-1
+        )
+
+
+class Rosenbrock(Landscape):
+    default_bounds = (-2.048, 2.048)
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        head, tail = x[..., :-1], x[..., 1:]
+        return np.sum(
+            100.0 * (tail - head ** 2) ** 2 + (1.0 - head) ** 2, axis=-1
+        )
+
+
+class Ackley(Landscape):
+    default_bounds = (-32.768, 32.768)
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        return (
+            -20.0 * np.exp(-0.2 * np.sqrt(np.mean(x ** 2, axis=-1)))
+            - np.exp(np.mean(np.cos(2 * np.pi * x), axis=-1))
+            + 20.0
+            + np.e
+        )
+
+
+class CallableLandscape(Landscape):
+    """Landscape around a user supplied function.
+
+    Unless ``vectorized`` is set the function is called once per position
+    with a 1-D array, vectorized functions get all positions at once.
+    """
+
+    optimum = None
+
+    def __init__(
+        self,
+        function: typing.Callable[[np.ndarray], typing.Any],
+        dimensions: int,
+        bounds: tuple[float, float] | np.ndarray,
+        discrete: bool = False,
+        vectorized: bool = False,
+        optimum: float | None = None,
+    ) -> None:
+        super().__init__(dimensions, bounds=bounds, discrete=discrete)
+        self.function = function
+        self.vectorized = vectorized
+        self.optimum = optimum
+
+    def evaluate(self, x: np.ndarray) -> np.ndarray:
+        if self.vectorized:
+            return np.asarray(self.function(x), dtype=np.float64)
+
+        rows = x.reshape(-1, x.shape[-1])
+        return np.fromiter(
+            (self.function(row) for row in rows),
+            dtype=np.float64,
+            count=len(rows),
+        ).reshape(x.shape[:-1])
+
+
+LANDSCAPES: dict[str, type[Landscape]] = {
+    'sphere': Sphere,
+    'rastrigin': Rastrigin,
+    'rosenbrock': Rosenbrock,
+    'ackley': Ackley,
+}
+
+
+def get_landscape(
+    landscape: str | Landscape,
+    dimensions: int = 2,
+    **kwargs,
+) -> Landscape:
+    if isinstance(landscape, Landscape):
+        return landscape
+
+    try:
+        return LANDSCAPES[landscape](dimensions, **kwargs)
+    except KeyError:
+        raise ValueError(
+            f"Landscape '{landscape}' not defined! "
+            f"Choose one of {list(LANDSCAPES)}"
+        )
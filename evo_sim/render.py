@@ -0,0 +1,73 @@
+"""Batched drawing of populations and a cached static background"""
+
+import numpy as np
+import pygame
+
+from evo_sim.algs.repr import PopulationBuffer
+
+
+class SpriteCache:
+    """Circle sprites per colour and radius, every one is drawn only once"""
+
+    def __init__(self) -> None:
+        self._sprites: dict[tuple, pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def get(self, colour, radius: int) -> pygame.Surface:
+        key = (tuple(colour), radius)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            size = 2 * radius + 1
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, colour, (radius, radius), radius)
+            # Blitting is fastest in the pixel format of the display
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()
+            self._sprites[key] = sprite
+        return sprite
+
+
+def draw_snapshot(
+    screen: pygame.Surface,
+    snapshot: PopulationBuffer,
+    scale: float,
+    sprites: SpriteCache,
+) -> None:
+    """Draws a snapshot straight from its columns with one ``blits`` call"""
+    size = len(snapshot)
+    radius = (snapshot.radius[:size] * scale).astype(np.int64)
+    left = snapshot.x[:size].astype(np.int64) - radius
+    top = snapshot.y[:size].astype(np.int64) - radius
+    palette = snapshot.palette
+    screen.blits(
+        [
+            (sprites.get(palette[colour], r), (x, y))
+            for colour, r, x, y in zip(
+                snapshot.colour[:size].tolist(),
+                radius.tolist(),
+                left.tolist(),
+                top.tolist(),
+            )
+        ],
+        doreturn=False,
+    )
+
+
+def render_background(
+    size: tuple[int, int],
+    colour,
+    draw,
+) -> pygame.Surface:
+    """Surface filled with ``colour`` and everything ``draw(surface)`` adds.
+
+    Static elements are drawn once onto it, every frame then starts with a
+    single blit of the background instead of drawing them again.
+    """
+    background = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        background = background.convert()
+    background.fill(colour)
+    draw(background)
+    return background
@@ -0,0 +1,20 @@
+"""Independent random number streams for reproducible runs"""
+
+import numpy as np
+
+Seed = int | list[int] | np.random.SeedSequence | None
+
+
+def make_rng(seed: Seed | np.random.Generator = None) -> np.random.Generator:
+    if isinstance(seed, np.random.Generator):
+        return seed
+
+    return np.random.default_rng(seed)
+
+
+def spawn_rngs(seed: Seed, n_streams: int) -> list[np.random.Generator]:
+    """Creates statistically independent generators derived from one seed"""
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+
+    return [np.random.default_rng(child) for child in seed.spawn(n_streams)]
@@ -0,0 +1,200 @@
+"""Parameter sweeps running independent headless simulations in parallel"""
+
+import argparse
+import copy
+import csv
+import itertools
+import multiprocessing
+import pathlib
+import sys
+import typing
+
+from evo_sim import headless
+from evo_sim.algs import profiling
+
+RESULT_FIELDS = [
+    'run',
+    'seed',
+    'algorithm',
+    'best_x',
+    'best_fitness',
+    'global_best_fitness',
+    'generation_found',
+    'generations',
+    'stop_reason',
+    'wall_time',
+    'evaluations',
+]
+
+
+def set_option(config: dict, key: str, value) -> None:
+    """Sets a nested option, levels are separated by dots ('evo.limit')"""
+    *parents, name = key.split('.')
+    for parent in parents:
+        config = config.setdefault(parent, {})
+    config[name] = value
+
+
+def apply_overrides(base_config: dict, overrides: dict) -> dict:
+    config = copy.deepcopy(base_config)
+    for key, value in overrides.items():
+        set_option(config, key, value)
+    return config
+
+
+def expand_grid(grid: dict[str, list]) -> list[dict]:
+    keys = list(grid)
+    return [
+        dict(zip(keys, values))
+        for values in itertools.product(*(grid[key] for key in keys))
+    ]
+
+
+def _run_job(job: tuple[int, dict, dict, int, int | None, bool]) -> dict:
+    run_id, config, overrides, seed, stop_after, profile = job
+    if config.get('checkpoint'):
+        # Every run resumes from its own checkpoint
+        path = pathlib.Path(config['checkpoint'])
+        config['checkpoint'] = str(
+            path.with_name(f"{path.stem}-{run_id}{path.suffix}")
+        )
+    result = headless.run(
+        config, stop_after=stop_after, seed=seed, profile=profile
+    )
+    row = {
+        'run': run_id,
+        'seed': seed,
+        **overrides,
+        'algorithm': result.algorithm,
+        'best_x': result.best_x,
+        'best_fitness': result.best_fitness,
+        'global_best_fitness': result.global_best_fitness,
+        'generation_found': result.generation_found,
+        'generations': result.generations,
+        'stop_reason': result.stop_reason,
+        'wall_time': result.wall_time,
+        'evaluations': result.evaluations,
+    }
+    if result.profile is not None:
+        row['profile'] = result.profile
+    return row
+
+
+def run_sweep(
+    base_config: dict,
+    overrides: list[dict],
+    seeds: list[int],
+    processes: int | None = None,
+    stop_after: int | None = None,
+    profile: bool = False,
+) -> typing.Iterator[dict]:
+    """Runs every override set with every seed, in completion order.
+
+    With ``profile`` every row also has the ``RunStats`` of its run as a
+    dict under 'profile'.
+    """
+    jobs = [
+        (run_id, apply_overrides(base_config, override), override, seed,
+         stop_after, profile)
+        for run_id, (override, seed) in enumerate(
+            itertools.product(overrides, seeds)
+        )
+    ]
+
+    if processes == 1:
+        yield from map(_run_job, jobs)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(_run_job, jobs)
+
+
+def collect_profiles(
+    rows: typing.Iterable[dict],
+    stats: list[profiling.RunStats],
+) -> typing.Iterator[dict]:
+    """Moves the profiles of ``rows`` into ``stats``, yields the rows"""
+    for row in rows:
+        profile = row.pop('profile', None)
+        if profile is not None:
+            stats.append(profiling.RunStats.from_dict(profile))
+        yield row
+
+
+def write_results(
+    rows: typing.Iterable[dict],
+    path: str | pathlib.Path | None,
+    option_keys: list[str],
+) -> int:
+    fields = RESULT_FIELDS[:2] + option_keys + RESULT_FIELDS[2:]
+    output = open(path, 'w', newline='') if path is not None else sys.stdout
+    try:
+        writer = csv.DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        n_rows = 0
+        for row in rows:
+            writer.writerow(row)
+            output.flush()
+            n_rows += 1
+    finally:
+        if path is not None:
+            output.close()
+    return n_rows
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='sim-sweep',
+        description='Run a parameter sweep of headless simulations.',
+    )
+    parser.add_argument(
+        'sweep',
+        type=pathlib.Path,
+        help="YAML file with a 'grid' and/or 'runs' of options and 'seeds'",
+    )
+    parser.add_argument(
+        '--config', default=headless.DEFAULT_CONFIG, type=pathlib.Path
+    )
+    parser.add_argument('--output', type=pathlib.Path, default=None)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--stop-after', type=int, default=None)
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Time the phases of every run and report them summed up',
+    )
+    args = parser.parse_args(argv)
+
+    base_config = headless.load_config(args.config)
+    sweep = headless.load_config(args.sweep)
+
+    overrides = sweep.get('runs', [])
+    if 'grid' in sweep or not overrides:
+        overrides = expand_grid(sweep.get('grid', {})) + overrides
+    seeds = sweep.get('seeds', [0])
+    option_keys = list(dict.fromkeys(
+        key for override in overrides for key in override
+    ))
+
+    rows = run_sweep(
+        base_config,
+        overrides,
+        seeds,
+        processes=args.processes,
+        stop_after=args.stop_after,
+        profile=args.profile,
+    )
+    stats: list[profiling.RunStats] = []
+    n_rows = write_results(
+        collect_profiles(rows, stats), args.output, option_keys
+    )
+    print(f"Finished {n_rows} runs", file=sys.stderr)
+    if args.profile:
+        # Results may go to stdout, keep the report out of the table
+        total = profiling.RunStats.aggregate(stats)
+        print(f"Profile of {total.runs} runs:", file=sys.stderr)
+        print(total.report(), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,175 @@
+"""Precomputed landscape tables stored as memory-mapped .npy files.
+
+Tables are generated chunk by chunk straight into the file, so neither
+generating nor reading them needs memory proportional to the domain. A JSON
+file next to the table records what it was generated from together with its
+extrema, reopening a matching table does not touch its contents.
+
+The seed and size are part of the file name and tables are generated into a
+temporary file that replaces the table at once, so a table another process
+has memory-mapped is never rewritten in place.
+"""
+
+import contextlib
+import dataclasses
+import json
+import os
+import pathlib
+import tempfile
+
+import numpy as np
+
+from evo_sim import functions
+
+DEFAULT_CHUNK_SIZE = functions.DEFAULT_CHUNK_SIZE
+
+
+@dataclasses.dataclass
+class TableInfo:
+    n_points: int
+    scale: float
+    pos_y: float
+    seed: int | None
+    argmin: int = 0
+    argmax: int = 0
+    min: float = 0.0
+    max: float = 0.0
+
+    def matches(self, other: 'TableInfo') -> bool:
+        # Tables of random landscapes can not be reproduced
+        return self.seed is not None and (
+            (self.n_points, self.scale, self.pos_y, self.seed)
+            == (other.n_points, other.scale, other.pos_y, other.seed)
+        )
+
+
+def table_file(
+    path: str | pathlib.Path,
+    n_points: int,
+    seed: int | None,
+) -> pathlib.Path:
+    """File of the table for ``seed`` and ``n_points`` next to ``path``"""
+    path = pathlib.Path(path)
+    seed_part = 'random' if seed is None else f'seed{seed}'
+    return path.with_name(f'{path.stem}-{seed_part}-n{n_points}{path.suffix}')
+
+
+def info_path(path: str | pathlib.Path) -> pathlib.Path:
+    return pathlib.Path(path).with_suffix('.json')
+
+
+@contextlib.contextmanager
+def _replacing(path: pathlib.Path):
+    """Temporary file in the directory of ``path`` that replaces it once the
+    block is left without an error"""
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp'
+    )
+    os.close(fd)
+    try:
+        yield pathlib.Path(tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+
+
+def read_info(path: str | pathlib.Path) -> TableInfo | None:
+    try:
+        with open(info_path(path), 'r') as f:
+            return TableInfo(**json.load(f))
+    except (FileNotFoundError, TypeError, ValueError):
+        return None
+
+
+def generate_hill_table(
+    path: str | pathlib.Path,
+    info: TableInfo,
+    rng: np.random.Generator | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> TableInfo:
+    """Writes ``functions.hill`` with ``info.n_points`` points to ``path``.
+
+    The values equal those of ``functions.hill`` with the same arguments and
+    random generator. An existing file at ``path`` is replaced, not
+    rewritten.
+    """
+    path = pathlib.Path(path)
+    with _replacing(path) as tmp_path:
+        info = _write_hill_table(tmp_path, info, rng, chunk_size)
+    with _replacing(info_path(path)) as tmp_info_path:
+        with open(tmp_info_path, 'w') as f:
+            json.dump(dataclasses.asdict(info), f, indent=2)
+    return info
+
+
+def _write_hill_table(
+    path: pathlib.Path,
+    info: TableInfo,
+    rng: np.random.Generator | None,
+    chunk_size: int,
+) -> TableInfo:
+    n_points = info.n_points
+    phases = functions.hill_phases(rng)
+    table = np.lib.format.open_memmap(
+        path, mode='w+', dtype=np.float64, shape=(n_points,)
+    )
+
+    # The profile has to be complete before it can be normalized
+    argmin = argmax = 0
+    min_height, max_height = np.inf, -np.inf
+    for start in range(0, n_points, chunk_size):
+        stop = min(start + chunk_size, n_points)
+        chunk = functions.hill_profile(
+            n_points, phases, start, stop, out=table[start:stop]
+        )
+
+        chunk_argmin = int(np.argmin(chunk))
+        chunk_argmax = int(np.argmax(chunk))
+        if chunk[chunk_argmin] < min_height:
+            argmin, min_height = start + chunk_argmin, chunk[chunk_argmin]
+        if chunk[chunk_argmax] > max_height:
+            argmax, max_height = start + chunk_argmax, chunk[chunk_argmax]
+
+    for start in range(0, n_points, chunk_size):
+        stop = min(start + chunk_size, n_points)
+        table[start:stop] = \
+            info.scale * (table[start:stop] / max_height) + info.pos_y
+
+    table.flush()
+    del table
+
+    info = dataclasses.replace(info, argmin=argmin, argmax=argmax)
+    table = np.load(path, mmap_mode='r')
+    info.min = float(table[argmin])
+    info.max = float(table[argmax])
+    return info
+
+
+def open_hill_table(
+    path: str | pathlib.Path,
+    n_points: int,
+    scale: float = 1.0,
+    pos_y: float = 0.0,
+    seed: int | None = None,
+    rng: np.random.Generator | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> tuple[np.ndarray, TableInfo]:
+    """Opens the hill table for ``path`` read only, generating it if needed.
+
+    ``seed`` identifies the landscape, the table is stored in ``table_file``
+    and a table stored for the same seed and shape is reused as is. ``rng``
+    generates the landscape otherwise.
+    """
+    path = table_file(path, n_points, seed)
+    wanted = TableInfo(n_points, float(scale), float(pos_y), seed)
+
+    info = read_info(path)
+    if info is None or not path.exists() or not wanted.matches(info):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        info = generate_hill_table(
+            path, wanted, rng=rng, chunk_size=chunk_size
+        )
+
+    return np.load(path, mmap_mode='r'), info
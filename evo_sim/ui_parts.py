@@ -27,8 +27,9 @@ class Button:
         self.surface.blit(self.text, (0, 0))
         self.rect = pygame.Rect(self.x, self.y, self.size[0], self.size[1])
 
-    def show(self) -> None:
-        self.screen.blit(self.surface, (self.x, self.y))
+    def show(self, screen=None) -> None:
+        screen = self.screen if screen is None else screen
+        screen.blit(self.surface, (self.x, self.y))
 
     def click(self, event, *callback_args) -> None:
         x, y = pygame.mouse.get_pos()
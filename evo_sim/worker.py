@@ -0,0 +1,111 @@
+"""Background thread stepping an algorithm apart from the render loop.
+
+The worker owns the algorithm while it runs: it steps it, checks the
+stopping criteria and fills a snapshot buffer of every generation. Two
+buffers are swapped, the renderer reads the latest one while the next one
+is filled, so drawing never waits for the algorithm and the algorithm never
+waits for a frame unless it is throttled to a number of generations per
+frame.
+"""
+
+import contextlib
+import threading
+import typing
+
+from evo_sim.algs import stopping
+from evo_sim.algs.repr import PopulationBuffer
+
+
+class SimulationWorker:
+    """Steps ``algo`` in a daemon thread until ``criteria`` fire.
+
+    With ``generations_per_frame`` of 0 the algorithm runs as fast as it
+    can, otherwise every ``frame()`` allows that many more generations.
+    """
+
+    def __init__(
+        self,
+        algo,
+        criteria: stopping.StoppingCriteria,
+        generations_per_frame: int = 1,
+    ) -> None:
+        if generations_per_frame < 0:
+            raise ValueError(
+                "Generations per frame can not be negative, "
+                f"got {generations_per_frame}"
+            )
+
+        self.algo = algo
+        self.criteria = criteria
+        self.generations_per_frame = generations_per_frame
+        self.done = threading.Event()
+        self._stop = threading.Event()
+        self._budget = 0
+        self._budget_changed = threading.Condition()
+        self._swap = threading.Lock()
+        self._front = algo.fill_snapshot(PopulationBuffer())
+        self._back = PopulationBuffer()
+        self._thread = threading.Thread(
+            target=self._run, name='evo-sim-worker', daemon=True
+        )
+
+    @property
+    def stop_reason(self) -> str | None:
+        return self.criteria.stop_reason
+
+    @property
+    def started(self) -> bool:
+        return self._thread.ident is not None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        with self._budget_changed:
+            self._budget_changed.notify()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    @contextlib.contextmanager
+    def latest(self) -> typing.Iterator[PopulationBuffer]:
+        """Latest snapshot, it is not replaced until the block is left"""
+        with self._swap:
+            yield self._front
+
+    def frame(self) -> None:
+        """Lets a throttled worker run the next generations"""
+        if self.generations_per_frame == 0:
+            return
+        with self._budget_changed:
+            self._budget = self.generations_per_frame
+            self._budget_changed.notify()
+
+    def _wait_for_budget(self) -> bool:
+        if self.generations_per_frame == 0:
+            return True
+        with self._budget_changed:
+            self._budget_changed.wait_for(
+                lambda: self._budget > 0 or self._stop.is_set()
+            )
+            if self._stop.is_set():
+                return False
+            self._budget -= 1
+            return True
+
+    def _run(self) -> None:
+        # Skip building the per-generation individuals
+        step = getattr(self.algo, 'step', self.algo)
+        try:
+            self.criteria.start(self.algo)
+            while not self._stop.is_set():
+                if self.criteria(self.algo) is not None:
+                    break
+                if not self._wait_for_budget():
+                    break
+                step()
+                self.algo.fill_snapshot(self._back)
+                with self._swap:
+                    self._front, self._back = self._back, self._front
+        finally:
+            self.done.set()
@@ -0,0 +1,59 @@
+import dataclasses
+
+import pytest
+
+from evo_sim import bench
+
+
+@pytest.fixture
+def results():
+    cases = bench.phenotype_cases(['int'], n_operations=10)
+    cases += bench.algorithm_cases([10], [64], generations=2)
+    return list(bench.run_benchmarks(cases, repeats=1))
+
+
+def test_run_benchmarks(results):
+    assert 5 == len(results)
+    for result in results:
+        assert result.metrics['peak_bytes'] >= 0
+        assert result.seconds > 0
+    assert all(
+        'generations_per_sec' in result.metrics
+        for result in results if result.params.get('use-alg')
+    )
+
+
+def test_algorithm_cases_ignore_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        bench.headless, 'DEFAULT_CONFIG', tmp_path / 'missing.yaml'
+    )
+    case = bench.algorithm_cases([10], [64], generations=2)[0]
+
+    result = bench.run_case(case, repeats=1)
+
+    assert 'generations_per_sec' in result.metrics
+    assert 0 == bench.BENCHMARK_CONFIG['fitness-cache-size']
+
+
+def test_baseline_round_trip(results, tmp_path):
+    path = tmp_path / 'baseline.json'
+
+    bench.save_baseline(results, path)
+
+    assert results == bench.load_baseline(path)
+
+
+def test_compare_flags_regressions(results):
+    result = results[-1]
+    slower = dataclasses.replace(result, metrics={
+        **result.metrics,
+        'generations_per_sec': result.metrics['generations_per_sec'] / 2,
+        'peak_bytes': result.metrics['peak_bytes'] * 2 + 1024,
+    })
+
+    regressions = bench.compare([slower], [result], tolerance=0.2)
+
+    assert {'generations_per_sec', 'peak_bytes'} == {
+        regression.metric for regression in regressions
+    }
+    assert [] == bench.compare([result], [slower], tolerance=0.2)
@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from evo_sim import headless, landscapes
+from evo_sim.algs import (
+    ABCAlgo,
+    GeneticAlgorithm,
+    IslandGeneticAlgorithm,
+    LandscapeABCAlgo,
+    LandscapeGeneticAlgorithm,
+    SteadyStateGeneticAlgorithm,
+    TableFitness,
+    VectorizedABCAlgo,
+    VectorizedGeneticAlgorithm,
+    checkpoint,
+)
+
+TABLE = np.abs(np.linspace(-50.0, 50.0, num=101)) + 1.0
+
+
+def make_algorithms():
+    fitness = TableFitness(TABLE)
+    rng = np.random.default_rng(3)
+    return {
+        'ga': GeneticAlgorithm(
+            10, fitness, max_x=101, cache_size=16, rng=rng
+        ),
+        'vectorized_ga': VectorizedGeneticAlgorithm(
+            10, fitness, max_x=101, rng=rng
+        ),
+        'island_ga': IslandGeneticAlgorithm(
+            3, 10, fitness, max_x=101, migration_interval=2, rng=rng
+        ),
+        'steady_state_ga': SteadyStateGeneticAlgorithm(
+            10, fitness, max_x=101, replacement='oldest', slots=3, rng=rng
+        ),
+        'landscape_ga': LandscapeGeneticAlgorithm(
+            10, landscapes.Rastrigin(4), rng=rng
+        ),
+        'abc': ABCAlgo(6, fitness, max_x=101, limit=2, rng=rng),
+        'vectorized_abc': VectorizedABCAlgo(
+            6, fitness, max_x=101, limit=2, rng=rng
+        ),
+        'landscape_abc': LandscapeABCAlgo(
+            6, landscapes.Sphere(3), limit=2, rng=rng
+        ),
+    }
+
+
+def assert_same_state(expected, actual):
+    assert expected.keys() == actual.keys()
+    for key in expected:
+        assert np.array_equal(expected[key], actual[key]), key
+
+
+@pytest.mark.parametrize('name', list(make_algorithms()))
+def test_resume_is_identical(name, tmp_path):
+    path = tmp_path / 'checkpoint.npz'
+    algo = make_algorithms()[name]
+    step = getattr(algo, 'step', algo)
+    for _ in range(5):
+        step()
+
+    checkpoint.save_checkpoint(algo, path)
+    for _ in range(10):
+        step()
+
+    resumed = make_algorithms()[name]
+    checkpoint.load_checkpoint(resumed, path)
+    assert 5 == resumed._generation
+    resumed_step = getattr(resumed, 'step', resumed)
+    for _ in range(10):
+        resumed_step()
+
+    assert_same_state(algo.state_dict(), resumed.state_dict())
+
+
+def test_checkpoint_of_other_algorithm(tmp_path):
+    path = tmp_path / 'checkpoint.npz'
+    algorithms = make_algorithms()
+    checkpoint.save_checkpoint(algorithms['ga'], path)
+
+    with pytest.raises(ValueError):
+        checkpoint.load_checkpoint(algorithms['vectorized_ga'], path)
+
+
+def test_checkpoint_of_other_run(tmp_path):
+    path = tmp_path / 'checkpoint.npz'
+    checkpoint.save_checkpoint(
+        make_algorithms()['ga'], path, {'seed': 1, 'landscape-size': 101}
+    )
+
+    with pytest.raises(ValueError, match='seed'):
+        checkpoint.load_checkpoint(
+            make_algorithms()['ga'],
+            path,
+            {'seed': 2, 'landscape-size': 101},
+        )
+    with pytest.raises(ValueError):
+        checkpoint.load_checkpoint(make_algorithms()['ga'], path)
+
+
+def test_checkpointer_interval(tmp_path):
+    algo = make_algorithms()['vectorized_ga']
+    checkpointer = checkpoint.Checkpointer(tmp_path / 'run.npz', 3)
+
+    saved = []
+    for _ in range(7):
+        algo.step()
+        saved.append(checkpointer(algo))
+
+    assert [2, 5] == np.flatnonzero(saved).tolist()
+    assert not (tmp_path / 'run.npz.tmp').exists()
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_headless_resume(alg, tmp_path):
+    config = headless.load_config(headless.DEFAULT_CONFIG)
+    config['use-alg'] = alg
+    config['checkpoint-interval'] = 10
+    path = tmp_path / 'run.npz'
+
+    uninterrupted = headless.run(config, stop_after=40)
+    headless.run(config, stop_after=20, checkpoint_path=path)
+    resumed = headless.run(config, stop_after=40, checkpoint_path=path)
+
+    assert uninterrupted.best_x == resumed.best_x
+    assert uninterrupted.log == resumed.log
+    assert uninterrupted.evaluations == resumed.evaluations
+
+
+@pytest.mark.parametrize('changes', [
+    {'seed': 7},
+    {'landscape-size': 512},
+    {'evo': {'population-size': 30}},
+])
+def test_headless_refuses_other_run(changes, tmp_path):
+    config = headless.load_config(headless.DEFAULT_CONFIG)
+    config['checkpoint-interval'] = 5
+    path = tmp_path / 'run.npz'
+    headless.run(config, stop_after=10, checkpoint_path=path)
+
+    for key, value in changes.items():
+        if isinstance(value, dict):
+            value = {**config[key], **value}
+        config[key] = value
+
+    with pytest.raises(ValueError):
+        headless.run(config, stop_after=20, checkpoint_path=path)
+
+
+def test_headless_refuses_other_table(tmp_path):
+    config = headless.load_config(headless.DEFAULT_CONFIG)
+    config['landscape-table'] = str(tmp_path / 'hill.npy')
+    config['landscape-size'] = 300
+    config['checkpoint-interval'] = 5
+    path = tmp_path / 'run.npz'
+    headless.run(config, stop_after=10, checkpoint_path=path)
+
+    config['landscape-table'] = str(tmp_path / 'other' / 'hill.npy')
+    resumed = headless.run(config, stop_after=20, checkpoint_path=path)
+    assert 20 == resumed.generations
+
+    config['seed'] = None
+    with pytest.raises(ValueError):
+        headless.run(config, stop_after=20, checkpoint_path=path)
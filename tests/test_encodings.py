@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from evo_sim.algs import encodings
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+@pytest.mark.parametrize('name', list(encodings.ENCODINGS))
+def test_discrete_round_trip(name):
+    encoding = encodings.get_encoding(name, -3, 60, discrete=True)
+    positions = np.arange(-3, 61).reshape(-1, 1)
+
+    decoded = encoding.decode(encoding.encode(positions))
+
+    assert positions.tolist() == decoded.tolist()
+
+
+@pytest.mark.parametrize('name', list(encodings.ENCODINGS))
+def test_random_within_bounds(name, rng):
+    encoding = encodings.get_encoding(name, [-1.0, 0.0], [1.0, 10.0])
+
+    genomes = encoding.random((3, 50), rng)
+    positions = encoding.decode(genomes)
+
+    assert (3, 50, 2) == genomes.shape
+    assert encoding.dtype == genomes.dtype
+    assert np.all(positions >= encoding.lower)
+    assert np.all(positions <= encoding.upper)
+
+
+def test_gray_neighbours_differ_in_one_bit():
+    encoding = encodings.GrayEncoding(0, 255, discrete=True)
+
+    genomes = encoding.encode(np.arange(256))
+    changed = genomes[1:] ^ genomes[:-1]
+
+    assert np.all(changed & (changed - 1) == 0)
+
+
+def test_k_point_mask_switches(rng):
+    mask = encodings.k_point_mask((100, 40), 3, rng)
+
+    switches = np.count_nonzero(mask[:, 1:] != mask[:, :-1], axis=-1)
+
+    assert np.all(mask[:, 0])
+    assert np.all(switches == 3)
+
+
+@pytest.mark.parametrize('crossover', ['uniform', 'k-point'])
+def test_bit_crossover_exchanges_bits(crossover, rng):
+    encoding = encodings.BitEncoding(
+        0.0, 1.0, bits=12, crossover=crossover
+    )
+    parents_1 = encoding.random((20,), rng)
+    parents_2 = encoding.random((20,), rng)
+
+    offspring = encoding.crossover(parents_1, parents_2, rng)
+
+    assert (40, 1) == offspring.shape
+    # Every bit of a child comes from one parent, its sibling has the other
+    assert np.array_equal(
+        offspring[0::2] ^ offspring[1::2], parents_1 ^ parents_2
+    )
+    assert np.array_equal(
+        offspring[0::2] & offspring[1::2], parents_1 & parents_2
+    )
+
+
+def test_sbx_keeps_parent_mean(rng):
+    parents_1 = rng.uniform(-5.0, 5.0, size=(50, 4))
+    parents_2 = rng.uniform(-5.0, 5.0, size=(50, 4))
+
+    child_1, child_2 = encodings.sbx(parents_1, parents_2, 2.0, rng)
+
+    assert np.allclose(child_1 + child_2, parents_1 + parents_2)
+
+
+@pytest.mark.parametrize('crossover', ['sbx', 'blx', 'uniform', 'k-point'])
+def test_real_crossover_within_bounds(crossover, rng):
+    encoding = encodings.RealEncoding(
+        np.full(3, -1.0), np.full(3, 1.0), crossover=crossover, alpha=2.0
+    )
+    parents_1 = np.full((30, 3), -1.0)
+    parents_2 = np.full((30, 3), 1.0)
+
+    offspring = encoding.crossover(parents_1, parents_2, rng)
+
+    assert (60, 3) == offspring.shape
+    assert np.all(np.abs(offspring) <= 1.0)
+
+
+@pytest.mark.parametrize('name', ['integer', 'real'])
+def test_one_gene_needs_value_crossover(name, rng):
+    for crossover in ('uniform', 'k-point'):
+        with pytest.raises(ValueError):
+            encodings.get_encoding(name, 0, 100, crossover=crossover)
+
+    encoding = encodings.get_encoding(name, 0, 100)
+    parents_1 = np.full((200, 1), 10)
+    parents_2 = np.full((200, 1), 90)
+    offspring = encoding.crossover(parents_1, parents_2, rng)
+
+    assert encoding.crossover_name in ('sbx', 'blx')
+    # Children are new values, not copies of their parents
+    assert np.any((offspring > 10) & (offspring < 90))
+    assert np.all((offspring >= 0) & (offspring <= 100))
+
+
+def test_encoding_needs_operators():
+    class Unfinished(encodings.Encoding):
+        name = 'unfinished'
+        crossovers = ('uniform',)
+
+    with pytest.raises(TypeError):
+        Unfinished(0, 1)
+
+
+@pytest.mark.parametrize('name', ['integer', 'real'])
+def test_gaussian_mutation_changes_one_gene(name, rng):
+    encoding = encodings.get_encoding(name, np.zeros(5), np.full(5, 100))
+    genomes = encoding.encode(np.full((200, 5), 50))
+
+    encoding.mutate(genomes, 1.0, rng)
+
+    assert np.all(np.count_nonzero(genomes != 50, axis=-1) == 1)
+    assert np.all((genomes >= 0) & (genomes <= 100))
+
+
+def test_unknown_encoding():
+    with pytest.raises(ValueError):
+        encodings.get_encoding('unknown', 0, 1)
+    with pytest.raises(ValueError):
+        encodings.get_encoding('bits', 0, 1, crossover='sbx')
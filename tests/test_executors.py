@@ -0,0 +1,160 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from evo_sim.algs import ABCAlgo, BatchFitness, FitnessCache, GeneticAlgorithm
+from evo_sim.algs import executors
+
+
+def square(x: int) -> float:
+    return float(x * x)
+
+
+async def async_square(x: int) -> float:
+    await asyncio.sleep(0)
+    return float(x * x)
+
+
+class RecordingFunction:
+
+    def __init__(self) -> None:
+        self.positions: list[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, x: int) -> float:
+        with self._lock:
+            self.positions.append(x)
+        return square(x)
+
+
+@pytest.mark.parametrize('name', ['serial', 'threads', 'processes'])
+def test_map_keeps_order(name):
+    positions = list(range(50, 0, -1))
+
+    with executors.make_executor(name, 2) as executor:
+        values = executor.map(square, positions)
+
+    assert values == [square(x) for x in positions]
+
+
+@pytest.mark.parametrize('name', list(executors.EXECUTORS))
+def test_submit(name):
+    with executors.make_executor(name, 2) as executor:
+        futures = [executor.submit(square, x) for x in [3, 1, 2]]
+        values = [future.result() for future in futures]
+
+    assert values == [9.0, 1.0, 4.0]
+
+
+def test_asyncio_submit_coroutine():
+    with executors.AsyncioExecutor(concurrency=2) as executor:
+        assert executor.submit(async_square, 5).result() == 25.0
+
+
+def test_batch_fitness_submit_counts():
+    with executors.ThreadExecutor(2) as executor:
+        fitness = BatchFitness(square, executor=executor)
+        assert fitness.submit(3).result() == 9.0
+    serial = BatchFitness(square)
+
+    assert serial.submit(4).result() == 16.0
+    assert fitness.evaluations == serial.evaluations == 1
+
+
+def test_cache_submits_misses_concurrently():
+    release = threading.Event()
+    started = threading.Barrier(3, timeout=5)
+    recording = RecordingFunction()
+
+    def slow_square(x: int) -> float:
+        started.wait()
+        release.wait(timeout=5)
+        return recording(x)
+
+    with executors.ThreadExecutor(2) as executor:
+        cache = FitnessCache(BatchFitness(slow_square, executor=executor))
+        futures = [cache.submit(x) for x in [3, 4]]
+        # Both misses run at once instead of one after the other
+        started.wait()
+        assert not any(future.done() for future in futures)
+        release.set()
+        values = [future.result() for future in futures]
+
+    hit = cache.submit(3)
+
+    assert values == [9.0, 16.0]
+    assert hit.done() and hit.result() == 9.0
+    assert sorted(recording.positions) == [3, 4]
+    assert (1, 2) == (cache.stats.hits, cache.stats.misses)
+
+
+def test_asyncio_executor():
+    with executors.AsyncioExecutor(concurrency=4) as executor:
+        values = executor.map(async_square, [3, 1, 2])
+        plain = executor.map(square, [4])
+
+    assert values == [9.0, 1.0, 4.0]
+    assert plain == [16.0]
+
+
+def test_asyncio_limits_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def scorer(x: int) -> float:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return float(x)
+
+    with executors.AsyncioExecutor(concurrency=3) as executor:
+        executor.map(scorer, list(range(20)))
+
+    assert peak == 3
+
+
+def test_unknown_executor():
+    with pytest.raises(ValueError):
+        executors.make_executor('unknown')
+
+
+def test_batch_fitness_deduplicates():
+    func = RecordingFunction()
+    with executors.ThreadExecutor(4) as executor:
+        fitness = BatchFitness(func, executor=executor)
+        values = fitness.batch(np.array([[3, 1], [3, 2]]))
+
+    assert values.tolist() == [[9.0, 1.0], [9.0, 4.0]]
+    assert sorted(func.positions) == [1, 2, 3]
+    assert fitness.evaluations == 3
+
+
+def test_batch_fitness_scalar_call():
+    with executors.AsyncioExecutor() as executor:
+        fitness = BatchFitness(async_square, executor=executor)
+
+        assert fitness(5) == 25.0
+        assert fitness.evaluations == 1
+
+
+@pytest.mark.parametrize('algorithm', [GeneticAlgorithm, ABCAlgo])
+def test_algorithms_match_serial(algorithm):
+    results = []
+    for executor in (executors.SerialExecutor(), executors.ThreadExecutor(4)):
+        with executor:
+            algo = algorithm(
+                10,
+                fitness_function=square,
+                max_x=64,
+                executor=executor,
+                rng=np.random.default_rng(0),
+            )
+            for _ in range(5):
+                population = algo()
+        results.append([(idv.x_pos, idv.y_pos) for idv in population])
+
+    assert results[0] == results[1]
@@ -0,0 +1,151 @@
+import numpy as np
+import pytest
+
+from evo_sim.algs import (
+    ABCAlgo,
+    GeneticAlgorithm,
+    VectorizedABCAlgo,
+    VectorizedGeneticAlgorithm,
+)
+from evo_sim.algs.fitness import FitnessCache, TableFitness, as_batch
+
+
+class CountingFunction:
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, x: int) -> float:
+        self.calls += 1
+        return float(x * x + 1)
+
+
+def test_cache_hits_and_misses():
+    func = CountingFunction()
+    cache = FitnessCache(func, maxsize=10)
+
+    assert 10.0 == cache(3)
+    assert 10.0 == cache(3)
+    assert 17.0 == cache(4)
+
+    assert 2 == func.calls
+    assert 1 == cache.stats.hits
+    assert 2 == cache.stats.misses
+    assert pytest.approx(1 / 3) == cache.stats.hit_rate
+
+
+def test_cache_lru_eviction():
+    func = CountingFunction()
+    cache = FitnessCache(func, maxsize=2)
+
+    cache(1)
+    cache(2)
+    cache(1)  # 2 is now the least recently used
+    cache(3)
+
+    assert 2 == len(cache)
+    assert 1 == cache.stats.evictions
+
+    cache(1)
+    assert 3 == func.calls
+    cache(2)
+    assert 4 == func.calls
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        FitnessCache(CountingFunction(), maxsize=0)
+
+
+@pytest.mark.parametrize('algorithm', [GeneticAlgorithm, ABCAlgo])
+def test_algorithm_shares_cache(algorithm):
+    func = CountingFunction()
+    algo = algorithm(10, fitness_function=func, max_x=16, cache_size=64)
+
+    for _ in range(5):
+        algo()
+
+    assert algo.fitness_cache is not None
+    assert func.calls == algo.fitness_cache.stats.misses
+    assert algo.fitness_cache.stats.hits > 0
+
+
+def test_table_fitness_clamps():
+    table = TableFitness(np.array([3.0, 2.0, 1.0]))
+
+    assert 3.0 == table(-5)
+    assert 1.0 == table(10)
+    assert [3.0, 2.0, 1.0, 1.0] == table(np.array([-1, 1, 2, 3])).tolist()
+
+
+def test_batch_adapter_scalar_function():
+    func = CountingFunction()
+    fitness = as_batch(func)
+
+    values = fitness.batch(np.array([1, 2, 3]))
+
+    assert [2.0, 5.0, 10.0] == values.tolist()
+    assert 3 == func.calls
+    assert 3 == fitness.evaluations
+
+
+def test_batch_adapter_batched_function():
+    fitness = as_batch(TableFitness(np.arange(5.0)))
+
+    assert [4.0, 0.0] == fitness.batch(np.array([7, -1])).tolist()
+    assert fitness.batched
+    assert fitness is as_batch(fitness)
+
+
+def test_cache_batch_forwards_distinct_misses():
+    func = CountingFunction()
+    cache = FitnessCache(func, maxsize=10)
+
+    cache(2)
+    values = cache.batch(np.array([2, 3, 3, 4, 2]))
+
+    assert [5.0, 10.0, 10.0, 17.0, 5.0] == values.tolist()
+    assert 3 == func.calls
+    assert 3 == cache.evaluations
+    assert 1 == cache.stats.hits
+
+
+def test_cache_batch_lru_eviction():
+    func = CountingFunction()
+    cache = FitnessCache(func, maxsize=3)
+
+    cache.batch(np.array([1, 2, 3]))
+    cache.batch(np.array([1]))  # 2 is now the least recently used
+    cache.batch(np.array([4, 5]))
+
+    assert 3 == len(cache)
+    assert 2 == cache.stats.evictions
+    cache.batch(np.array([1, 4, 5]))
+    assert 5 == func.calls
+
+    # Only the last misses of a batch larger than the cache are kept
+    cache.batch(np.arange(10, 20))
+    assert [17, 18, 19] == sorted(cache.state_dict()['positions'].tolist())
+    assert 12 == cache.stats.evictions
+
+
+@pytest.mark.parametrize('algorithm, evaluations', [
+    (GeneticAlgorithm, 20),
+    (VectorizedGeneticAlgorithm, 20),
+    (ABCAlgo, 40),
+    (VectorizedABCAlgo, 40),
+])
+def test_generation_evaluates_only_new_positions(algorithm, evaluations):
+    algo = algorithm(
+        20,
+        fitness_function=TableFitness(np.linspace(100.0, 0.0, num=64)),
+        max_x=64,
+        rng=np.random.default_rng(0),
+    )
+    start = algo.fitness_function.evaluations
+
+    for _ in range(5):
+        algo.step()
+
+    # The best solution is not evaluated again every generation
+    assert 5 * evaluations == algo.fitness_function.evaluations - start
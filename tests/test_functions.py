@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from evo_sim import functions
+
+
+def reference_hill(n_points, scale, pos_y, rng):
+    cos_sum = sum(
+        functions.cosine_part(
+            amp=amp, phi=rng.random(), f=f, n_points=n_points
+        )
+        for f, amp in functions.HILL_COMPONENTS
+    ) + 2
+    cos_sum = np.abs(cos_sum)
+    return scale * (cos_sum / np.max(cos_sum)) + pos_y
+
+
+def test_hill_matches_cosine_sum():
+    hill_y = functions.hill(1024, 300.0, 150.0, rng=np.random.default_rng(5))
+    expected = reference_hill(1024, 300.0, 150.0, np.random.default_rng(5))
+
+    assert np.allclose(expected, hill_y)
+
+
+def test_hill_reuses_trig_basis():
+    functions.hill(512)
+    functions.hill(512)
+
+    info = functions._cached_trig_basis.cache_info()
+    assert info.hits >= 1
+    assert not functions._cached_trig_basis(512).flags.writeable
+
+
+def test_hill_profile_chunks():
+    phases = functions.hill_phases(np.random.default_rng(2))
+    full = functions.hill_profile(1000, phases)
+
+    chunks = np.concatenate([
+        functions.hill_profile(1000, phases, start, min(start + 300, 1000))
+        for start in range(0, 1000, 300)
+    ])
+
+    assert np.allclose(full, chunks)
+
+
+def test_large_hill_profile_is_not_cached():
+    n_points = 2 * functions.MAX_CACHED_POINTS + 5
+    phases = functions.hill_phases(np.random.default_rng(2))
+    functions._cached_trig_basis.cache_clear()
+
+    profile = functions.hill_profile(n_points, phases)
+    expected = functions.hill_profile(n_points, phases, 0, 10)
+
+    assert 0 == functions._cached_trig_basis.cache_info().currsize
+    assert np.allclose(expected, profile[:10])
+    assert n_points == len(profile)
+
+
+@pytest.mark.parametrize('n_points', [1000, functions.MAX_CACHED_POINTS + 7])
+def test_lazy_hill_matches_hill(n_points):
+    lazy = functions.LazyHill(
+        n_points, 300.0, 150.0, rng=np.random.default_rng(1)
+    )
+    positions = np.array([0, 3, n_points // 2, n_points - 1, n_points + 5])
+
+    hill_y = functions.hill(
+        n_points, 300.0, 150.0, rng=np.random.default_rng(1)
+    )
+
+    assert np.allclose(hill_y[np.minimum(positions, n_points - 1)],
+                       lazy(positions))
+    assert np.isclose(hill_y[3], lazy(3))
+    assert (2, 2) == lazy(positions[:4].reshape(2, 2)).shape
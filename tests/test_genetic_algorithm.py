@@ -0,0 +1,398 @@
+import time
+
+import numpy as np
+import pytest
+
+from evo_sim import landscapes
+from evo_sim.algs.evo import (
+    BinaryPhenotype,
+    GeneticAlgorithm,
+    IslandGeneticAlgorithm,
+    LandscapeGeneticAlgorithm,
+    SteadyStateGeneticAlgorithm,
+    VectorizedGeneticAlgorithm,
+)
+from evo_sim.algs import executors
+from evo_sim.algs.fitness import TableFitness
+
+
+@pytest.fixture
+def table():
+    return np.linspace(100.0, 0.0, num=64)
+
+
+@pytest.fixture
+def island_ga(table):
+    return IslandGeneticAlgorithm(
+        6,
+        20,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        init_x=0,
+        rng=np.random.default_rng(0),
+    )
+
+
+@pytest.fixture
+def vectorized_ga(table):
+    return VectorizedGeneticAlgorithm(
+        20,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        init_x=0,
+    )
+
+
+def test_vectorized_crossover_matches_phenotype(vectorized_ga):
+    length = vectorized_ga.genotype_length
+    parents_1 = np.array([0b0001110, 0b1010101], dtype=np.int64)
+    parents_2 = np.array([0b1110001, 0b0110011], dtype=np.int64)
+
+    offspring = vectorized_ga.crossover(parents_1, parents_2)
+
+    for i, (p_1, p_2) in enumerate(zip(parents_1, parents_2)):
+        off_1, off_2 = (
+            BinaryPhenotype.from_int(int(p_1), length)
+            + BinaryPhenotype.from_int(int(p_2), length)
+        )
+        assert int(off_1) == offspring[2 * i]
+        assert int(off_2) == offspring[2 * i + 1]
+
+
+def test_vectorized_mutation_flips_single_bit(vectorized_ga):
+    vectorized_ga.mutation_rate = 1.0
+    genomes = np.zeros(100, dtype=np.int64)
+
+    vectorized_ga.mutate(genomes)
+
+    # Exactly one bit set in every genome
+    assert np.all(genomes != 0)
+    assert np.all(genomes & (genomes - 1) == 0)
+    assert np.all(genomes < 2 ** vectorized_ga.genotype_length)
+
+
+def test_vectorized_generation(vectorized_ga, table):
+    original_best = vectorized_ga.best_solution.fitness_val
+
+    for _ in range(10):
+        population = vectorized_ga()
+
+    assert len(population) == 20
+    assert vectorized_ga._generation == 10
+    assert vectorized_ga.best_solution.fitness_val <= original_best
+    assert min(idv.y_pos for idv in population) >= table.min()
+
+
+def test_island_generation(island_ga, table):
+    for _ in range(10):
+        island_ga.step()
+
+    assert (6, 20) == island_ga.population.shape
+    assert 10 == island_ga._generation
+    assert np.all(island_ga.island_best_fitness >= table.min())
+    assert island_ga.best_solution.fitness_val == \
+        island_ga.island_best_fitness.min()
+    assert 6 * 20 == len(island_ga())
+
+
+def test_island_population_drawn_once(table):
+    island_ga = IslandGeneticAlgorithm(
+        3,
+        5,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        rng=np.random.default_rng(7),
+    )
+
+    # No single population is drawn before the islands
+    expected = np.random.default_rng(7).integers(0, len(table), size=(3, 5))
+    assert expected.tolist() == island_ga.population.tolist()
+
+
+def test_island_crossover_rows(island_ga):
+    parents_1 = np.array([[0b0001110], [0b1010101]], dtype=np.int64)
+    parents_2 = np.array([[0b1110001], [0b0110011]], dtype=np.int64)
+
+    offspring = island_ga.crossover(parents_1, parents_2)
+    flat = island_ga.crossover(parents_1.ravel(), parents_2.ravel())
+
+    assert (2, 2) == offspring.shape
+    assert flat.tolist() == offspring.ravel().tolist()
+
+
+def test_island_migration_ring(island_ga):
+    island_ga.migrants = 1
+    island_ga.population = np.tile(np.arange(20), (6, 1))
+    island_ga.population[:, 0] = 63 - np.arange(6)
+
+    island_ga.migrate(island_ga._evaluate(island_ga.population))
+
+    # The best of island r replaces the worst (x = 1) of island r + 1
+    assert 58 == island_ga.population[0, 1]
+    assert (63 - np.arange(5)).tolist() == \
+        island_ga.population[1:, 1].tolist()
+    assert 1 == island_ga.success_rate(island_ga.island_best_fitness.max())
+
+
+def test_landscape_crossover_matches_phenotype():
+    ga = LandscapeGeneticAlgorithm(10, landscapes.Sphere(3), bits=5)
+    parents_1 = np.array([[0b00011, 0b10101, 0b11100]], dtype=np.int64)
+    parents_2 = np.array([[0b11100, 0b01010, 0b00011]], dtype=np.int64)
+
+    offspring = ga.crossover(parents_1, parents_2)
+
+    # Same as cutting the concatenated 15 bit genotypes in half
+    genome_1 = BinaryPhenotype('000111010111100')
+    genome_2 = BinaryPhenotype('111000101000011')
+    off_1, off_2 = genome_1 + genome_2
+    for genome, off in zip((off_1, off_2), offspring):
+        parts = [genome.genotype[i:i + 5] for i in range(0, 15, 5)]
+        assert [int(part, 2) for part in parts] == off.tolist()
+
+
+def test_landscape_decode_bounds():
+    landscape = landscapes.Sphere(2, bounds=(-1.0, 3.0))
+    ga = LandscapeGeneticAlgorithm(4, landscape, bits=8)
+
+    decoded = ga.decode(np.array([[0, 255]]))
+
+    assert [[-1.0, 3.0]] == decoded.tolist()
+
+
+def test_landscape_generation():
+    landscape = landscapes.Rastrigin(10)
+    ga = LandscapeGeneticAlgorithm(
+        30, landscape, rng=np.random.default_rng(0)
+    )
+
+    for _ in range(5):
+        ga.step()
+    first_best = ga.best_fitness
+    for _ in range(45):
+        population = ga()
+
+    assert 30 == len(population)
+    assert ga.best_fitness <= first_best
+    assert np.isclose(ga.best_fitness, landscape(ga.best_position))
+    # One evaluation per position and generation, drawing evaluates nothing
+    assert 30 * (1 + 50) == ga.fitness_function.evaluations
+
+
+def test_snapshot_filled_in_place(vectorized_ga, island_ga):
+    for algo in (vectorized_ga, island_ga):
+        algo.step()
+        snapshot = algo.fill_snapshot()
+        x = snapshot.x
+
+        algo.step()
+
+        assert algo.fill_snapshot().x is x
+        assert len(snapshot) == algo.population.size
+        # Snapshots hold decoded positions, not genomes
+        assert snapshot.x[:len(snapshot)].tolist() == \
+            algo._positions(algo.population).ravel().tolist()
+        assert snapshot.best_x == algo.best_x
+
+
+@pytest.mark.parametrize('algorithm', [
+    GeneticAlgorithm,
+    VectorizedGeneticAlgorithm,
+    SteadyStateGeneticAlgorithm,
+    lambda *args, **kwargs: IslandGeneticAlgorithm(3, *args, **kwargs),
+])
+def test_snapshot_evaluates_nothing(algorithm, table):
+    algo = algorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        rng=np.random.default_rng(0),
+    )
+    for _ in range(3):
+        algo.step()
+    evaluations = algo.fitness_function.evaluations
+
+    snapshot = algo.fill_snapshot()
+
+    assert evaluations == algo.fitness_function.evaluations
+    # Genomes can decode beyond the table, those share its last value
+    positions = np.minimum(snapshot.x[:len(snapshot)], len(table) - 1)
+    assert snapshot.y[:len(snapshot)].tolist() == \
+        table[positions.astype(np.int64)].tolist()
+
+
+@pytest.mark.parametrize('algorithm', [
+    GeneticAlgorithm,
+    VectorizedGeneticAlgorithm,
+])
+def test_runs_side_by_side(algorithm, table):
+    algo = algorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        rng=np.random.default_rng(0),
+    )
+    best_fitness = algo.best_solution.fitness_val
+
+    # A second run on another table must not change how the first is judged
+    algorithm(
+        10,
+        fitness_function=TableFitness(-table),
+        max_x=len(table),
+    )
+
+    assert algo.best_solution.fitness_val == best_fitness
+    assert algo.best_solution.fitness_val == table[algo.best_x]
+
+
+def test_object_step_matches_call(table):
+    stepped, called = [
+        GeneticAlgorithm(
+            10,
+            fitness_function=TableFitness(table),
+            max_x=len(table),
+            rng=np.random.default_rng(3),
+        )
+        for _ in range(2)
+    ]
+
+    for _ in range(5):
+        stepped.step()
+        population = called()
+
+    assert stepped.fill_snapshot().to_individuals() == population
+
+
+@pytest.mark.parametrize('replacement', ['worst', 'random', 'oldest'])
+def test_steady_state_generation(table, replacement):
+    algo = SteadyStateGeneticAlgorithm(
+        20,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        replacement=replacement,
+        slots=3,
+        rng=np.random.default_rng(0),
+    )
+    initial_best = algo.best_fitness
+
+    for _ in range(10):
+        algo.step()
+
+    assert algo._generation == 10
+    assert algo.best_fitness <= initial_best
+    genomes = np.minimum(algo.population, len(table) - 1)
+    assert algo.fitness_values.tolist() == table[genomes].tolist()
+    # Initial population plus 20 offspring per generation
+    assert algo.fitness_function.evaluations >= 20 + 200
+
+
+def test_steady_state_worst_keeps_best(table):
+    algo = SteadyStateGeneticAlgorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        rng=np.random.default_rng(1),
+    )
+    best = algo.fitness_values.min()
+
+    for _ in range(5):
+        algo.step()
+        assert algo.fitness_values.min() <= best
+        best = algo.fitness_values.min()
+
+
+def test_steady_state_oldest_spares_elites(table):
+    algo = SteadyStateGeneticAlgorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        elites=1,
+        replacement='oldest',
+        rng=np.random.default_rng(2),
+    )
+    best_index = int(np.argmin(algo.fitness_values))
+    best_genome = algo.population[best_index]
+
+    algo._insert(0, table[0])
+
+    assert algo.population[best_index] == best_genome
+    assert algo.births.max() == 10
+
+
+def test_steady_state_uneven_evaluation_times():
+    delays = {}
+
+    def slow_square(x: int) -> float:
+        # Some positions take much longer than the others
+        time.sleep(delays.setdefault(x, 0.02 if x % 7 == 0 else 0.0))
+        return float((x - 40) ** 2)
+
+    with executors.ThreadExecutor(4) as executor:
+        algo = SteadyStateGeneticAlgorithm(
+            16,
+            fitness_function=slow_square,
+            max_x=64,
+            slots=4,
+            executor=executor,
+            rng=np.random.default_rng(0),
+        )
+        for _ in range(3):
+            algo.step()
+        state = algo.state_dict()
+
+    assert algo._generation == 3
+    assert len(state['pending']) == len(state['pending_fitness'])
+    assert algo.fitness_values.tolist() == [
+        slow_square(min(int(x), 63)) for x in algo.population
+    ]
+
+
+def test_steady_state_invalid_options(table):
+    with pytest.raises(ValueError):
+        SteadyStateGeneticAlgorithm(
+            10, TableFitness(table), replacement='unknown'
+        )
+    with pytest.raises(ValueError):
+        SteadyStateGeneticAlgorithm(10, TableFitness(table), slots=0)
+
+
+@pytest.mark.parametrize('encoding, crossover', [
+    ('gray', 'uniform'),
+    ('integer', 'blx'),
+    ('real', 'blx'),
+])
+def test_vectorized_encodings(table, encoding, crossover):
+    algo = VectorizedGeneticAlgorithm(
+        20,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        encoding=encoding,
+        encoding_options={'crossover': crossover},
+        rng=np.random.default_rng(0),
+    )
+    original_best = algo.best_solution.fitness_val
+
+    for _ in range(10):
+        algo.step()
+
+    assert algo.best_solution.fitness_val <= original_best
+    positions = algo._positions(algo.population)
+    assert np.all((0 <= positions) & (positions < len(table)))
+
+
+def test_landscape_real_encoding():
+    landscape = landscapes.Sphere(5)
+    ga = LandscapeGeneticAlgorithm(
+        30,
+        landscape,
+        encoding='real',
+        encoding_options={'crossover': 'blx'},
+        rng=np.random.default_rng(0),
+    )
+
+    for _ in range(30):
+        ga.step()
+
+    assert np.float64 == ga.population.dtype
+    assert np.all(ga.population >= landscape.lower)
+    assert np.all(ga.population <= landscape.upper)
+    assert np.isclose(ga.best_fitness, landscape(ga.best_position))
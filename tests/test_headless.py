@@ -0,0 +1,91 @@
+import subprocess
+import sys
+
+import pytest
+
+from evo_sim import headless
+
+
+@pytest.fixture
+def config():
+    return headless.load_config(headless.DEFAULT_CONFIG)
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_run(config, alg):
+    config['use-alg'] = alg
+    result = headless.run(config, stop_after=25)
+
+    assert result.algorithm == alg
+    assert result.generations == 25
+    assert 0 <= result.best_x
+    assert result.global_best_fitness <= result.best_fitness
+
+
+def test_run_steady_state(config):
+    config['evo']['engine'] = 'steady-state'
+    config['evo']['replacement'] = 'random'
+    result = headless.run(config, stop_after=5)
+
+    assert result.generations == 5
+    assert result.global_best_fitness <= result.best_fitness
+
+
+@pytest.mark.parametrize('engine', ['vectorized', 'islands'])
+def test_run_real_encoding(config, engine):
+    config['evo']['engine'] = engine
+    config['evo']['encoding'] = 'real'
+    config['evo']['crossover'] = 'sbx'
+    result = headless.run(config, stop_after=5)
+
+    assert result.generations == 5
+    assert result.global_best_fitness <= result.best_fitness
+
+
+def test_object_engine_needs_bits(config):
+    config['evo']['engine'] = 'object'
+    config['evo']['encoding'] = 'real'
+
+    with pytest.raises(RuntimeError):
+        headless.run(config, stop_after=1)
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_run_landscape(config, alg):
+    config['use-alg'] = alg
+    config['landscape'] = 'sphere'
+    config['landscape-dimensions'] = 3
+    result = headless.run(config, stop_after=10)
+
+    assert result.generations == 10
+    assert len(result.best_x) == 3
+    assert result.global_best_x is None
+    assert result.global_best_fitness == 0.0
+    assert result.best_fitness >= 0.0
+
+
+def test_run_unknown_algorithm(config):
+    config['use-alg'] = 'unknown'
+
+    with pytest.raises(RuntimeError):
+        headless.run(config, stop_after=1)
+
+
+def test_does_not_import_pygame():
+    code = (
+        "import sys; import evo_sim.headless; "
+        "assert 'pygame' not in sys.modules"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_run_landscape_table(config, tmp_path):
+    config['landscape-size'] = 2 ** 20
+    config['landscape-table'] = str(tmp_path / 'hill.npy')
+
+    first = headless.run(config, stop_after=5, seed=7)
+    second = headless.run(config, stop_after=5, seed=7)
+
+    assert first.best_x == second.best_x
+    assert first.global_best_fitness == second.global_best_fitness
+    assert first.best_x < 2 ** 20
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from evo_sim import landscapes
+
+
+@pytest.mark.parametrize('name', list(landscapes.LANDSCAPES))
+def test_known_optimum(name):
+    landscape = landscapes.get_landscape(name, dimensions=10)
+    optimum = np.ones(10) if name == 'rosenbrock' else np.zeros(10)
+
+    assert np.isclose(landscape.optimum, landscape(optimum))
+    assert np.all(landscape(landscape.sample(50)) >= landscape.optimum)
+
+
+def test_batch_shapes():
+    landscape = landscapes.Rastrigin(3)
+
+    assert () == landscape(np.zeros(3)).shape
+    assert (4, 5) == landscape(np.zeros((4, 5, 3))).shape
+
+
+def test_sample_within_bounds():
+    landscape = landscapes.Sphere(4, bounds=[(0, 1), (2, 3), (4, 5), (6, 7)])
+
+    positions = landscape.sample(100, rng=np.random.default_rng(0))
+
+    assert (100, 4) == positions.shape
+    assert np.all(positions >= landscape.lower)
+    assert np.all(positions <= landscape.upper)
+
+
+def test_discrete_landscape():
+    landscape = landscapes.Sphere(2, bounds=(-3.5, 3.5), discrete=True)
+
+    positions = landscape.sample(100)
+
+    assert [-3, -3] == landscape.lower.tolist()
+    assert np.all(positions == np.round(positions))
+    assert 1.0 == landscape(np.array([0.4, 0.6]))
+
+
+@pytest.mark.parametrize('vectorized', [False, True])
+def test_callable_landscape(vectorized):
+    landscape = landscapes.CallableLandscape(
+        lambda x: np.abs(x).sum(axis=-1),
+        dimensions=3,
+        bounds=(-1, 1),
+        vectorized=vectorized,
+    )
+
+    values = landscape(np.array([[1.0, -1.0, 0.5], [0.0, 0.0, 0.0]]))
+
+    assert [2.5, 0.0] == values.tolist()
+
+
+def test_landscape_needs_evaluate():
+    with pytest.raises(TypeError):
+        landscapes.Landscape(2)
+
+
+def test_unknown_landscape():
+    with pytest.raises(ValueError):
+        landscapes.get_landscape('unknown')
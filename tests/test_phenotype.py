@@ -88,3 +88,12 @@ def test_init_from_int_var_length():
     phen_1 = BinaryPhenotype.from_int(15, length=10)
 
     assert '0000001111' == phen_1.genotype
+
+
+def test_to_individual_takes_fitness():
+    phen_1 = BinaryPhenotype('0101')
+
+    individual = phen_1.to_individual(3.5)
+
+    assert (5.0, 3.5) == (individual.x_pos, individual.y_pos)
+    assert 'BinaryPhenotype(genotype=0101, phenotype=5)' == repr(phen_1)
@@ -0,0 +1,102 @@
+import tracemalloc
+
+import pytest
+
+from evo_sim import headless
+from evo_sim.algs import profiling
+
+
+@pytest.fixture
+def config():
+    return headless.load_config(headless.DEFAULT_CONFIG)
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = profiling.Profiler()
+
+    with profiler.phase('fitness'):
+        pass
+
+    assert profiler.phase('fitness') is profiler.phase('selection')
+    assert {} == profiler.stats.phases
+
+
+def test_phase_timing():
+    profiler = profiling.Profiler(enabled=True)
+
+    for _ in range(3):
+        with profiler.phase('fitness'):
+            sum(range(1000))
+
+    phase = profiler.stats.phases['fitness']
+    assert 3 == phase.calls
+    assert 0 < phase.mean_time <= phase.total_time
+
+
+def test_allocation_tracking():
+    profiler = profiling.Profiler(enabled=True, track_allocations=True)
+
+    try:
+        with profiler.phase('crossover'):
+            blocks = [object() for _ in range(1000)]
+    finally:
+        profiler.disable()
+
+    assert not tracemalloc.is_tracing()
+    assert 1000 == len(blocks)
+    assert profiler.stats.phases['crossover'].peak_bytes > 0
+    assert profiler.stats.phases['crossover'].allocated_blocks > 0
+
+
+def test_aggregate_runs():
+    first = profiling.RunStats(
+        {'fitness': profiling.PhaseStats(2, 1.0)}, evaluations=10
+    )
+    second = profiling.RunStats(
+        {'fitness': profiling.PhaseStats(3, 2.0),
+         'scout': profiling.PhaseStats(1, 0.5)},
+        evaluations=5,
+    )
+
+    total = profiling.RunStats.aggregate([
+        first, profiling.RunStats.from_dict(second.as_dict())
+    ])
+
+    assert 2 == total.runs
+    assert 15 == total.evaluations
+    assert 5 == total.phases['fitness'].calls
+    assert 3.5 == total.total_time
+
+
+@pytest.mark.parametrize('alg, phases', [
+    ('evo', {'fitness', 'selection', 'crossover', 'mutation'}),
+    ('abc', {'employed', 'onlooker', 'scout'}),
+])
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_headless_profile(config, alg, phases, engine):
+    config['use-alg'] = alg
+    config[alg]['engine'] = engine
+
+    result = headless.run(config, stop_after=5, profile=True)
+
+    assert phases <= set(result.profile['phases'])
+    assert result.evaluations == result.profile['evaluations']
+    assert headless.run(config, stop_after=1).profile is None
+
+
+def test_headless_stops_allocation_tracking(config):
+    result = headless.run(config, stop_after=2, track_allocations=True)
+
+    assert not tracemalloc.is_tracing()
+    assert result.profile is not None
+
+
+def test_profiler_keeps_foreign_tracing():
+    tracemalloc.start()
+    try:
+        profiler = profiling.Profiler(enabled=True, track_allocations=True)
+        profiler.disable()
+
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -0,0 +1,41 @@
+import pytest
+
+pygame = pytest.importorskip('pygame')
+
+from evo_sim import render  # noqa: E402
+from evo_sim.algs.repr import PopulationBuffer  # noqa: E402
+
+
+def test_sprites_are_reused():
+    sprites = render.SpriteCache()
+
+    first = sprites.get((255, 0, 0), 5)
+    second = sprites.get([255, 0, 0], 5)
+    sprites.get((255, 0, 0), 3)
+
+    assert first is second
+    assert len(sprites) == 2
+
+
+def test_draw_snapshot():
+    screen = pygame.Surface((64, 64))
+    screen.fill((0, 0, 0))
+    snapshot = PopulationBuffer(palette=[(255, 0, 0), (0, 255, 0)])
+    snapshot.extend([10.0, 40.0], [10.0, 30.0], radius=2)
+    snapshot.colour[1] = 1
+
+    render.draw_snapshot(screen, snapshot, 1.0, render.SpriteCache())
+
+    assert screen.get_at((10, 10))[:3] == (255, 0, 0)
+    assert screen.get_at((40, 30))[:3] == (0, 255, 0)
+
+
+def test_render_background():
+    background = render.render_background(
+        (32, 32),
+        (1, 2, 3),
+        lambda surface: surface.fill((9, 9, 9), pygame.Rect(0, 0, 4, 4)),
+    )
+
+    assert background.get_at((1, 1))[:3] == (9, 9, 9)
+    assert background.get_at((20, 20))[:3] == (1, 2, 3)
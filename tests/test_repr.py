@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from evo_sim.algs.repr import DEFAULT_COLOUR, Individual, PopulationBuffer
+
+
+def test_individual_has_slots():
+    idv = Individual(1.0, 2.0)
+
+    with pytest.raises(AttributeError):
+        idv.extra = 1
+
+
+def test_buffer_extend():
+    buffer = PopulationBuffer(2, palette=[DEFAULT_COLOUR, (1, 2, 3)])
+
+    first = buffer.extend(np.array([1.0, 2.0]), np.array([3.0, 4.0]))
+    second = buffer.extend(np.array([5.0]), np.array([6.0]), colour=1)
+
+    assert (first, second) == (slice(0, 2), slice(2, 3))
+    assert len(buffer) == 3
+    assert buffer.to_individuals() == [
+        Individual(1.0, 3.0),
+        Individual(2.0, 4.0),
+        Individual(5.0, 6.0, colour=(1, 2, 3)),
+    ]
+    assert buffer[-1] == Individual(5.0, 6.0, colour=(1, 2, 3))
+
+
+def test_buffer_reuses_columns():
+    buffer = PopulationBuffer(4)
+    buffer.extend(np.arange(4), np.arange(4))
+    x = buffer.x
+
+    buffer.clear()
+    buffer.extend(np.arange(3), np.arange(3))
+
+    assert buffer.x is x
+    assert len(buffer) == 3
+
+
+def test_buffer_grows():
+    buffer = PopulationBuffer()
+
+    buffer.extend(np.arange(3), np.arange(3))
+    buffer.extend(np.arange(5), np.arange(5))
+
+    assert len(buffer) == 8
+    assert buffer.x[:8].tolist() == [0, 1, 2, 0, 1, 2, 3, 4]
+
+
+def test_buffer_index_out_of_range():
+    buffer = PopulationBuffer()
+    buffer.extend(np.arange(2), np.arange(2))
+
+    with pytest.raises(IndexError):
+        buffer[2]
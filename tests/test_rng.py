@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from evo_sim import algs, functions, headless
+from evo_sim.rng import make_rng, spawn_rngs
+
+
+def test_make_rng_passes_generator_through():
+    rng = np.random.default_rng(0)
+
+    assert rng is make_rng(rng)
+
+
+def test_spawn_rngs_independent_and_reproducible():
+    first = [rng.random() for rng in spawn_rngs(7, 3)]
+    second = [rng.random() for rng in spawn_rngs(7, 3)]
+
+    assert first == second
+    assert 3 == len(set(first))
+
+
+def test_hill_reproducible():
+    hill_1 = functions.hill(64, rng=np.random.default_rng(3))
+    hill_2 = functions.hill(64, rng=np.random.default_rng(3))
+
+    assert np.array_equal(hill_1, hill_2)
+
+
+@pytest.mark.parametrize('algorithm', [
+    algs.GeneticAlgorithm,
+    algs.VectorizedGeneticAlgorithm,
+    algs.ABCAlgo,
+    algs.VectorizedABCAlgo,
+])
+def test_algorithms_reproducible(algorithm):
+    table = algs.TableFitness(np.random.default_rng(0).random(128))
+
+    def run(seed):
+        algo = algorithm(
+            10,
+            fitness_function=table,
+            max_x=128,
+            rng=np.random.default_rng(seed),
+        )
+        population = [algo() for _ in range(20)][-1]
+        return [(idv.x_pos, idv.y_pos) for idv in population]
+
+    assert run(1) == run(1)
+    assert run(1) != run(2)
+
+
+def test_headless_seed():
+    config = headless.load_config(headless.DEFAULT_CONFIG)
+
+    result_1 = headless.run(config, stop_after=10, seed=5)
+    result_2 = headless.run(config, stop_after=10, seed=5)
+
+    assert result_1.best_x == result_2.best_x
+    assert result_1.global_best_x == result_2.global_best_x
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from evo_sim.algs import selection
+
+
+@pytest.fixture
+def fitness():
+    return np.array([9.0, 0.0, 5.0, 1.0, 7.0, 3.0])
+
+
+def test_top_k(fitness):
+    assert {1, 3} == set(selection.top_k(fitness, 2))
+    assert 0 == len(selection.top_k(fitness, 0))
+
+
+def test_top_k_rows(fitness):
+    rows = np.stack([fitness, fitness[::-1]])
+
+    elites = selection.top_k(rows, 1)
+
+    assert [[1], [4]] == elites.tolist()
+
+
+@pytest.mark.parametrize('name', list(selection.SELECTIONS))
+def test_selection_shapes(fitness, name):
+    select = selection.get_selection(name)
+
+    indices = select(fitness, 4)
+    row_indices = select(np.stack([fitness] * 3), 4)
+
+    assert (4,) == indices.shape
+    assert (3, 4) == row_indices.shape
+    assert np.all((0 <= row_indices) & (row_indices < len(fitness)))
+
+
+def test_roulette_without_replacement(fitness):
+    indices = selection.roulette(fitness, 5)
+
+    assert 5 == len(set(indices))
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize('name', list(selection.SELECTIONS))
+def test_selection_prefers_low_fitness(name):
+    fitness = np.array([0.0, 1000.0])
+    select = selection.get_selection(name)
+
+    indices = np.concatenate([select(fitness, 1) for _ in range(200)])
+
+    assert np.mean(indices == 0) > 0.6
+
+
+def test_sus_spread():
+    fitness = np.zeros(4)
+
+    indices = selection.stochastic_universal(fitness, 4)
+
+    assert [0, 1, 2, 3] == sorted(indices)
+
+
+def test_unknown_selection():
+    with pytest.raises(ValueError):
+        selection.get_selection('unknown')
+
+
+def test_proportional_distribution():
+    weights = np.array([1.0, 0.0, 3.0, 6.0])
+
+    indices = selection.proportional(weights, 20000)
+    frequencies = np.bincount(indices, minlength=4) / len(indices)
+
+    assert 0 == frequencies[1]
+    assert np.allclose([0.1, 0.0, 0.3, 0.6], frequencies, atol=0.02)
+
+
+def test_proportional_visits_last_index():
+    weights = np.array([0.0, 0.0, 1.0])
+
+    assert np.all(2 == selection.proportional(weights, 10))
+
+
+def test_proportional_zero_weights():
+    indices = selection.proportional(np.zeros(3), 300)
+
+    assert {0, 1, 2} == set(indices.tolist())
@@ -0,0 +1,177 @@
+import numpy as np
+import pytest
+
+from evo_sim import algs, headless, sweep
+from evo_sim.algs import stopping
+
+
+@pytest.fixture
+def config():
+    return headless.load_config(headless.DEFAULT_CONFIG)
+
+
+def make_algo(alg: str, **kwargs):
+    table = np.linspace(10.0, 0.0, 64)
+    fitness_function = algs.TableFitness(table)
+    if alg == 'evo':
+        return algs.GeneticAlgorithm(
+            10,
+            fitness_function=fitness_function,
+            max_x=64,
+            init_x=0,
+            rng=np.random.default_rng(0),
+            **kwargs,
+        )
+    return algs.ABCAlgo(
+        10,
+        fitness_function=fitness_function,
+        max_x=64,
+        init_x=0,
+        rng=np.random.default_rng(0),
+        **kwargs,
+    )
+
+
+def run(algo, criteria: stopping.StoppingCriteria, max_steps: int = 1000):
+    criteria.start(algo)
+    for _ in range(max_steps):
+        if criteria(algo) is not None:
+            break
+        algo()
+    return criteria.stop_reason
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_max_generations(alg):
+    algo = make_algo(alg)
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.MaxGenerations(7)
+    ]))
+
+    assert reason == 'max-generations'
+    assert algo._generation == 7
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_no_improvement(alg):
+    algo = make_algo(alg)
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.NoImprovement(5)
+    ]))
+
+    assert reason == 'no-improvement'
+    assert algo._generation - (algo.log.last_improvement or 0) == 5
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_fitness_target(alg):
+    algo = make_algo(alg)
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.FitnessTarget(1.0)
+    ]))
+
+    assert reason == 'fitness-target'
+    assert algo.log.best_fitness <= 1.0
+
+
+def test_evaluation_budget():
+    algo = make_algo('evo')
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.EvaluationBudget(50)
+    ]))
+
+    assert reason == 'evaluations'
+    assert algo.fitness_function.evaluations >= 50
+
+
+def test_diversity_collapse():
+    algo = algs.VectorizedGeneticAlgorithm(
+        10,
+        fitness_function=algs.TableFitness(np.zeros(64)),
+        max_x=64,
+        init_x=0,
+        mutation_rate=0.0,
+        rng=np.random.default_rng(0),
+    )
+    algo.population[:] = 3
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.DiversityCollapse(0.0)
+    ]))
+
+    assert reason == 'diversity'
+    assert algo._generation == 1
+    assert algo.log.last_record.diversity == 0.0
+
+
+def test_wall_clock():
+    algo = make_algo('evo')
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.WallClock(0.0)
+    ]))
+
+    assert reason == 'wall-clock'
+    assert algo._generation == 0
+
+
+def test_first_criterion_reported():
+    algo = make_algo('evo')
+
+    reason = run(algo, stopping.StoppingCriteria([
+        stopping.MaxGenerations(3),
+        stopping.WallClock(60.0),
+    ]))
+
+    assert reason == 'max-generations'
+
+
+def test_from_config():
+    criteria = stopping.from_config(
+        {'no-improvement': 10, 'fitness-target': None, 'evaluations': 100},
+        stop_after=20,
+    )
+
+    assert [criterion.name for criterion in criteria.criteria] == [
+        'max-generations', 'no-improvement', 'evaluations'
+    ]
+
+
+def test_from_config_unknown():
+    with pytest.raises(ValueError):
+        stopping.from_config({'unknown': 1})
+
+
+def test_criterion_needs_call():
+    class Unfinished(stopping.Criterion):
+        name = 'unfinished'
+
+    with pytest.raises(TypeError):
+        Unfinished()
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_headless_stop_reason(config, alg):
+    config['use-alg'] = alg
+    config['stopping'] = {'no-improvement': 5}
+
+    result = headless.run(config, stop_after=10_000)
+
+    assert result.stop_reason == 'no-improvement'
+    assert result.generations < 10_000
+    assert result.generations - result.generation_found == 5
+
+
+def test_headless_stop_after_reason(config):
+    result = headless.run(config, stop_after=5)
+
+    assert result.stop_reason == 'max-generations'
+    assert result.generations == 5
+
+
+def test_sweep_reports_stop_reason():
+    assert 'stop_reason' in sweep.RESULT_FIELDS
@@ -0,0 +1,187 @@
+import numpy as np
+import pytest
+
+from evo_sim import landscapes
+from evo_sim.algs import (
+    ABCAlgo,
+    LandscapeABCAlgo,
+    TableFitness,
+    VectorizedABCAlgo,
+)
+from evo_sim.algs.swarm import BEE_COLOURS
+
+
+@pytest.fixture
+def table():
+    return np.abs(np.linspace(-50.0, 50.0, num=101)) + 1.0
+
+
+@pytest.fixture
+def vectorized_abc(table):
+    return VectorizedABCAlgo(
+        20,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        init_x=0,
+        limit=5,
+        show_bees=True,
+    )
+
+
+def test_vectorized_neighborhood_uses_other_source(vectorized_abc):
+    vectorized_abc.positions = np.arange(20, dtype=np.int64) * 5
+    indices = np.repeat(np.arange(20), 50)
+
+    neighbors = vectorized_abc.neighborhood(indices)
+
+    # phi * (x_i - x_k) can only be zero if phi is, the partner never is i
+    assert np.mean(neighbors != vectorized_abc.positions[indices]) > 0.9
+
+
+def test_vectorized_greedy_update(vectorized_abc, table):
+    vectorized_abc.positions[:] = 0
+    vectorized_abc.fitness_values[:] = table[0]
+    vectorized_abc.counters[:] = 3
+
+    indices = np.array([0, 0, 1, 2])
+    neighbors = np.array([40, 50, 45, 0])
+    vectorized_abc._greedy_update(indices, neighbors)
+
+    assert [50, 45, 0] == vectorized_abc.positions[:3].tolist()
+    assert [0, 0, 4] == vectorized_abc.counters[:3].tolist()
+    assert table[50] == vectorized_abc.fitness_values[0]
+
+
+def test_vectorized_generation(vectorized_abc, table):
+    for _ in range(30):
+        population = vectorized_abc()
+
+    # Food sources plus employed and onlooker bees
+    assert 60 == len(population)
+    assert 30 == vectorized_abc._generation
+    assert vectorized_abc.best_solution.fitness_val < table[0]
+    assert np.all(vectorized_abc.counters <= vectorized_abc.limit)
+
+
+@pytest.mark.parametrize('algorithm', [ABCAlgo, VectorizedABCAlgo])
+def test_abc_tracks_best_source(algorithm, table):
+    algo = algorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        init_x=0,
+        limit=5,
+        rng=np.random.default_rng(0),
+    )
+
+    for _ in range(30):
+        algo.step()
+
+    assert algo.best_solution.fitness_val < table[0]
+    assert algo.best_solution.fitness_val == algo.log.best_fitness
+    assert algo.log.last_improvement < algo._generation
+
+
+def test_landscape_abc_improves():
+    landscape = landscapes.Rastrigin(10)
+    abc = LandscapeABCAlgo(
+        20, landscape, limit=10, show_bees=True, rng=np.random.default_rng(0)
+    )
+    initial_best = abc.best_fitness
+
+    for _ in range(50):
+        individuals = abc()
+
+    assert 3 * 20 == len(individuals)
+    assert abc.best_fitness < initial_best
+    assert np.isclose(abc.best_fitness, landscape(abc.best_position))
+    assert np.all(abc.positions >= landscape.lower)
+    assert np.all(abc.positions <= landscape.upper)
+    assert abc.best_solution.fitness_val == abc.best_fitness
+    assert abc.best_solution.position.tolist() == abc.best_position.tolist()
+    # Scouts on landscapes need no taboo table
+    assert not hasattr(abc, 'taboo_table')
+    assert abc.fitness_cache is None
+
+
+def test_landscape_abc_moves_one_dimension():
+    abc = LandscapeABCAlgo(5, landscapes.Sphere(8))
+
+    neighbors = abc.neighborhood(np.arange(5))
+
+    assert np.all((neighbors != abc.positions).sum(axis=1) <= 1)
+
+
+@pytest.mark.parametrize('algorithm', [ABCAlgo, VectorizedABCAlgo])
+def test_abc_runs_side_by_side(algorithm, table):
+    algo = algorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        init_x=0,
+        limit=5,
+        rng=np.random.default_rng(0),
+    )
+    best_fitness = algo.best_solution.fitness_val
+
+    # A second run on another table must not change how the first is judged
+    algorithm(
+        10,
+        fitness_function=TableFitness(-table),
+        max_x=len(table),
+        init_x=0,
+    )
+
+    assert algo.best_solution.fitness_val == best_fitness
+    assert algo.best_solution.fitness_val == table[algo.best_x]
+
+
+@pytest.mark.parametrize('algorithm', [ABCAlgo, VectorizedABCAlgo])
+def test_snapshot_matches_individuals(algorithm, table):
+    algo = algorithm(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        init_x=0,
+        limit=1,
+        show_bees=True,
+        rng=np.random.default_rng(0),
+    )
+    population = algo()
+    x = algo.snapshot.x
+
+    algo.step()
+    evaluations = algo.fitness_function.evaluations
+    snapshot = algo.fill_snapshot()
+
+    # Bees are drawn with the fitness found while visiting
+    assert evaluations == algo.fitness_function.evaluations
+    drawn = np.clip(snapshot.x[:len(snapshot)].astype(np.int64), 0, 100)
+    assert snapshot.y[:len(snapshot)].tolist() == table[drawn].tolist()
+
+    assert len(population) == 30
+    assert snapshot is algo.snapshot
+    assert snapshot.x is x
+    assert snapshot.generation == 2
+    assert snapshot.to_individuals() == algo.fill_snapshot().to_individuals()
+    colours = {idv.colour for idv in snapshot}
+    assert BEE_COLOURS['onlooker'] in colours
+    assert colours & {BEE_COLOURS['employed'], BEE_COLOURS['scout']}
+
+
+def test_abc_bees_are_views(table):
+    algo = ABCAlgo(
+        10,
+        fitness_function=TableFitness(table),
+        max_x=len(table),
+        rng=np.random.default_rng(0),
+    )
+    algo()
+
+    bees = algo.bees
+
+    assert [int(bee._assigned_source) for bee in bees['employed']] == \
+        algo.employed_positions.tolist()
+    assert len(bees['onlooker']) == 10
+    with pytest.raises(AttributeError):
+        bees['onlooker'][0].color = (0, 0, 0)
@@ -0,0 +1,100 @@
+import csv
+
+from evo_sim import headless, sweep
+from evo_sim.algs import profiling
+
+
+def test_set_option_nested():
+    config = {'evo': {'mutation-rate': 0.2}}
+
+    sweep.set_option(config, 'evo.mutation-rate', 0.5)
+    sweep.set_option(config, 'abc.limit', 3)
+
+    assert {'evo': {'mutation-rate': 0.5}, 'abc': {'limit': 3}} == config
+
+
+def test_apply_overrides_copies():
+    config = {'evo': {'mutation-rate': 0.2}}
+
+    new_config = sweep.apply_overrides(config, {'evo.mutation-rate': 0.5})
+
+    assert 0.2 == config['evo']['mutation-rate']
+    assert 0.5 == new_config['evo']['mutation-rate']
+
+
+def test_expand_grid():
+    grid = {'a': [1, 2], 'b': ['x', 'y', 'z']}
+
+    overrides = sweep.expand_grid(grid)
+
+    assert 6 == len(overrides)
+    assert {'a': 2, 'b': 'y'} in overrides
+
+
+def test_run_sweep_is_reproducible():
+    config = headless.load_config(headless.DEFAULT_CONFIG)
+    overrides = [{'use-alg': 'evo'}, {'use-alg': 'abc'}]
+
+    def run(processes):
+        rows = sweep.run_sweep(
+            config, overrides, seeds=[0, 1], processes=processes, stop_after=5
+        )
+        return sorted(
+            (row['run'], row['best_fitness'], row['evaluations'])
+            for row in rows
+        )
+
+    serial = run(1)
+    assert 4 == len(serial)
+    assert serial == run(2)
+
+
+def test_main_writes_table(tmp_path):
+    sweep_file = tmp_path / 'sweep.yaml'
+    sweep_file.write_text(
+        "grid:\n  evo.mutation-rate: [0.1, 0.3]\nseeds: [0, 1]\n"
+    )
+    output = tmp_path / 'results.csv'
+
+    sweep.main([
+        str(sweep_file), '--output', str(output), '--processes', '2',
+        '--stop-after', '3',
+    ])
+
+    with open(output) as f:
+        rows = list(csv.DictReader(f))
+    assert 4 == len(rows)
+    assert {'0.1', '0.3'} == {row['evo.mutation-rate'] for row in rows}
+    assert {'max-generations'} == {row['stop_reason'] for row in rows}
+
+
+def test_main_aggregates_profiles(tmp_path, capsys):
+    sweep_file = tmp_path / 'sweep.yaml'
+    sweep_file.write_text("runs:\n  - use-alg: abc\nseeds: [0, 1]\n")
+    output = tmp_path / 'results.csv'
+
+    sweep.main([
+        str(sweep_file), '--output', str(output), '--processes', '1',
+        '--stop-after', '3', '--profile',
+    ])
+
+    report = capsys.readouterr().err
+    assert 'Profile of 2 runs:' in report
+    assert 'employed' in report
+    with open(output) as f:
+        assert 'profile' not in next(csv.reader(f))
+
+
+def test_collect_profiles():
+    config = headless.load_config(headless.DEFAULT_CONFIG)
+    rows = sweep.run_sweep(
+        config, [{}], seeds=[0, 1], processes=1, stop_after=2, profile=True
+    )
+    stats = []
+
+    rows = list(sweep.collect_profiles(rows, stats))
+
+    assert all('profile' not in row for row in rows)
+    total = profiling.RunStats.aggregate(stats)
+    assert 2 == total.runs
+    assert sum(row['evaluations'] for row in rows) == total.evaluations
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from evo_sim import functions, tables
+
+
+@pytest.fixture
+def table_path(tmp_path):
+    return tmp_path / 'hill.npy'
+
+
+def test_table_matches_hill(table_path):
+    table, info = tables.open_hill_table(
+        table_path,
+        1000,
+        scale=300.0,
+        pos_y=150.0,
+        seed=1,
+        rng=np.random.default_rng(1),
+        chunk_size=64,
+    )
+    hill_y = functions.hill(
+        1000, scale=300.0, pos_y=150.0, rng=np.random.default_rng(1)
+    )
+
+    assert isinstance(table, np.memmap)
+    assert np.allclose(hill_y, table)
+    assert np.argmin(hill_y) == info.argmin
+    assert np.argmax(hill_y) == info.argmax
+    assert table.min() == info.min
+
+
+def test_table_is_reused(table_path):
+    tables.open_hill_table(table_path, 100, seed=3, chunk_size=16)
+    stored = tables.table_file(table_path, 100, 3)
+    mtime = stored.stat().st_mtime_ns
+
+    _, info = tables.open_hill_table(
+        table_path, 100, seed=3, rng=np.random.default_rng(0)
+    )
+
+    assert mtime == stored.stat().st_mtime_ns
+    assert 3 == tables.read_info(stored).seed == info.seed
+
+
+@pytest.mark.parametrize('changes', [
+    {'n_points': 120},
+    {'seed': 4},
+    {'seed': None},
+])
+def test_table_is_regenerated(table_path, changes):
+    tables.open_hill_table(table_path, 100, seed=3)
+
+    options = {'n_points': 100, 'seed': 3, **changes}
+    table, info = tables.open_hill_table(table_path, **options)
+
+    assert options['n_points'] == len(table) == info.n_points
+    assert options['seed'] == info.seed
+
+
+def test_mapped_table_is_never_rewritten(table_path):
+    table, _ = tables.open_hill_table(
+        table_path, 100, seed=3, rng=np.random.default_rng(3)
+    )
+    values = table.copy()
+
+    # Other seeds and sizes get their own files
+    tables.open_hill_table(table_path, 100, seed=4)
+    tables.open_hill_table(table_path, 50, seed=3)
+    assert np.array_equal(values, table)
+
+    # Random landscapes replace their file instead of writing into it
+    random_table, _ = tables.open_hill_table(table_path, 100)
+    random_values = random_table.copy()
+    tables.open_hill_table(table_path, 100)
+    assert np.array_equal(random_values, random_table)
+
+    names = sorted(path.name for path in table_path.parent.iterdir())
+    assert not [name for name in names if name.endswith('.tmp')]
+    assert 'hill-seed3-n100.npy' in names
+    assert 'hill-seed4-n100.npy' in names
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from evo_sim.algs import ABCAlgo, TableFitness
+from evo_sim.algs.taboo import TabooIndex
+
+
+def test_sample_skips_taboo_positions():
+    taboo = TabooIndex(10)
+    for x in [0, 2, 3, 9]:
+        taboo.add(x)
+
+    samples = taboo.sample(2000)
+
+    assert {1, 4, 5, 6, 7, 8} == set(samples.tolist())
+
+
+def test_sample_last_free_position():
+    taboo = TabooIndex(5)
+    for x in range(4):
+        taboo.add(x)
+
+    assert np.all(4 == taboo.sample(10))
+
+
+def test_capacity_expires_oldest():
+    taboo = TabooIndex(100, capacity=2)
+
+    for x in [5, 1, 7]:
+        taboo.add(x)
+
+    assert 2 == len(taboo)
+    assert 5 not in taboo
+    assert [1, 7] == list(taboo)
+    assert 1 == taboo.stats.expirations
+    assert 2 == taboo.stats.peak_size
+
+
+def test_ignores_positions_outside_domain():
+    taboo = TabooIndex(10)
+
+    taboo.add(-3)
+    taboo.add(10)
+    taboo.add(4)
+    taboo.add(4)
+
+    assert [4] == list(taboo)
+    assert 1 == taboo.stats.insertions
+
+
+def test_domain_never_fills_up():
+    taboo = TabooIndex(3, capacity=10)
+
+    for x in range(3):
+        taboo.add(x)
+
+    assert 2 == len(taboo)
+    assert 1 == len(set(taboo.sample(20).tolist()))
+
+
+def test_invalid_domain():
+    with pytest.raises(ValueError):
+        TabooIndex(0)
+
+
+def test_abc_scouts_on_tiny_domain():
+    table = TableFitness(np.array([3.0, 1.0, 2.0, 4.0]))
+    algo = ABCAlgo(4, fitness_function=table, max_x=4, limit=0)
+
+    for _ in range(50):
+        algo()
+
+    assert len(algo.taboo_table) <= 3
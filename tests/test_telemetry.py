@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from evo_sim import headless
+from evo_sim.algs import telemetry
+
+
+@pytest.fixture
+def config():
+    return headless.load_config(headless.DEFAULT_CONFIG)
+
+
+def test_run_log_without_sink():
+    log = telemetry.RunLog()
+
+    log.improvement(3, 10.0)
+    log.improvement(7, 4.0)
+    log.generation(7, np.ones(4), np.arange(4), 12)
+
+    assert {
+        'improvements': 2,
+        'last_improvement': 7,
+        'best_fitness': 4.0,
+    } == log.summary()
+
+
+@pytest.mark.parametrize('suffix', ['.jsonl', '.bin'])
+def test_sink_records(tmp_path, suffix):
+    path = tmp_path / f'run{suffix}'
+    log = telemetry.RunLog(telemetry.open_sink(path))
+
+    log.generation(0, np.array([1.0, 3.0]), np.array([0.0, 4.0]), 2)
+    log.generation(1, np.array([0.5, 2.5]), np.array([[0.0], [2.0]]), 4)
+    log.close()
+
+    if suffix == '.bin':
+        records = telemetry.read_binary_log(path)
+        worst = records['worst_fitness'].tolist()
+        diversity = records['diversity'].tolist()
+    else:
+        records = telemetry.read_json_log(path)
+        worst = [record.worst_fitness for record in records]
+        diversity = [record.diversity for record in records]
+
+    assert 2 == len(records)
+    assert [3.0, 2.5] == worst
+    assert [2.0, 1.0] == diversity
+
+
+def test_binary_sink_flushes_blocks(tmp_path):
+    path = tmp_path / 'run.bin'
+    sink = telemetry.BinarySink(path, buffer_size=4)
+    record = telemetry.GenerationRecord(0, 0.0, 0.0, 0.0, 0.0, 0, 0.0)
+
+    for _ in range(5):
+        sink.write(record)
+
+    assert 4 == len(telemetry.read_binary_log(path))
+    sink.close()
+    assert 5 == len(telemetry.read_binary_log(path))
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        telemetry.open_sink(tmp_path / 'run.log', 'unknown')
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_headless_log(config, tmp_path, alg, engine):
+    config['use-alg'] = alg
+    config[alg]['engine'] = engine
+    path = tmp_path / 'run.jsonl'
+
+    result = headless.run(config, stop_after=10, log_path=path)
+    records = telemetry.read_json_log(path)
+
+    assert 10 == len(records)
+    # All engines log the generation before counting it
+    assert [*range(10)] == [record.generation for record in records]
+    assert all(
+        record.best_fitness <= record.mean_fitness <= record.worst_fitness
+        for record in records
+    )
+    assert records[-1].evaluations <= result.evaluations
+    assert result.log['improvements'] >= 0
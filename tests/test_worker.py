@@ -0,0 +1,115 @@
+import time
+
+import numpy as np
+import pytest
+
+from evo_sim import algs, landscapes, worker
+from evo_sim.algs import stopping
+
+
+def make_algo(alg: str):
+    table = np.linspace(10.0, 0.0, 64)
+    if alg == 'evo':
+        algorithm = algs.GeneticAlgorithm
+    else:
+        algorithm = algs.ABCAlgo
+    return algorithm(
+        10,
+        fitness_function=algs.TableFitness(table),
+        max_x=64,
+        init_x=0,
+        rng=np.random.default_rng(0),
+    )
+
+
+def latest_generation(sim_worker: worker.SimulationWorker) -> int:
+    with sim_worker.latest() as snapshot:
+        return snapshot.generation
+
+
+def max_generations(generations: int) -> stopping.StoppingCriteria:
+    return stopping.StoppingCriteria([stopping.MaxGenerations(generations)])
+
+
+@pytest.mark.parametrize('alg', ['evo', 'abc'])
+def test_runs_until_stopped(alg):
+    algo = make_algo(alg)
+    sim_worker = worker.SimulationWorker(
+        algo, max_generations(20), generations_per_frame=0
+    )
+
+    sim_worker.start()
+    assert sim_worker.done.wait(5)
+
+    with sim_worker.latest() as snapshot:
+        assert snapshot.generation == 20
+        assert snapshot.best_x == algo.best_x
+        assert len(snapshot) > 0
+    assert sim_worker.stop_reason == 'max-generations'
+
+
+@pytest.mark.parametrize(
+    'algorithm', [algs.LandscapeGeneticAlgorithm, algs.LandscapeABCAlgo]
+)
+def test_runs_landscape_algorithms(algorithm):
+    algo = algorithm(10, landscapes.Sphere(3), rng=np.random.default_rng(0))
+    sim_worker = worker.SimulationWorker(
+        algo, max_generations(10), generations_per_frame=0
+    )
+
+    sim_worker.start()
+    assert sim_worker.done.wait(5)
+
+    with sim_worker.latest() as snapshot:
+        assert snapshot.generation == 10
+        assert snapshot.best_x == algo.best_solution.x_loc
+
+
+def test_initial_snapshot():
+    algo = make_algo('evo')
+    sim_worker = worker.SimulationWorker(algo, max_generations(5))
+
+    assert not sim_worker.started
+    with sim_worker.latest() as snapshot:
+        assert snapshot.generation == 0
+        assert len(snapshot) == len(algo.original_population)
+
+
+def test_generations_per_frame():
+    algo = make_algo('evo')
+    sim_worker = worker.SimulationWorker(
+        algo, max_generations(100), generations_per_frame=3
+    )
+    sim_worker.start()
+
+    for frame in range(1, 4):
+        sim_worker.frame()
+        deadline = time.monotonic() + 5
+        while latest_generation(sim_worker) < 3 * frame:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        # Throttled workers wait for the next frame
+        time.sleep(0.01)
+        assert latest_generation(sim_worker) == 3 * frame
+
+    sim_worker.stop(timeout=5)
+    assert sim_worker.done.is_set()
+    assert sim_worker.stop_reason is None
+
+
+def test_stop_unthrottled():
+    algo = make_algo('evo')
+    sim_worker = worker.SimulationWorker(
+        algo, max_generations(10 ** 9), generations_per_frame=0
+    )
+    sim_worker.start()
+
+    sim_worker.stop(timeout=5)
+
+    assert sim_worker.done.is_set()
+    assert algo._generation < 10 ** 9
+
+
+def test_negative_generations_per_frame():
+    with pytest.raises(ValueError):
+        worker.SimulationWorker(make_algo('evo'), max_generations(1), -1)